@@ -8,15 +8,59 @@ Running example command.
 # pylint: disable=fixme,line-too-long
 
 import os
-from typing import Any, Dict
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
 
 import click
 import pandas as pd
-from data_access.sources import GoogleDriveClient, S3Client
+from data_access.sources import GoogleDriveClient
 from dotenv import load_dotenv
 
-from .helper import create_bronze_pipeline, create_silver_pipeline
-from .pipelines import BronzePipeline, SilverPipeline
+from .helper import (
+    add_profilers,
+    create_bronze_pipeline,
+    create_gold_pipeline,
+    create_silver_pipeline,
+    create_source_client,
+    output_path,
+    read_silver,
+    run_bronze,
+    run_silver,
+    write_report,
+)
+from .incremental import Manifest, run_silver_incremental
+from .ingestion import READ_ENGINES
+from .parquet import (
+    PARQUET_COMPRESSIONS,
+    ROW_GROUP_SIZE,
+    SILVER_COLUMNS,
+)
+from .partitioning import create_table_queries, write_silver_partitions
+from .pipelines import (
+    BronzePipeline,
+    GoldPipeline,
+    SilverPipeline,
+    StepProfiler,
+)
+from .sources import LocalFileClient
+from .uploads import (
+    create_s3_client,
+    write_gold,
+    write_outputs,
+)
+from .warehouse import (
+    DATABASE_ENGINES,
+    PART_2_QUERIES,
+    QUERIES_DIR,
+    Warehouse,
+    bundled_queries,
+)
 
 load_dotenv(".envrc")
 
@@ -29,10 +73,16 @@ def cli() -> None:
 @cli.command(name="main")
 @click.option(
     "--input-filename",
-    required=True,
+    default=None,
     type=click.STRING,
     help="Filename of input file (hosted by Google Drive)",
 )
+@click.option(
+    "--input-path",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path of a local input file, read from a memory map instead of Google Drive",
+)
 @click.option(
     "--output-filename",
     default="wells.csv",
@@ -45,7 +95,124 @@ def cli() -> None:
     type=click.BOOL,
     help="If True, save the output file to local disk",
 )
-def main(input_filename: str, output_filename: str, output_local: bool) -> None:
+@click.option(
+    "--s3-endpoint-url",
+    default=None,
+    type=click.STRING,
+    help="If given, write the remote outputs to this S3-compatible server instead of S3 (e.g. a local moto server), or to the local directory of a file:// URL",
+)
+@click.option(
+    "--output-format",
+    default="csv",
+    type=click.Choice(["csv", "parquet"]),
+    help="Format of the output files (Parquet lets queries read only the columns they need)",
+)
+@click.option(
+    "--parquet-compression",
+    default="snappy",
+    type=click.Choice(PARQUET_COMPRESSIONS),
+    help="Compression codec of Parquet output files",
+)
+@click.option(
+    "--parquet-row-group-size",
+    default=ROW_GROUP_SIZE,
+    type=click.IntRange(min=1),
+    help="Maximum number of rows per row group of Parquet output files",
+)
+@click.option(
+    "--partitioned",
+    is_flag=True,
+    type=click.BOOL,
+    help="If True, write the silver output as Parquet files partitioned by basin and spud year (requires --output-format parquet)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    type=click.BOOL,
+    help="If True, skip the input file if unchanged since the last run, otherwise only process its new or modified rows and merge them into the previous silver output",
+)
+@click.option(
+    "--manifest",
+    default="data/manifest.sqlite",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Path of the manifest of the processed sources, for incremental runs",
+)
+@click.option(
+    "--handoff",
+    is_flag=True,
+    type=click.BOOL,
+    help="If True, hand the input columns from the bronze to the silver pipeline in-process, rather than serializing each row to JSON and parsing it back (the bronze output is unchanged)",
+)
+@click.option(
+    "--gold",
+    is_flag=True,
+    type=click.BOOL,
+    help="If True, also write the gold tables: production aggregates and top oil wells, by basin, subbasin, state and spud year",
+)
+@click.option(
+    "--read-engine",
+    default="pyarrow",
+    type=click.Choice(READ_ENGINES),
+    help="CSV parser of the input file (pyarrow is multithreaded)",
+)
+@click.option(
+    "--chunksize",
+    default=None,
+    type=click.IntRange(min=1),
+    help="If given, stream the data through the pipelines in chunks of this many rows",
+)
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of processes to run the row-local pipeline steps on (small inputs always run in-process)",
+)
+@click.option(
+    "--cache-dir",
+    default=None,
+    type=click.Path(file_okay=False, writable=True),
+    help="If given, cache the results of the pipeline steps in this directory, and reuse them when the same steps run on the same data",
+)
+@click.option(
+    "--database",
+    default=None,
+    type=click.Path(dir_okay=False, writable=True),
+    help="If given, also load the silver output into this local database file, to query it with the query command",
+)
+@click.option(
+    "--profile",
+    default=None,
+    type=click.Path(dir_okay=False, writable=True),
+    help="If given, write a JSON report of the time, rows and memory of each pipeline step to this file",
+)
+@click.option(
+    "--profile-memory",
+    is_flag=True,
+    type=click.BOOL,
+    help="If True, trace memory allocations in the profile report (slower)",
+)
+def main(  # pylint: disable=too-many-arguments,too-many-locals,too-many-positional-arguments
+    input_filename: Optional[str],
+    input_path: Optional[str],
+    output_filename: str,
+    output_local: bool,
+    s3_endpoint_url: Optional[str],
+    output_format: str,
+    parquet_compression: str,
+    parquet_row_group_size: int,
+    partitioned: bool,
+    incremental: bool,
+    manifest: str,
+    handoff: bool,
+    gold: bool,
+    read_engine: str,
+    chunksize: Optional[int],
+    workers: int,
+    cache_dir: Optional[str],
+    database: Optional[str],
+    profile: Optional[str],
+    profile_memory: bool,
+) -> None:
     """Main entry-point for processing the input file.
 
     In the context of the coding assignment, this tackles the requirements relating to
@@ -53,10 +220,57 @@ def main(input_filename: str, output_filename: str, output_local: bool) -> None:
     [README](https://github.com/joshua-poirier/nlca-pipelines/tree/chore/project-skeleton).
 
     Attributes:
-        input_filename (str): The filename for the input data, hosted in Google Drive.
+        input_filename (Optional[str]): The filename for the input data, hosted in
+            Google Drive.
+        input_path (Optional[str]): The path of the input data on local disk, instead of
+            `input_filename`; the file is memory-mapped and split into `workers` byte
+            ranges parsed concurrently (or streamed from the map in chunks with
+            `chunksize`), see `LocalFileClient`.
         output_filename (str): The filename for the output data.
         output_local (bool): Whether to save the output file to local disk (True), or
-            remotely on S3 (False).
+            remotely on S3 (False); the bronze and silver outputs are uploaded
+            concurrently, in parts streamed while they are serialized (see
+            `upload_frames`).
+        s3_endpoint_url (Optional[str]): If given, the S3-compatible server the remote
+            outputs are written to instead of S3, or a `file://` URL of a local
+            directory standing in for it (see `create_s3_client`).
+        output_format (str): Format of the output files, `csv` or `parquet`; Parquet
+            files are written under the `parquet/` prefix of the buckets, with the
+            `.parquet` extension.
+        parquet_compression (str): Compression codec of Parquet output files.
+        parquet_row_group_size (int): Maximum number of rows per row group of Parquet
+            output files.
+        partitioned (bool): Whether to write the silver output as Hive partitions
+            (`partitioned/basin=<basin>/spud_year=<year>/part-<N>.parquet`), along
+            with the DDL registering them (see `write_silver_partitions`); the
+            partitions are written by `workers` threads.
+        incremental (bool): Whether to process only what changed since the last run
+            (see `Manifest`): an unchanged input file is skipped, and only the new or
+            modified rows of a changed one go through the silver pipeline, before being
+            merged into the previous silver output.
+        manifest (str): Path of the manifest of the processed sources, for
+            incremental runs.
+        handoff (bool): Whether the bronze pipeline keeps the input columns for the
+            silver pipeline (see `BronzePipeline.defer_serialize_rows`); they are only
+            serialized into `source_row` if the bronze output is written (remotely) or
+            for an incremental run.
+        gold (bool): Whether to also write the gold tables (see `GoldPipeline`), under
+            the `gold/` prefix of the gold bucket (or locally), in the output format;
+            they are computed from the whole silver output.
+        read_engine (str): CSV parser of the input file, whose columns (`WELLS_SCHEMA`)
+            are read as raw text, categorical ones as categories (see `read_options`);
+            with pyarrow, text columns are compact Arrow-backed strings.
+        chunksize (Optional[int]): If given, the pipelines are run in chunks of this
+            many rows (see `BasePipeline.run_chunked`).
+        workers (int): Number of processes to run the row-local steps of the pipelines
+            on.
+        cache_dir (Optional[str]): If given, the directory of the cache of step results
+            (see `StepCache`); its hits and misses are added to the run report.
+        database (Optional[str]): If given, the local database file the silver output
+            is also loaded into, straight from memory (see `Warehouse`).
+        profile (Optional[str]): If given, the file to write the run report of both
+            pipelines to (see `StepProfiler`).
+        profile_memory (bool): Whether the run report traces memory allocations.
 
     Examples:
         Launch the virtual environment
@@ -67,38 +281,288 @@ def main(input_filename: str, output_filename: str, output_local: bool) -> None:
 
         # Run the application, outputting remotely
         (nlca-pipeliens) $ python -m nlca_pipelines main --input-filename "novi-data-engineer-assignment.csv"
+
+        # Run the application, outputting Parquet files remotely
+        (nlca-pipelines) $ python -m nlca_pipelines main --input-filename "novi-data-engineer-assignment.csv" --output-format parquet --parquet-compression zstd
+
+        # Run the application offline, from a local input file
+        (nlca-pipelines) $ python -m nlca_pipelines main --input-path "data/wells.csv" --output-local --workers 4
+
+        # Run the application offline, uploading to a local stand-in for S3
+        (nlca-pipelines) $ python -m nlca_pipelines main --input-path "data/wells.csv" --s3-endpoint-url "file://data/s3"
+
+        # Run the application, only processing what changed since the last run
+        (nlca-pipelines) $ python -m nlca_pipelines main --input-filename "novi-data-engineer-assignment.csv" --output-local --incremental
     """
-    # stream data into dataframe
-    google_drive_client = GoogleDriveClient(
-        io_options={
-            "encoding": "utf-8",
-            "header": 0,
-            "dtype": str,
-            "keep_default_na": False,
-        }
+    _check_main_options(
+        input_filename, input_path, output_format, partitioned, incremental
     )
-    google_drive_client.get_file_id(filename=input_filename)
-    raw_df: pd.DataFrame = google_drive_client.read()
 
-    # create and run bronze pipeline
-    bronze_pipeline: BronzePipeline = create_bronze_pipeline(google_drive_client)
-    bronze_df = bronze_pipeline.run(df=raw_df)
+    # locate the input file, and create the pipelines
+    source_client: Union[GoogleDriveClient, LocalFileClient] = create_source_client(
+        input_filename, input_path, read_engine
+    )
+    s3_client: Any = None if output_local else create_s3_client(s3_endpoint_url)
+    bronze_pipeline: BronzePipeline = create_bronze_pipeline(
+        source_client, workers=workers, cache_dir=cache_dir, handoff=handoff
+    )
+    silver_pipeline: SilverPipeline = create_silver_pipeline(
+        workers=workers, cache_dir=cache_dir
+    )
 
-    # create and run silver pipeline
-    silver_pipeline: SilverPipeline = create_silver_pipeline()
-    silver_df = silver_pipeline.run(df=bronze_df)
+    # skip the input file if it's unchanged since the last run
+    source_uri: str = str(bronze_pipeline.options["source_uri"])
+    fingerprint: str = str(bronze_pipeline.options["source_updated_at"])
+    run_manifest: Optional[Manifest] = Manifest(manifest) if incremental else None
+    if run_manifest is not None and run_manifest.unchanged(source_uri, fingerprint):
+        run_manifest.close()
+        click.echo(
+            f"{source_client.source_filename} is unchanged since the last run, skipping it"
+        )
+        return
 
-    # save data to file
-    io_opts: Dict[str, Any] = {"date_format": "%Y-%m-%d", "index": False, "sep": "|"}
-    output_filename = "data/" + output_filename
-    if output_local:
-        if not os.path.exists("data"):
-            os.makedirs("data")
-        silver_df.to_csv(output_filename, **io_opts)
+    # instrument the pipelines
+    profilers: Dict[str, StepProfiler] = (
+        add_profilers(
+            {"bronze": bronze_pipeline, "silver": silver_pipeline}, profile_memory
+        )
+        if profile
+        else {}
+    )
+
+    # run the pipelines, pushing only new or modified rows through the silver
+    # pipeline when incremental
+    bronze_df: pd.DataFrame = run_bronze(
+        source_client, bronze_pipeline, chunksize=chunksize, workers=workers
+    )
+    output_filename = output_path(output_filename, output_format)
+    missing: Optional[pd.DataFrame] = None
+    if run_manifest is not None:
+        silver_df, missing = run_silver_incremental(
+            silver_pipeline,
+            bronze_df,
+            run_manifest,
+            source_uri,
+            read_silver(output_filename, output_format, output_local, s3_client),
+            chunksize=chunksize,
+        )
     else:
-        s3_client = S3Client(io_options=io_opts)
-        s3_client.write(df=bronze_df, bucket="nlca-bronze", filename=output_filename)
-        s3_client.write(df=silver_df, bucket="nlca-silver", filename=output_filename)
+        silver_df = run_silver(silver_pipeline, bronze_df, chunksize=chunksize)
+
+    # save data to file
+    parquet_options: Dict[str, Any] = {
+        "compression": parquet_compression,
+        "row_group_size": parquet_row_group_size,
+    }
+    write_outputs(
+        bronze_df,
+        silver_df,
+        output_filename,
+        output_format,
+        output_local,
+        partitioned=partitioned,
+        client=s3_client,
+        **parquet_options,
+    )
+    if partitioned:
+        write_silver_partitions(
+            silver_df,
+            output_local,
+            workers=workers,
+            client=s3_client,
+            columns=SILVER_COLUMNS,
+            **parquet_options,
+        )
+
+    # precompute and save the gold tables
+    if gold and not silver_df.empty:
+        gold_pipeline: GoldPipeline = create_gold_pipeline()
+        if profile:
+            profilers.update(add_profilers({"gold": gold_pipeline}, profile_memory))
+        gold_pipeline.run(df=silver_df)
+        write_gold(gold_pipeline.tables, output_format, output_local, s3_client)
+
+    # load the silver output into the local database
+    if database:
+        with Warehouse(database) as warehouse:
+            warehouse.load(silver_df)
+
+    # record the processed rows
+    if run_manifest is not None:
+        run_manifest.commit(source_uri, fingerprint, bronze_df, missing)
+        run_manifest.close()
+
+    # save the run report
+    if profile:
+        write_report(
+            profile,
+            profilers,
+            {"bronze": bronze_pipeline, "silver": silver_pipeline},
+        )
+
+
+def _check_main_options(
+    input_filename: Optional[str],
+    input_path: Optional[str],
+    output_format: str,
+    partitioned: bool,
+    incremental: bool,
+) -> None:
+    """Check the options of the `main` command are consistent.
+
+    Raises:
+        click.UsageError: If they aren't.
+    """
+    if (input_filename is None) == (input_path is None):
+        raise click.UsageError("Give one of --input-filename and --input-path")
+    if partitioned and output_format != "parquet":
+        raise click.UsageError("--partitioned requires --output-format parquet")
+    if partitioned and incremental:
+        raise click.UsageError("--incremental can't be used with --partitioned")
+
+
+@cli.command(name="load")
+@click.option(
+    "--input-path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path of a silver output file, written by the main command with --output-local",
+)
+@click.option(
+    "--input-format",
+    default=None,
+    type=click.Choice(["csv", "parquet"]),
+    help="Format of the silver output file (by default, Parquet if its extension is .parquet, else CSV)",
+)
+@click.option(
+    "--database",
+    default="data/silver.db",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Path of the local database file (created if it doesn't exist)",
+)
+@click.option(
+    "--engine",
+    default="auto",
+    type=click.Choice(DATABASE_ENGINES),
+    help="Database engine (auto uses DuckDB when installed, and SQLite otherwise)",
+)
+def load(
+    input_path: str, input_format: Optional[str], database: str, engine: str
+) -> None:
+    """Load a silver output file into a local database.
+
+    In the context of the coding assignment, this tackles the requirements relating to
+    **Part 2**: the data is loaded into the `silver.wells` table, indexed on `api10` and
+    `basin`, which the bundled Athena queries can then be run against (see `query`).
+
+    Attributes:
+        input_path (str): Path of the silver output file.
+        input_format (Optional[str]): Format of the file, `csv` or `parquet`.
+        database (str): Path of the local database file; its table is replaced.
+        engine (str): Database engine, `duckdb` or `sqlite` (see `Warehouse`).
+
+    Examples:
+        # Load the silver output of a local run
+        (nlca-pipelines) $ python -m nlca_pipelines load --input-path "wells.csv" --database "data/silver.db"
+    """
+    if input_format is None:
+        input_format = "parquet" if input_path.endswith(".parquet") else "csv"
+    silver_df: pd.DataFrame = read_silver(input_path, input_format, output_local=True)
+
+    start: float = time.perf_counter()
+    with Warehouse(database, engine=engine) as warehouse:
+        rows: int = warehouse.load(silver_df)
+        loaded_engine: str = warehouse.engine
+    elapsed: float = time.perf_counter() - start
+
+    click.echo(
+        f"Loaded {rows} rows into {database} ({loaded_engine}) in {elapsed * 1e3:.1f} ms"
+    )
+
+
+@cli.command(name="query")
+@click.argument("names", nargs=-1)
+@click.option(
+    "--database",
+    default="data/silver.db",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path of the local database file, loaded with the load command",
+)
+@click.option(
+    "--engine",
+    default="auto",
+    type=click.Choice(DATABASE_ENGINES),
+    help="Database engine (auto uses the engine that created the file)",
+)
+@click.option(
+    "--queries-dir",
+    default=QUERIES_DIR,
+    type=click.Path(exists=True, file_okay=False),
+    help="Directory of the SQL files of the queries",
+)
+def query(names: List[str], database: str, engine: str, queries_dir: str) -> None:
+    """Run bundled queries against a local database.
+
+    The queries are the SQL files of the Athena workgroup, bundled with the package, run
+    as they are; by default, the ones answering **Part 2** of the coding assignment.
+
+    Attributes:
+        names (List[str]): Names of the queries (their file names, without the `.sql`
+            extension); the Athena DDL (`create-*.sql`) can't be run.
+        database (str): Path of the local database file.
+        engine (str): Database engine, `duckdb` or `sqlite` (see `Warehouse`).
+        queries_dir (str): Directory of the SQL files.
+
+    Examples:
+        # Answer Part 2 of the assignment
+        (nlca-pipelines) $ python -m nlca_pipelines query --database "data/silver.db"
+
+        # Run a given query
+        (nlca-pipelines) $ python -m nlca_pipelines query sum-prod-by-basin-parquet
+    """
+    names = list(names) or PART_2_QUERIES
+    unknown: List[str] = [
+        name for name in names if name not in bundled_queries(queries_dir)
+    ]
+    if unknown:
+        raise click.UsageError(f"Unknown queries: {', '.join(unknown)}")
+
+    with Warehouse(database, engine=engine) as warehouse:
+        for name in names:
+            start: float = time.perf_counter()
+            result: pd.DataFrame = warehouse.run_query(name, queries_dir)
+            elapsed: float = time.perf_counter() - start
+            click.echo(f"{name} ({elapsed * 1e3:.1f} ms)")
+            click.echo(result.to_string(index=False))
+            click.echo()
+
+
+@cli.command(name="ddl")
+@click.option(
+    "--queries-dir",
+    default=QUERIES_DIR,
+    type=click.Path(file_okay=False, writable=True),
+    help="Directory of the SQL files of the Athena workgroup",
+)
+def ddl(queries_dir: str) -> None:
+    """Write the Athena DDL of the tables over the Parquet outputs.
+
+    The `create-table-*.sql` queries of the Athena workgroup are generated from the
+    declared types of the silver columns (see `create_table_queries`), so they match
+    the Parquet files written by the main command.
+
+    Attributes:
+        queries_dir (str): Directory of the SQL files.
+
+    Examples:
+        # Regenerate the DDL of the Athena workgroup
+        (nlca-pipelines) $ python -m nlca_pipelines ddl
+    """
+    for name, statement in create_table_queries().items():
+        path: str = os.path.join(queries_dir, f"{name}.sql")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(statement)
+        click.echo(f"Wrote {path}")
 
 
 if __name__ == "__main__":
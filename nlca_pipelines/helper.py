@@ -1,21 +1,253 @@
+import io
+import json
+import os
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    Optional,
+    Union,
+)
+
+import pandas as pd
 from data_access.sources import GoogleDriveClient
 
-from .pipelines import BronzePipeline, SilverPipeline
+from .ingestion import (
+    WELLS_SCHEMA,
+    columns_of,
+    read_options,
+    required_columns,
+)
+from .pipelines import (
+    BronzePipeline,
+    GoldPipeline,
+    SilverPipeline,
+    StepProfiler,
+    iter_chunks,
+)
+from .sources import LocalFileClient
+from .uploads import create_s3_client
+
+
+def create_source_client(
+    input_filename: Optional[str],
+    input_path: Optional[str],
+    read_engine: str = "pyarrow",
+) -> Union[GoogleDriveClient, LocalFileClient]:
+    """Helper function to locate the input file.
+
+    Args:
+        input_filename (Optional[str]): Filename of the input file on
+            Google Drive (used if `input_path` is None).
+        input_path (Optional[str]): Path of a local input file.
+        read_engine (str): CSV parser of the input file (see
+            `read_options`).
+
+    Returns:
+        Union[GoogleDriveClient, LocalFileClient]: Client reading the
+            columns of the input file (`WELLS_SCHEMA`), with their read
+            dtypes.
+    """
+    io_options: Dict[str, Any] = read_options(engine=read_engine, schema=WELLS_SCHEMA)
+    if input_path is not None:
+        return LocalFileClient(input_path, io_options=io_options)
+
+    source_client = GoogleDriveClient(io_options=io_options)
+    source_client.get_file_id(filename=input_filename)
+
+    return source_client
+
+
+def add_profilers(
+    pipelines: Dict[str, Union[BronzePipeline, SilverPipeline, GoldPipeline]],
+    trace_memory: bool = False,
+) -> Dict[str, StepProfiler]:
+    """Helper function to instrument pipelines with step profilers.
+
+    Args:
+        pipelines (Dict[str, Union[BronzePipeline, SilverPipeline, GoldPipeline]]):
+            Pipelines, by tier.
+        trace_memory (bool): Whether the profilers trace memory
+            allocations.
+
+    Returns:
+        Dict[str, StepProfiler]: Profiler hooked to each pipeline, by
+            tier.
+    """
+    profilers: Dict[str, StepProfiler] = {}
+    for tier, pipeline in pipelines.items():
+        profilers[tier] = StepProfiler(trace_memory=trace_memory)
+        pipeline.add_hook(profilers[tier])
+
+    return profilers
+
+
+def run_bronze(
+    source_client: Union[GoogleDriveClient, LocalFileClient],
+    pipeline: BronzePipeline,
+    chunksize: Optional[int] = None,
+    workers: int = 1,
+) -> pd.DataFrame:
+    """Helper function to read the input file and run the bronze pipeline.
+
+    Args:
+        source_client (Union[GoogleDriveClient, LocalFileClient]):
+            Client reading the input file; a local file is split into
+            `workers` byte ranges (or streamed in chunks).
+        pipeline (BronzePipeline): The bronze pipeline.
+        chunksize (Optional[int]): If given, the pipeline is run in
+            chunks of this many rows.
+        workers (int): Number of byte ranges of a local file parsed
+            concurrently.
+
+    Returns:
+        pd.DataFrame: The bronze data.
+    """
+    if chunksize:
+        raw_chunks: Iterator[pd.DataFrame] = (
+            source_client.iter_read(chunksize)
+            if isinstance(source_client, LocalFileClient)
+            else iter_chunks(source_client.read(), chunksize)
+        )
+        return pd.concat(pipeline.run_chunked(raw_chunks))
+
+    raw_df: pd.DataFrame = (
+        source_client.read(parts=workers, workers=workers)
+        if isinstance(source_client, LocalFileClient)
+        else source_client.read()
+    )
+
+    return pipeline.run(df=raw_df)
+
+
+def run_silver(
+    pipeline: SilverPipeline, df: pd.DataFrame, chunksize: Optional[int] = None
+) -> pd.DataFrame:
+    """Helper function to run the silver pipeline.
+
+    Args:
+        pipeline (SilverPipeline): The silver pipeline.
+        df (pd.DataFrame): Bronze data.
+        chunksize (Optional[int]): If given, the pipeline is run in
+            chunks of this many rows.
+
+    Returns:
+        pd.DataFrame: The silver data.
+    """
+    if chunksize:
+        return pd.concat(pipeline.run_chunked(iter_chunks(df, chunksize)))
+
+    return pipeline.run(df=df)
 
 
-def create_bronze_pipeline(google_drive_client: GoogleDriveClient) -> BronzePipeline:
+def output_path(filename: str, output_format: str) -> str:
+    """Helper function to get the path of an output file.
+
+    Args:
+        filename (str): Filename of the output file (e.g. `wells.csv`).
+        output_format (str): Format of the output file, `csv` or
+            `parquet`.
+
+    Returns:
+        str: Path of the file, locally and in the buckets: under `data/`
+            for CSV, and under `parquet/` (with the `.parquet`
+            extension) for Parquet.
+    """
+    if output_format == "parquet":
+        return "parquet/" + os.path.splitext(filename)[0] + ".parquet"
+
+    return "data/" + filename
+
+
+def write_report(
+    path: str,
+    profilers: Dict[str, StepProfiler],
+    pipelines: Dict[str, Union[BronzePipeline, SilverPipeline]],
+) -> None:
+    """Helper function to write the run report of the pipelines.
+
+    Args:
+        path (str): Path of the JSON report.
+        profilers (Dict[str, StepProfiler]): Profiler of each pipeline,
+            by tier.
+        pipelines (Dict[str, Union[BronzePipeline, SilverPipeline]]):
+            Pipelines whose cache statistics are added to the report of
+            their tier (if they have a cache).
+    """
+    report: Dict[str, Dict[str, Any]] = {
+        tier: p.report() for tier, p in profilers.items()
+    }
+    for tier, pipeline in pipelines.items():
+        if pipeline.cache is not None:
+            report[tier]["cache"] = pipeline.cache.stats()
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def read_silver(
+    filename: str, output_format: str, output_local: bool, client: Any = None
+) -> pd.DataFrame:
+    """Helper function to read back the silver output of a previous run.
+
+    Args:
+        filename (str): Path of the output file (key in the silver
+            bucket, if remote).
+        output_format (str): Format of the output file, `csv` or
+            `parquet`.
+        output_local (bool): Whether the file is on local disk (True), or
+            remotely on S3 (False).
+        client (Any): S3 client of the remote outputs (a new one if
+            None, see `create_s3_client`).
+
+    Returns:
+        pd.DataFrame: The silver data (all columns are strings when read
+            from CSV); empty if there is no such file.
+    """
+    source: Any = filename
+    if output_local:
+        if not os.path.exists(filename):
+            return pd.DataFrame()
+    else:
+        s3: Any = client or create_s3_client()
+        try:
+            response: Any = s3.get_object(Bucket="nlca-silver", Key=filename)
+        except s3.exceptions.NoSuchKey:
+            return pd.DataFrame()
+        source = io.BytesIO(response["Body"].read())
+
+    if output_format == "parquet":
+        return pd.read_parquet(source)
+
+    return pd.read_csv(source, sep="|", dtype=str, keep_default_na=False)
+
+
+def create_bronze_pipeline(
+    source_client: Union[GoogleDriveClient, LocalFileClient],
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
+    handoff: bool = False,
+) -> BronzePipeline:
     """Helper function to create bronze pipeline.
 
     Args:
-        google_drive_client (GoogleDriveClient): Client to interact with
-            data files hosted on Google Drive.
+        source_client (Union[GoogleDriveClient, LocalFileClient]):
+            Client to interact with the input file, hosted on Google
+            Drive or on local disk.
+        workers (int): Number of processes to run the steps on.
+        cache_dir (Optional[str]): Directory of the cache of step
+            results (no cache if None).
+        handoff (bool): Whether to keep the input columns for the
+            silver pipeline, deferring their serialization into
+            `source_row` until the bronze output is written (see
+            `BronzePipeline.defer_serialize_rows`).
 
     Returns:
         BronzePipeline: A configured bronze pipeline object.
     """
     return BronzePipeline(
         steps=[
-            "serialize_rows",
+            "defer_serialize_rows" if handoff else "serialize_rows",
             "add_source_name",
             "add_source_uri",
             "add_row_number",
@@ -24,17 +256,31 @@ def create_bronze_pipeline(google_drive_client: GoogleDriveClient) -> BronzePipe
         ],
         options={
             "skiprows": 1,
-            "source_created_at": google_drive_client.source_created_at,
-            "source_name": google_drive_client.source_filename,
-            "source_uri": google_drive_client.source_uri,
-            "source_updated_at": google_drive_client.source_updated_at,
+            "source_created_at": source_client.source_created_at,
+            "source_name": source_client.source_filename,
+            "source_uri": source_client.source_uri,
+            "source_updated_at": source_client.source_updated_at,
+            "workers": workers,
+            "cache_dir": cache_dir or "",
         },
     )
 
 
-def create_silver_pipeline() -> SilverPipeline:
+def create_silver_pipeline(
+    workers: int = 1, cache_dir: Optional[str] = None
+) -> SilverPipeline:
     """Helper function to create silver pipeline.
 
+    The columns each step applies to are derived from the schema of the
+    input file (`WELLS_SCHEMA`), by logical type. Source columns outside
+    the schema are never decoded.
+
+    Args:
+        workers (int): Number of processes to run the row-local steps
+            on.
+        cache_dir (Optional[str]): Directory of the cache of step
+            results (no cache if None).
+
     Returns:
         SilverPipeline: A configured silver pipeline object.
     """
@@ -48,33 +294,38 @@ def create_silver_pipeline() -> SilverPipeline:
             "sort",
         ],
         options={
-            "cols_to_filter_missing": ["api10"],
-            "cols_to_elim_invalid_values": [
-                "direction",
-                "welltype",
-                "basin",
-                "subbasin",
-                "state",
-                "county",
-                "spuddate",
-                "cum12moil",
-                "cum12mgas",
-                "cum12mwater",
-            ],
-            "cols_to_impute_with_mean": [
-                "spuddate",
-                "cum12moil",
-                "cum12mgas",
-                "cum12mwater",
-            ],
-            "cols_to_impute_with_mode": [
-                "direction",
-                "welltype",
-                "basin",
-                "subbasin",
-                "state",
-                "county",
-            ],
+            "cols_to_filter_missing": required_columns(WELLS_SCHEMA),
+            "cols_to_elim_invalid_values": columns_of(
+                WELLS_SCHEMA, "categorical", "date", "number"
+            ),
+            "cols_to_memoize": columns_of(WELLS_SCHEMA, "categorical", "date"),
+            "cols_to_impute_with_mean": columns_of(WELLS_SCHEMA, "date", "number"),
+            "cols_to_impute_with_mode": columns_of(WELLS_SCHEMA, "categorical"),
             "cols_to_sort_by": ["api10"],
+            "cols_to_keep": list(WELLS_SCHEMA),
+            "workers": workers,
+            "cache_dir": cache_dir or "",
+        },
+    )
+
+
+def create_gold_pipeline() -> GoldPipeline:
+    """Helper function to create gold pipeline.
+
+    Production is aggregated, and the top oil wells ranked, by basin,
+    subbasin, state and spud year (and overall), as in the Part 2
+    queries.
+
+    Returns:
+        GoldPipeline: A configured gold pipeline object.
+    """
+    return GoldPipeline(
+        steps=["add_spud_year", "aggregate_production", "rank_wells"],
+        options={
+            "cols_to_group_by": ["basin", "subbasin", "state", "spud_year"],
+            "cols_to_sum": columns_of(WELLS_SCHEMA, "number"),
+            "col_to_rank_by": "cum12moil",
+            "rank_filter": {"welltype": "OIL"},
+            "top_n": 5,
         },
     )
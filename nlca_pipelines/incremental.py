@@ -0,0 +1,479 @@
+"""Incremental processing of the sources.
+
+A `Manifest` records, for each source, the fingerprint it was last
+processed with (its `source_updated_at`) and a hash of the content of
+each of its rows, along with the row's id. Unchanged sources can then be
+skipped, and only the new or modified rows of a changed source pushed
+through the row-local steps of the silver pipeline, before being merged
+(see `merge_silver`) into the previous silver output; the steps needing
+all of the rows (e.g. imputation) then run on the merged data. The
+manifest also records which values of the imputed columns were missing,
+so the previous output can be imputed again (see
+`run_silver_incremental`).
+"""
+
+import copy
+import hashlib
+import os
+import sqlite3
+from datetime import datetime, timezone
+from types import TracebackType
+from typing import (
+    Any,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+from typing_extensions import TypedDict
+
+from .pipelines import (
+    SilverPipeline,
+    iter_chunks,
+    source_rows,
+)
+from .pipelines._scope import ROW_LOCAL, get_scope
+from .validation.schema import apply_schema
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS sources (
+    source_uri TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    processed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    source_uri TEXT NOT NULL,
+    row_hash TEXT NOT NULL,
+    occurrence INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    PRIMARY KEY (source_uri, row_hash, occurrence)
+);
+CREATE TABLE IF NOT EXISTS missing (
+    source_uri TEXT NOT NULL,
+    id TEXT NOT NULL,
+    column_name TEXT NOT NULL,
+    PRIMARY KEY (source_uri, id, column_name)
+);
+"""
+
+# options listing the columns whose missing values are imputed
+_IMPUTE_OPTIONS: List[str] = ["cols_to_impute_with_mean", "cols_to_impute_with_mode"]
+
+
+class RowDiffDict(TypedDict):
+    """Differences between the rows of a source and the manifest.
+
+    Attributes:
+        ids (pd.Series): Id of each row: the recorded id of unchanged
+            rows, and the current id of new rows.
+        new (pd.Series): Whether each row is new (or modified).
+        removed_ids (List[str]): Ids of the recorded rows no longer in
+            the source (including the previous version of modified
+            rows).
+    """
+
+    ids: pd.Series
+    new: pd.Series
+    removed_ids: List[str]
+
+
+def row_hashes(rows: pd.Series) -> np.ndarray:
+    """Hash the content of rows.
+
+    Args:
+        rows (pd.Series): Serialized rows (the `source_row` column of
+            the bronze tier).
+
+    Returns:
+        np.ndarray: Hex digest of each row.
+    """
+    return np.array(
+        [hashlib.blake2b(row.encode(), digest_size=16).hexdigest() for row in rows],
+        dtype=object,
+    )
+
+
+def _keys(df: pd.DataFrame) -> pd.DataFrame:
+    """Content key of each row (its hash, and occurrence of the hash)."""
+    hashes = pd.Series(row_hashes(source_rows(df)), index=df.index)
+
+    return pd.DataFrame(
+        {"row_hash": hashes, "occurrence": hashes.groupby(hashes).cumcount()}
+    )
+
+
+class Manifest:
+    """Persistent record of the processed sources, in a SQLite database.
+
+    Args:
+        path (str): Path of the database (created, along with its
+            directory, if it doesn't exist).
+
+    Examples:
+        >>> with Manifest("data/manifest.sqlite") as manifest:
+        ...     if not manifest.unchanged(uri, updated_at):
+        ...         diff = manifest.diff(uri, bronze_df)
+        ...         ...
+        ...         manifest.commit(uri, updated_at, bronze_df)
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.connection: sqlite3.Connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "Manifest":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def fingerprint(self, source_uri: str) -> Optional[str]:
+        """Fingerprint a source was last processed with.
+
+        Args:
+            source_uri (str): URI of the source.
+
+        Returns:
+            Optional[str]: The fingerprint (None if the source was never
+                processed).
+        """
+        row: Any = self.connection.execute(
+            "SELECT fingerprint FROM sources WHERE source_uri = ?", (source_uri,)
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def unchanged(self, source_uri: str, fingerprint: str) -> bool:
+        """Whether a source was last processed with the same fingerprint.
+
+        Args:
+            source_uri (str): URI of the source.
+            fingerprint (str): Current fingerprint of the source (e.g.
+                its `source_updated_at`).
+
+        Returns:
+            bool: True if the source can be skipped.
+        """
+        return self.fingerprint(source_uri) == fingerprint
+
+    def diff(self, source_uri: str, df: pd.DataFrame) -> RowDiffDict:
+        """Compare the rows of a source with the recorded ones.
+
+        Args:
+            source_uri (str): URI of the source.
+            df (pd.DataFrame): Bronze data of the source (with the
+                `source_row`, or deferred input columns, and `id`
+                columns).
+
+        Returns:
+            RowDiffDict: The new rows, and the ids of the removed rows.
+        """
+        recorded: pd.DataFrame = pd.DataFrame(
+            self.connection.execute(
+                "SELECT row_hash, occurrence, id FROM rows WHERE source_uri = ?",
+                (source_uri,),
+            ).fetchall(),
+            columns=["row_hash", "occurrence", "recorded_id"],
+        ).astype({"occurrence": "int64"})
+        keys: pd.DataFrame = _keys(df)
+
+        matched: pd.DataFrame = keys.merge(
+            recorded, on=["row_hash", "occurrence"], how="left"
+        ).set_index(df.index)
+        new: pd.Series = matched["recorded_id"].isna()
+        removed: pd.DataFrame = recorded.merge(
+            keys, on=["row_hash", "occurrence"], how="left", indicator=True
+        )
+
+        return {
+            "ids": df["id"].where(new, matched["recorded_id"]),
+            "new": new,
+            "removed_ids": removed.loc[
+                removed["_merge"] == "left_only", "recorded_id"
+            ].tolist(),
+        }
+
+    def missing(self, source_uri: str) -> pd.DataFrame:
+        """Values of the imputed columns that were missing, before imputation.
+
+        Args:
+            source_uri (str): URI of the source.
+
+        Returns:
+            pd.DataFrame: The `id` of the row and the `column` of each
+                missing value (see `missing_values`).
+        """
+        return pd.DataFrame(
+            self.connection.execute(
+                "SELECT id, column_name FROM missing WHERE source_uri = ?",
+                (source_uri,),
+            ).fetchall(),
+            columns=["id", "column"],
+            dtype=object,
+        )
+
+    def commit(
+        self,
+        source_uri: str,
+        fingerprint: str,
+        df: pd.DataFrame,
+        missing: Optional[pd.DataFrame] = None,
+    ) -> None:
+        """Record the rows of a source, replacing the previous ones.
+
+        Args:
+            source_uri (str): URI of the source.
+            fingerprint (str): Current fingerprint of the source.
+            df (pd.DataFrame): Bronze data of the source (with the
+                `source_row`, or deferred input columns, and `id`
+                columns).
+            missing (Optional[pd.DataFrame]): Missing values of the
+                imputed columns of the rows (see `missing_values`); none
+                if None.
+        """
+        keys: pd.DataFrame = _keys(df)
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM rows WHERE source_uri = ?", (source_uri,)
+            )
+            self.connection.execute(
+                "DELETE FROM missing WHERE source_uri = ?", (source_uri,)
+            )
+            if missing is not None:
+                self.connection.executemany(
+                    "INSERT INTO missing VALUES (?, ?, ?)",
+                    zip(
+                        [source_uri] * len(missing),
+                        missing["id"].astype(str),
+                        missing["column"],
+                    ),
+                )
+            self.connection.executemany(
+                "INSERT INTO rows VALUES (?, ?, ?, ?)",
+                zip(
+                    [source_uri] * len(df),
+                    keys["row_hash"],
+                    keys["occurrence"].tolist(),
+                    df["id"].astype(str),
+                ),
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?)",
+                (
+                    source_uri,
+                    fingerprint,
+                    len(df),
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+
+
+def split_steps(pipeline: SilverPipeline) -> Tuple[List[str], List[str]]:
+    """Split the steps of a pipeline into those run on the new rows only.
+
+    Args:
+        pipeline (SilverPipeline): The silver pipeline.
+
+    Returns:
+        Tuple[List[str], List[str]]: The leading row-local steps, which
+            can run on the new rows alone, and the remaining steps, which
+            must run on all of the rows (after an aggregate step, even
+            row-local steps depend on every row).
+    """
+    for i, step in enumerate(pipeline.pipeline_steps):
+        if get_scope(step) != ROW_LOCAL:
+            return pipeline.steps[:i], pipeline.steps[i:]
+
+    return list(pipeline.steps), []
+
+
+def with_steps(pipeline: SilverPipeline, steps: List[str]) -> SilverPipeline:
+    """The same pipeline (options, hooks and cache), running other steps.
+
+    Args:
+        pipeline (SilverPipeline): The silver pipeline.
+        steps (List[str]): Names of the steps to run.
+
+    Returns:
+        SilverPipeline: A shallow copy of the pipeline.
+    """
+    subset: SilverPipeline = copy.copy(pipeline)
+    subset.steps = steps
+
+    return subset
+
+
+def missing_values(df: pd.DataFrame, pipeline: SilverPipeline) -> pd.DataFrame:
+    """Missing values of the columns imputed by a pipeline.
+
+    Args:
+        df (pd.DataFrame): Silver data, before imputation (with an `id`
+            column).
+        pipeline (SilverPipeline): The silver pipeline.
+
+    Returns:
+        pd.DataFrame: The `id` of the row and the `column` of each
+            missing value.
+    """
+    columns: List[str] = [
+        col
+        for opt in _IMPUTE_OPTIONS
+        for col in pipeline.options.get(opt, [])
+        if col in df.columns
+    ]
+    rows, cols = np.nonzero(df[columns].isna().to_numpy())
+
+    return pd.DataFrame(
+        {
+            "id": df["id"].to_numpy(dtype=object)[rows],
+            "column": np.array(columns, dtype=object)[cols],
+        },
+        dtype=object,
+    )
+
+
+def _align(previous: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Convert the categories, dates and numbers of the previous output."""
+    if new.columns.empty:
+        # nothing to convert to: use the silver dtypes
+        return apply_schema(previous)
+
+    previous = previous.copy()
+    for col in new.columns.intersection(previous.columns):
+        dtype: Any = new[col].dtype
+        if previous[col].dtype == dtype:
+            continue
+        if isinstance(dtype, pd.CategoricalDtype):
+            # values outside the categories (e.g. empty strings) are missing
+            previous[col] = previous[col].astype(dtype)
+        elif is_datetime64_any_dtype(dtype):
+            previous[col] = pd.to_datetime(previous[col], errors="coerce").astype(dtype)
+        elif is_numeric_dtype(dtype):
+            previous[col] = pd.to_numeric(previous[col], errors="coerce").astype(dtype)
+
+    return previous
+
+
+def merge_silver(
+    previous: pd.DataFrame,
+    new: pd.DataFrame,
+    removed_ids: List[str],
+    pipeline: SilverPipeline,
+    missing: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Merge new silver rows into the previous silver output.
+
+    The columns of the previous output (e.g. read back from a CSV file)
+    are converted to the types of the new output first, and the values
+    that were imputed are made missing again. The steps of the pipeline
+    that need all of the rows (see `split_steps`) then run on the merged
+    data, so e.g. the imputed values are the same as if every row had
+    gone through the pipeline.
+
+    Args:
+        previous (pd.DataFrame): Previous silver output (empty on the
+            first run).
+        new (pd.DataFrame): Silver output of the new (or modified) rows,
+            through the leading row-local steps only.
+        removed_ids (List[str]): Ids of the rows to remove from the
+            previous output (see `Manifest.diff`).
+        pipeline (SilverPipeline): The silver pipeline.
+        missing (Optional[pd.DataFrame]): Values of the previous output
+            that were imputed (see `Manifest.missing`); none if None.
+
+    Returns:
+        pd.DataFrame: The merged silver data.
+    """
+    previous = _align(previous, new)
+    if missing is not None and "id" in previous.columns:
+        for col, cells in missing.groupby("column"):
+            if col in previous.columns:
+                previous[col] = previous[col].mask(previous["id"].isin(cells["id"]))
+    kept: pd.DataFrame = (
+        previous[~previous["id"].isin(removed_ids)]
+        if "id" in previous.columns
+        else previous
+    )
+    merged: pd.DataFrame = pd.concat(
+        [df for df in (kept, new) if not df.empty] or [kept], ignore_index=True
+    )
+
+    steps: List[str] = split_steps(pipeline)[1]
+    if steps and not merged.empty:
+        merged = with_steps(pipeline, steps).run(df=merged)
+
+    return merged
+
+
+def run_silver_incremental(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    pipeline: SilverPipeline,
+    bronze_df: pd.DataFrame,
+    manifest: Manifest,
+    source_uri: str,
+    previous: pd.DataFrame,
+    chunksize: Optional[int] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Run the silver pipeline on what changed only.
+
+    Only the new or modified rows (see `Manifest.diff`) go through the
+    leading row-local steps of the silver pipeline (see `split_steps`),
+    before being merged into the previous silver output, on which the
+    other steps then run (see `merge_silver`). Unchanged rows keep their
+    recorded id in the bronze data.
+
+    Args:
+        pipeline (SilverPipeline): The silver pipeline.
+        bronze_df (pd.DataFrame): Bronze data of the whole source (its
+            `id` column is updated in place).
+        manifest (Manifest): Manifest of the processed sources.
+        source_uri (str): URI of the source.
+        previous (pd.DataFrame): Previous silver output (empty on the
+            first run).
+        chunksize (Optional[int]): If given, the pipeline is run in
+            chunks of this many rows.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The merged silver data, and
+            the missing values of its imputed columns, to be recorded in
+            the manifest (see `Manifest.commit`).
+    """
+    diff: RowDiffDict = manifest.diff(source_uri, bronze_df)
+    bronze_df["id"] = diff["ids"]
+    new_df: pd.DataFrame = bronze_df[diff["new"]].copy()
+
+    head: SilverPipeline = with_steps(pipeline, split_steps(pipeline)[0])
+    silver_df: pd.DataFrame = pd.DataFrame()
+    if chunksize and not new_df.empty:
+        silver_df = pd.concat(head.run_chunked(iter_chunks(new_df, chunksize)))
+    elif not new_df.empty:
+        silver_df = head.run(df=new_df)
+    recorded: pd.DataFrame = manifest.missing(source_uri)
+    missing: pd.DataFrame = pd.concat(
+        [
+            recorded[~recorded["id"].isin(diff["removed_ids"])],
+            missing_values(silver_df, pipeline) if not silver_df.empty else None,
+        ],
+        ignore_index=True,
+    )
+
+    return (
+        merge_silver(previous, silver_df, diff["removed_ids"], pipeline, recorded),
+        missing,
+    )
@@ -0,0 +1,154 @@
+"""Schema and reading of the input well file.
+
+The input file is described by a declarative schema: the logical type
+of each column (`string`, `categorical`, `date` or `number`, as in the
+assignment), whether it may be missing, and the registered domain of
+its values (see `CATEGORICAL_DOMAINS`). The schema drives the silver
+pipeline configuration.
+
+The bronze tier keeps the raw text of every row (its `source_row` audit
+trail), so the file is read losslessly, with empty cells kept as empty
+strings. Given a schema, only its columns are parsed, with dtypes
+derived from their logical types (see `read_dtypes`): categorical
+columns are read as categories of their raw text, the others as text.
+By default, the file is parsed by the multithreaded CSV reader of
+pyarrow into compact Arrow-backed strings. The values are then
+validated and typed by the silver pipeline (see
+`SilverPipeline.eliminate_invalid_values`).
+"""
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from typing_extensions import TypedDict
+
+# logical types of the columns of an input file
+LOGICAL_TYPES: List[str] = ["string", "categorical", "date", "number"]
+
+# supported values for the reader `engine`
+READ_ENGINES: List[str] = ["pyarrow", "c"]
+
+
+class ColumnSchemaDict(TypedDict, total=False):
+    """Declaration of a column of an input file.
+
+    Attributes:
+        type (str): Logical type (one of `LOGICAL_TYPES`).
+        nullable (bool): Whether the value may be missing (True by
+            default); rows missing a non-nullable value are filtered
+            out by the silver pipeline.
+        domain (str): Name of the registered domain of a categorical
+            column.
+    """
+
+    type: str
+    nullable: bool
+    domain: str
+
+
+# schema of the input well file, in column order
+WELLS_SCHEMA: Dict[str, ColumnSchemaDict] = {
+    "api10": {"type": "string", "nullable": False},
+    "direction": {"type": "categorical", "domain": "direction"},
+    "wellname": {"type": "string"},
+    "welltype": {"type": "categorical", "domain": "welltype"},
+    "operator": {"type": "string"},
+    "basin": {"type": "categorical", "domain": "basin"},
+    "subbasin": {"type": "categorical", "domain": "subbasin"},
+    "state": {"type": "categorical", "domain": "state"},
+    "county": {"type": "categorical", "domain": "county"},
+    "spuddate": {"type": "date"},
+    "cum12moil": {"type": "number"},
+    "cum12mgas": {"type": "number"},
+    "cum12mwater": {"type": "number"},
+}
+
+
+def columns_of(schema: Dict[str, ColumnSchemaDict], *types: str) -> List[str]:
+    """Columns of a schema having the given logical types.
+
+    Args:
+        schema (Dict[str, ColumnSchemaDict]): Schema of an input file.
+        *types (str): Logical types.
+
+    Returns:
+        List[str]: The columns, in schema order.
+    """
+    return [col for col, column in schema.items() if column["type"] in types]
+
+
+def required_columns(schema: Dict[str, ColumnSchemaDict]) -> List[str]:
+    """Columns of a schema that may not be missing.
+
+    Args:
+        schema (Dict[str, ColumnSchemaDict]): Schema of an input file.
+
+    Returns:
+        List[str]: The non-nullable columns, in schema order.
+    """
+    return [col for col, column in schema.items() if not column.get("nullable", True)]
+
+
+def read_dtypes(
+    schema: Dict[str, ColumnSchemaDict], engine: str = "pyarrow"
+) -> Dict[str, Any]:
+    """Dtypes of the columns of an input file, as read.
+
+    The values are kept as their raw text: categorical columns are read
+    as categories (the few distinct values of each column are stored
+    once), and the others as text, since invalid dates and numbers are
+    only eliminated by the silver pipeline.
+
+    Args:
+        schema (Dict[str, ColumnSchemaDict]): Schema of the file.
+        engine (str): CSV parser (one of `READ_ENGINES`).
+
+    Returns:
+        Dict[str, Any]: Dtype of each column of the schema.
+    """
+    text: Any = "string[pyarrow]" if engine == "pyarrow" else str
+
+    return {
+        col: "category" if column["type"] == "categorical" else text
+        for col, column in schema.items()
+    }
+
+
+def read_options(
+    engine: str = "pyarrow", schema: Optional[Dict[str, ColumnSchemaDict]] = None
+) -> Dict[str, Any]:
+    """Options of `pd.read_csv` reading an input file as raw text.
+
+    Args:
+        engine (str): CSV parser (one of `READ_ENGINES`).
+        schema (Optional[Dict[str, ColumnSchemaDict]]): If given, the
+            schema of the file: only its columns are read (`usecols`),
+            with their dtypes (see `read_dtypes`); otherwise, every
+            column is read as text.
+
+    Returns:
+        Dict[str, Any]: Keyword arguments of `pd.read_csv` (also the
+            `io_options` of the data access clients).
+
+    Raises:
+        ValueError: If the engine is not recognized.
+    """
+    if engine not in READ_ENGINES:
+        raise ValueError(f"Unknown read engine '{engine}'.")
+
+    options: Dict[str, Any] = {
+        "encoding": "utf-8",
+        "header": 0,
+        "dtype": "string[pyarrow]" if engine == "pyarrow" else str,
+        "keep_default_na": False,
+        "engine": engine,
+    }
+    if schema is not None:
+        options["usecols"] = list(schema)
+        options["dtype"] = read_dtypes(schema, engine)
+
+    return options
@@ -0,0 +1,176 @@
+"""Parquet output for the bronze and silver tiers.
+
+Parquet files are written with `pyarrow`. The columns are written with
+the types declared in the matching Athena tables, so the files can be
+queried without any conversion; the DDL of these tables (the
+`create-table-*.sql` queries of the Athena workgroup) is generated from
+the same declarations (see `athena_ddl`).
+"""
+
+from typing import (
+    IO,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+import pandas as pd
+import pyarrow as pa  # type: ignore
+import pyarrow.parquet as pq  # type: ignore
+
+# Athena types of the bronze columns
+BRONZE_COLUMNS: Dict[str, str] = {
+    "source_row": "string",
+    "source_name": "string",
+    "source_uri": "string",
+    "source_row_number": "bigint",
+    "source_created_at": "string",
+    "source_updated_at": "string",
+    "id": "string",
+}
+
+# Athena types of the silver columns
+SILVER_COLUMNS: Dict[str, str] = {
+    "id": "string",
+    "api10": "string",
+    "direction": "string",
+    "wellname": "string",
+    "welltype": "string",
+    "operator": "string",
+    "basin": "string",
+    "subbasin": "string",
+    "state": "string",
+    "county": "string",
+    "spuddate": "date",
+    "cum12moil": "double",
+    "cum12mgas": "double",
+    "cum12mwater": "double",
+}
+
+# supported Parquet compression codecs
+PARQUET_COMPRESSIONS: List[str] = ["snappy", "zstd", "gzip", "none"]
+
+# default number of rows per row group
+ROW_GROUP_SIZE: int = 1_000_000
+
+
+def to_athena_types(df: pd.DataFrame, columns: Dict[str, str]) -> pd.DataFrame:
+    """Convert columns to the pandas types matching their Athena types.
+
+    Dates lose any time of day, and missing or unparsable values become
+    nulls (as Athena does when reading text files). Columns without a
+    declared type are left as they are.
+
+    Args:
+        df (pd.DataFrame): Data to convert.
+        columns (Dict[str, str]): Athena type of each column (`string`,
+            `date`, `double` or `bigint`).
+
+    Returns:
+        pd.DataFrame: Converted copy of the data.
+
+    Raises:
+        ValueError: If an Athena type is not supported.
+    """
+    df = df.copy()
+    for col, athena_type in columns.items():
+        if col not in df.columns:
+            continue
+
+        if athena_type == "string":
+            df[col] = df[col].astype("string")
+        elif athena_type == "date":
+            df[col] = pd.to_datetime(df[col], errors="coerce").dt.date
+        elif athena_type == "double":
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+        elif athena_type == "bigint":
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+        else:
+            raise ValueError(f"Unsupported Athena type '{athena_type}'.")
+
+    return df
+
+
+def write_parquet(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    df: pd.DataFrame,
+    where: Union[str, IO[bytes]],
+    columns: Optional[Dict[str, str]] = None,
+    compression: str = "snappy",
+    row_group_size: int = ROW_GROUP_SIZE,
+    statistics: bool = True,
+) -> None:
+    """Write data to a Parquet file.
+
+    Args:
+        df (pd.DataFrame): Data to write.
+        where (Union[str, IO[bytes]]): Destination path or binary file.
+        columns (Optional[Dict[str, str]]): Athena type of each column
+            (e.g. `SILVER_COLUMNS`), if they should be converted.
+        compression (str): One of `PARQUET_COMPRESSIONS`.
+        row_group_size (int): Maximum number of rows per row group.
+        statistics (bool): Whether to write column statistics (min, max
+            and null count per row group), which let readers skip row
+            groups.
+
+    Raises:
+        ValueError: If the compression is not supported.
+    """
+    if compression not in PARQUET_COMPRESSIONS:
+        raise ValueError(f"Unknown Parquet compression '{compression}'.")
+
+    if columns:
+        df = to_athena_types(df, columns)
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(
+        table,
+        where,
+        compression=None if compression == "none" else compression,
+        row_group_size=row_group_size,
+        write_statistics=statistics,
+    )
+
+
+def athena_ddl(
+    table: str,
+    columns: Dict[str, str],
+    location: str,
+    comment: str,
+    partitions: Optional[Dict[str, str]] = None,
+) -> str:
+    """Athena DDL of an external table over Parquet files.
+
+    Args:
+        table (str): Qualified table name (e.g. `silver.wells_parquet`).
+        columns (Dict[str, str]): Athena type of each column.
+        location (str): S3 prefix of the Parquet files.
+        comment (str): Table comment.
+        partitions (Optional[Dict[str, str]]): Athena type of each
+            partition column (see `partitioning.PARTITION_COLUMNS`), if
+            the table is partitioned; they must not be in `columns`.
+
+    Returns:
+        str: The `CREATE EXTERNAL TABLE` statement.
+    """
+    name: str = ".".join(f"`{part}`" for part in table.split("."))
+    cols: str = _columns_ddl(columns)
+    partitioned_by: str = (
+        f"PARTITIONED BY (\n{_columns_ddl(partitions)}\n)\n" if partitions else ""
+    )
+
+    return (
+        f"CREATE EXTERNAL TABLE IF NOT EXISTS {name} (\n{cols}\n)\n"
+        f'COMMENT "{comment}"\n'
+        f"{partitioned_by}"
+        "STORED AS PARQUET\n"
+        f"LOCATION '{location}'\n"
+        "TBLPROPERTIES (\n"
+        "    'classification' = 'parquet'\n"
+        ");\n"
+    )
+
+
+def _columns_ddl(columns: Dict[str, str]) -> str:
+    """Column definitions of a table, one per line."""
+    return ",\n".join(f"    `{col}` {kind}" for col, kind in columns.items())
@@ -0,0 +1,414 @@
+"""Hive-partitioned output of the silver tier.
+
+Rows are laid out as `basin=<basin>/spud_year=<year>/part-<N>.<ext>`, so
+queries filtered or grouped by basin (or spud year) only read the
+matching files. Partition values are escaped as Hive does, and missing
+values go to the `__HIVE_DEFAULT_PARTITION__` partition.
+
+The silver output is written as partitions of the
+`silver.wells_partitioned` table (see `write_silver_partitions`), on
+local disk or S3, along with the DDL registering them.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
+
+import pandas as pd
+from typing_extensions import TypedDict
+
+from .parquet import (
+    SILVER_COLUMNS,
+    athena_ddl,
+    write_parquet,
+)
+from .uploads import create_s3_client, upload_parquet
+
+# partition columns, outermost first, and their Athena types
+PARTITION_COLUMNS: Dict[str, str] = {"basin": "string", "spud_year": "int"}
+
+# default maximum number of rows per file of a partition
+ROWS_PER_FILE: int = 1_000_000
+
+# partition of the rows with a missing partition value
+DEFAULT_PARTITION: str = "__HIVE_DEFAULT_PARTITION__"
+
+# characters escaped in partition values (as by Hive's `FileUtils`)
+_ESCAPED: str = '"#%\'*/:=?\\\x7f{[]^'
+
+
+class PartitionDict(TypedDict):
+    """Metadata of a partition written to storage.
+
+    Attributes:
+        files (List[str]): Paths of the partition's files, relative to
+            the root of the table.
+        path (str): Path of the partition, relative to the root of the
+            table.
+        rows (int): Number of rows in the partition.
+        values (Dict[str, str]): Value of each partition column (as in
+            the partition's path, before escaping).
+    """
+
+    files: List[str]
+    path: str
+    rows: int
+    values: Dict[str, str]
+
+
+def escape(value: Any) -> str:
+    """Partition value as it appears in a path.
+
+    Args:
+        value (Any): Partition value.
+
+    Returns:
+        str: The escaped value, or `DEFAULT_PARTITION` if it's missing.
+    """
+    if pd.isna(value) or value == "":
+        return DEFAULT_PARTITION
+
+    return "".join(
+        f"%{ord(c):02X}" if c in _ESCAPED or ord(c) < 0x20 else c for c in str(value)
+    )
+
+
+def add_spud_year(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the `spud_year` partition column, from the spud date.
+
+    Args:
+        df (pd.DataFrame): Silver data.
+
+    Returns:
+        pd.DataFrame: A copy of the data, with a new `spud_year` column
+            (missing if the spud date is missing or invalid).
+    """
+    spuddate = pd.to_datetime(df["spuddate"], errors="coerce")
+
+    return df.assign(spud_year=spuddate.dt.year.astype("Int64"))
+
+
+def partition(
+    df: pd.DataFrame, by: List[str], rows_per_file: int = ROWS_PER_FILE
+) -> Iterator[Tuple[Dict[str, str], List[pd.DataFrame]]]:
+    """Split data into partitions.
+
+    Args:
+        df (pd.DataFrame): Data to split, with the partition columns.
+        by (List[str]): Partition columns, outermost first.
+        rows_per_file (int): Maximum number of rows per file.
+
+    Yields:
+        Tuple[Dict[str, str], List[pd.DataFrame]]: The value of each
+            partition column (`DEFAULT_PARTITION` if missing), and the
+            files of the partition, without the partition columns; in
+            the order of the partition values.
+    """
+    for keys, group in df.groupby(by, sort=True, dropna=False, observed=True):
+        values: Dict[str, str] = {
+            col: DEFAULT_PARTITION if pd.isna(key) or key == "" else str(key)
+            for col, key in zip(by, keys)
+        }
+        group = group.drop(columns=by)
+
+        yield values, [
+            group.iloc[start : start + rows_per_file]
+            for start in range(0, len(group), rows_per_file)
+        ]
+
+
+def write_partitions(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    df: pd.DataFrame,
+    write: Callable[[str, pd.DataFrame], None],
+    extension: str,
+    by: List[str],
+    rows_per_file: int = ROWS_PER_FILE,
+    workers: int = 1,
+) -> List[PartitionDict]:
+    """Write data as Hive partitions.
+
+    Args:
+        df (pd.DataFrame): Data to write, with the partition columns.
+        write (Callable[[str, pd.DataFrame], None]): Function writing a
+            file to a path relative to the root of the table (locally or
+            on S3, it must be thread-safe when `workers` > 1).
+        extension (str): Extension of the files (e.g. `parquet`).
+        by (List[str]): Partition columns, outermost first.
+        rows_per_file (int): Maximum number of rows per file.
+        workers (int): Number of files written at once.
+
+    Returns:
+        List[PartitionDict]: Metadata of the partitions written.
+    """
+    partitions: List[PartitionDict] = []
+    files: List[Tuple[str, pd.DataFrame]] = []
+    for values, parts in partition(df, by=by, rows_per_file=rows_per_file):
+        path: str = "/".join(f"{col}={escape(value)}" for col, value in values.items())
+        paths: List[str] = [
+            f"{path}/part-{n:05d}.{extension}" for n in range(len(parts))
+        ]
+        files.extend(zip(paths, parts))
+        partitions.append(
+            {
+                "files": paths,
+                "path": path,
+                "rows": sum(len(part) for part in parts),
+                "values": values,
+            }
+        )
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # consume the results, so errors are raised
+            list(executor.map(lambda file: write(*file), files))
+    else:
+        for file in files:
+            write(*file)
+
+    return partitions
+
+
+def stale_files(partitions: List[PartitionDict], files: Iterable[str]) -> List[str]:
+    """Files of a table left over from a previous write.
+
+    Files whose name starts with `_` or `.` (e.g. `_partitions.sql`)
+    are hidden from Hive, and are never stale.
+
+    Args:
+        partitions (List[PartitionDict]): Partitions just written.
+        files (Iterable[str]): Paths of the files under the root of the
+            table, relative to it (as listed after the write).
+
+    Returns:
+        List[str]: The paths, in order, of the files that are not part
+            of the partitions.
+    """
+    written = {path for p in partitions for path in p["files"]}
+
+    return sorted(
+        path
+        for path in files
+        if path not in written and not path.split("/")[-1].startswith(("_", "."))
+    )
+
+
+def _literal(value: str, kind: str = "string") -> str:
+    """SQL literal of a value of a column of the given Athena type."""
+    if kind == "string":
+        return "'" + value.replace("'", "''") + "'"
+
+    return value
+
+
+def add_partitions_ddl(
+    table: str, partitions: List[PartitionDict], location: str
+) -> str:
+    """Athena DDL registering partitions of a table.
+
+    The values of the partition columns are written as literals of
+    their Athena type (see `PARTITION_COLUMNS`). Athena reads the
+    `DEFAULT_PARTITION` of a string column as null, but it isn't a
+    literal of the other types: partitions missing such a value (e.g.
+    the spud year) are left out, to be registered by `MSCK REPAIR
+    TABLE`.
+
+    Args:
+        table (str): Qualified table name (e.g. `silver.wells_partitioned`).
+        partitions (List[PartitionDict]): Partitions to register.
+        location (str): S3 prefix of the table (ending with `/`).
+
+    Returns:
+        str: An `ALTER TABLE ... ADD PARTITION` statement, or an empty
+            string if there are no partitions to register.
+    """
+    registered: List[PartitionDict] = [
+        p
+        for p in partitions
+        if all(
+            value != DEFAULT_PARTITION
+            or PARTITION_COLUMNS.get(col, "string") == "string"
+            for col, value in p["values"].items()
+        )
+    ]
+    if not registered:
+        return ""
+
+    name: str = ".".join(f"`{part}`" for part in table.split("."))
+    specs: List[str] = []
+    for p in registered:
+        values: str = ", ".join(
+            f"`{col}` = {_literal(value, PARTITION_COLUMNS.get(col, 'string'))}"
+            for col, value in p["values"].items()
+        )
+        path: str = _literal(f"{location}{p['path']}/")
+        specs.append(f"    PARTITION ({values}) LOCATION {path}")
+
+    return f"ALTER TABLE {name} ADD IF NOT EXISTS\n" + "\n".join(specs) + ";\n"
+
+
+def create_table_queries() -> Dict[str, str]:
+    """Athena DDL of the tables over the Parquet silver outputs.
+
+    The `create-table-*.sql` queries of the Athena workgroup are written
+    from it (see the `ddl` command), so the tables always have the
+    declared types of the silver columns.
+
+    Returns:
+        Dict[str, str]: The `CREATE EXTERNAL TABLE` statement of each
+            table, by query name.
+    """
+    return {
+        "create-table-parquet": athena_ddl(
+            "silver.wells_parquet",
+            SILVER_COLUMNS,
+            "s3://nlca-silver/parquet/",
+            "silver wells",
+        ),
+        "create-table-partitioned": athena_ddl(
+            "silver.wells_partitioned",
+            {
+                col: kind
+                for col, kind in SILVER_COLUMNS.items()
+                if col not in PARTITION_COLUMNS
+            },
+            "s3://nlca-silver/partitioned/",
+            "silver wells, partitioned by basin and spud year",
+            partitions=PARTITION_COLUMNS,
+        ),
+    }
+
+
+def write_silver_partitions(
+    df: pd.DataFrame,
+    output_local: bool,
+    workers: int = 1,
+    client: Any = None,
+    **kwargs: Any,
+) -> List[PartitionDict]:
+    """Write silver data as Hive partitions.
+
+    Partitions are written as Parquet files under the `partitioned/`
+    prefix (of the silver bucket, or of the working directory), along
+    with a `_partitions.sql` file registering them in the
+    `silver.wells_partitioned` table. Files of a previous write that
+    weren't overwritten are then removed (see `remove_stale_partitions`).
+
+    Args:
+        df (pd.DataFrame): Silver data.
+        output_local (bool): Whether to write to local disk (True), or
+            remotely on S3 (False).
+        workers (int): Number of files written at once.
+        client (Any): S3 client of the remote outputs (a new one if
+            None, see `create_s3_client`).
+        **kwargs (Any): Options of `write_parquet` (e.g. `compression`).
+
+    Returns:
+        List[PartitionDict]: Metadata of the partitions written.
+    """
+    prefix: str = "partitioned/"
+    if not output_local:
+        client = client or create_s3_client()
+
+    def write(path: str, part: pd.DataFrame) -> None:
+        if output_local:
+            os.makedirs(os.path.dirname(prefix + path), exist_ok=True)
+            write_parquet(part, prefix + path, **kwargs)
+        else:
+            upload_parquet(part, "nlca-silver", prefix + path, client=client, **kwargs)
+
+    partitions: List[PartitionDict] = write_partitions(
+        add_spud_year(df),
+        write,
+        extension="parquet",
+        by=list(PARTITION_COLUMNS),
+        workers=workers,
+    )
+
+    ddl: str = add_partitions_ddl(
+        "silver.wells_partitioned", partitions, "s3://nlca-silver/" + prefix
+    )
+    if output_local:
+        os.makedirs(prefix, exist_ok=True)
+        with open(prefix + "_partitions.sql", "w", encoding="utf-8") as f:
+            f.write(ddl)
+    else:
+        client.put_object(
+            Bucket="nlca-silver", Key=prefix + "_partitions.sql", Body=ddl.encode()
+        )
+    remove_stale_partitions(partitions, prefix, output_local, client=client)
+
+    return partitions
+
+
+def remove_stale_partitions(
+    partitions: List[PartitionDict],
+    prefix: str,
+    output_local: bool,
+    client: Any = None,
+) -> List[str]:
+    """Remove the files of a previous partitioned write.
+
+    Partitions (or files of a partition) that are no longer written,
+    e.g. when the data has fewer rows than before, would otherwise still
+    be read along with the new ones.
+
+    Args:
+        partitions (List[PartitionDict]): Partitions just written.
+        prefix (str): Root of the table (ending with `/`), in the silver
+            bucket or the working directory.
+        output_local (bool): Whether the table is on local disk (True),
+            or remotely on S3 (False).
+        client (Any): S3 client of the remote outputs (a new one if
+            None, see `create_s3_client`).
+
+    Returns:
+        List[str]: Paths of the files removed, relative to the root.
+    """
+    files: List[str] = []
+    if output_local:
+        for path, _, names in os.walk(prefix):
+            root: str = os.path.relpath(path, prefix).replace(os.sep, "/")
+            files.extend(name if root == "." else f"{root}/{name}" for name in names)
+    else:
+        client = client or create_s3_client()
+        token: Dict[str, str] = {}
+        while True:
+            response: Dict[str, Any] = client.list_objects_v2(
+                Bucket="nlca-silver", Prefix=prefix, **token
+            )
+            files.extend(
+                obj["Key"][len(prefix) :] for obj in response.get("Contents", [])
+            )
+            if not response.get("IsTruncated"):
+                break
+            token = {"ContinuationToken": response["NextContinuationToken"]}
+
+    stale: List[str] = stale_files(partitions, files)
+    if output_local:
+        for path in stale:
+            os.remove(prefix + path)
+        # remove the directories of the partitions no longer written
+        for path, _, _ in sorted(os.walk(prefix), reverse=True):
+            if not os.listdir(path):
+                os.rmdir(path)
+    else:
+        # at most 1000 objects are deleted per request
+        for start in range(0, len(stale), 1000):
+            client.delete_objects(
+                Bucket="nlca-silver",
+                Delete={
+                    "Objects": [
+                        {"Key": prefix + path} for path in stale[start : start + 1000]
+                    ]
+                },
+            )
+
+    return stale
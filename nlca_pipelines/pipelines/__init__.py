@@ -1,10 +1,33 @@
-from .bronze import BronzePipeline
-from .options import BronzePipelineOptionsDict, SilverPipelineOptionsDict
+from ._base import iter_chunks
+from .accumulators import MeanAccumulator, ModeAccumulator
+from .bronze import (
+    BronzePipeline,
+    materialize_source_row,
+    source_rows,
+)
+from .caching import StepCache
+from .gold import GoldPipeline
+from .options import (
+    BronzePipelineOptionsDict,
+    GoldPipelineOptionsDict,
+    SilverPipelineOptionsDict,
+)
+from .profiling import StepHook, StepProfiler
 from .silver import SilverPipeline
 
 __all__ = [
     "BronzePipeline",
     "BronzePipelineOptionsDict",
+    "GoldPipeline",
+    "GoldPipelineOptionsDict",
+    "MeanAccumulator",
+    "ModeAccumulator",
     "SilverPipeline",
     "SilverPipelineOptionsDict",
+    "StepCache",
+    "StepHook",
+    "StepProfiler",
+    "iter_chunks",
+    "materialize_source_row",
+    "source_rows",
 ]
@@ -1,14 +1,49 @@
+import os
 from abc import ABC
+from tempfile import TemporaryDirectory
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    Tuple,
 )
 
 import pandas as pd
 
+from ._fusion import add_columns, fuse_steps
+from ._parallel import (
+    MIN_ROWS_PER_WORKER,
+    map_partitions,
+    split,
+)
+from ._scope import (
+    AGGREGATE,
+    ROW_LOCAL,
+    get_scope,
+)
+from .accumulators import merge_accumulators
+from .caching import DEFAULT_CACHE_SIZE, StepCache
+from .profiling import StepHook
+
+
+def iter_chunks(df: pd.DataFrame, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Split a dataframe into chunks, to be run in (see `run_chunked`).
+
+    Args:
+        df (pd.DataFrame): Data to be split.
+        chunksize (int): Maximum number of rows per chunk.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of `df` (copies, so pipeline
+            steps can modify them); an empty `df` yields one empty chunk.
+    """
+    for start in range(0, max(len(df), 1), chunksize):
+        yield df.iloc[start : start + chunksize].copy()
+
 
 class BasePipeline(ABC):
     """This is the base pipeline object from which all pipelines derive.
@@ -20,13 +55,43 @@ class BasePipeline(ABC):
     Args:
         steps (Optional[List[str]]): The list of steps to be executed
             during the pipeline.
-        options: Variables required by individual pipeline methods.
+        options: Variables required by individual pipeline methods. The
+            `spill_dir` option sets where chunks are spilled to disk
+            when running in chunks (the system default if unset). The
+            `workers` option sets the number of processes row-local
+            steps are run on (1, i.e. in-process, if unset), and the
+            `min_rows_per_worker` option the minimum number of rows
+            worth sending to a process. Setting the `fuse_steps` option
+            to False executes every step on its own (see
+            `execution_plan`). The `cache_dir` option enables a cache of
+            the results of each stage of `run` in that directory, of at
+            most `cache_size` bytes (see `StepCache`), unless the
+            pipeline isn't `cacheable`.
     """
 
+    # whether the stages of `run` can be cached: not if the steps have
+    # side effects, such as results stored on the pipeline
+    cacheable: bool = True
+
     def __init__(self, steps: Optional[List[str]] = None, options=None) -> None:
         self.steps: List[str] = steps or []
         self.options: Dict[str, Any] = options or {}
 
+        # position of the first row of the current input within the
+        # whole input stream (non-zero only when running in chunks)
+        self.offset: int = 0
+
+        # called around every step (see `add_hook`)
+        self.hooks: List[StepHook] = []
+
+        # results of the stages of `run`, if enabled
+        self.cache: Optional[StepCache] = None
+        if self.cacheable and self.options.get("cache_dir"):
+            self.cache = StepCache(
+                self.options["cache_dir"],
+                max_bytes=self.options.get("cache_size", DEFAULT_CACHE_SIZE),
+            )
+
         if not steps:
             raise ValueError("At least one step must be provided.")
 
@@ -40,6 +105,97 @@ class BasePipeline(ABC):
         """
         return [getattr(self, step) for step in self.steps]
 
+    def add_hook(self, hook: StepHook) -> None:
+        """Register a hook to be called around every step.
+
+        Each step is wrapped by the `before_step` and `after_step`
+        methods of the hooks (e.g. a `StepProfiler`), in the order they
+        were added; without hooks, steps are called directly.
+
+        Args:
+            hook (StepHook): The hook.
+        """
+        self.hooks.append(hook)
+
+    def _call(self, step: Callable, df: pd.DataFrame, **kwargs) -> Any:
+        """Apply a step (or a part of one) to some data, with the hooks.
+
+        Args:
+            step (Callable): The step.
+            df (pd.DataFrame): Input data.
+            **kwargs: Any further arguments of `step`.
+
+        Returns:
+            Any: Output of `step`.
+        """
+        if not self.hooks:
+            return step(df=df, **kwargs)
+
+        for hook in self.hooks:
+            hook.before_step(step.__name__, df)
+        out: Any = step(df=df, **kwargs)
+        # steps returning statistics (`fit_*`) are reported without rows out
+        data: pd.DataFrame = out if isinstance(out, pd.DataFrame) else df.iloc[:0]
+        for hook in self.hooks:
+            hook.after_step(step.__name__, data)
+
+        return out
+
+    def _call_parallel(
+        self, steps: List[Callable], futures: Iterator[Tuple[pd.DataFrame, Any]]
+    ) -> Iterator[pd.DataFrame]:
+        """Collect partitions transformed by worker processes, with the hooks.
+
+        The hooks see the whole sequence of steps as a single step, named
+        after the steps joined with `+`.
+
+        Args:
+            steps (List[Callable]): Row-local steps.
+            futures (Iterator[Tuple[pd.DataFrame, Any]]): Each partition,
+                and the future of the transformed partition (see
+                `map_partitions`).
+
+        Yields:
+            pd.DataFrame: The transformed partitions.
+        """
+        name: str = "+".join(step.__name__ for step in steps)
+        for df, future in futures:
+            for hook in self.hooks:
+                hook.before_step(name, df)
+            out: pd.DataFrame = future.result()
+            for hook in self.hooks:
+                hook.after_step(name, out)
+
+            yield out
+
+    @property
+    def workers(self) -> int:
+        """Number of processes row-local steps are run on."""
+        return int(self.options.get("workers") or 1)
+
+    def _hooked(
+        self, name: str, chunks: Iterator[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """Call the hooks around the production of each chunk of a stream.
+
+        Args:
+            name (str): Name of the step producing the stream.
+            chunks (Iterator[pd.DataFrame]): Output of the step.
+
+        Yields:
+            pd.DataFrame: The same chunks.
+        """
+        while True:
+            for hook in self.hooks:
+                hook.before_step(name, None)
+            chunk: Optional[pd.DataFrame] = next(chunks, None)
+            for hook in self.hooks:
+                hook.after_step(name, chunk)
+            if chunk is None:
+                return
+
+            yield chunk
+
     def run(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply the transformations to the input data sequentially.
 
@@ -47,14 +203,372 @@ class BasePipeline(ABC):
         `self.pipeline_steps` property to the input data, `df`, in order
         to transform the data.
 
+        With the `workers` option, the input of each sequence of
+        row-local steps is split into contiguous partitions (of at least
+        `min_rows_per_worker` rows), which are transformed in worker
+        processes and reassembled in order. Smaller inputs are
+        transformed in-process. Steps run in a worker process cannot
+        update the attributes of the pipeline itself.
+
+        With the `cache_dir` option, the output of each stage is loaded
+        from the cache when the same steps were already applied to the
+        same data (with the same options), in which case the steps (and
+        the hooks) aren't called.
+
         Args:
             df (pd.DataFrame): Input data to apply the pipeline to.
 
         Returns:
             pd.DataFrame: Output data, transformed by the pipeline.
         """
+        self.offset = 0
+
         # apply each step of the pipeline to the input data
-        for step in self.pipeline_steps:
-            df = step(df=df)
+        for kind, steps in self.pipeline_stages:
+            if self.cache is None:
+                df = self._run_stage(kind, steps, df=df)
+                continue
+
+            key: str = self.cache.key(self, steps, df)
+            cached: Optional[pd.DataFrame] = self.cache.get(
+                key, name="+".join(step.__name__ for step in steps)
+            )
+            if cached is None:
+                df = self._run_stage(kind, steps, df=df)
+                self.cache.put(key, df)
+            else:
+                df = cached
+
+        return df
+
+    def _run_stage(
+        self, kind: str, steps: List[Callable], df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Apply a stage of the pipeline (see `pipeline_stages`).
+
+        Args:
+            kind (str): Scope of the steps.
+            steps (List[Callable]): Steps of the stage.
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            pd.DataFrame: Output data, transformed by the steps.
+        """
+        min_rows: int = self.options.get("min_rows_per_worker", MIN_ROWS_PER_WORKER)
+        parts: int = min(self.workers, len(df) // max(min_rows, 1))
+        if kind == ROW_LOCAL and parts > 1:
+            # split the rows between worker processes
+            futures = map_partitions(
+                self, [step.__name__ for step in steps], split(df, parts), parts
+            )
+            return pd.concat(self._call_parallel(steps, futures))
+
+        if kind == ROW_LOCAL:
+            return self.run_stage([step.__name__ for step in steps], df=df)
+
+        for step in steps:
+            df = self._call(step, df=df)
+
+        return df
+
+    def run_stage(self, steps: List[str], df: pd.DataFrame) -> pd.DataFrame:
+        """Apply a sequence of row-local steps, fused as planned.
+
+        Args:
+            steps (List[str]): Names of the row-local steps.
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            pd.DataFrame: Output data, transformed by the steps.
+        """
+        for kind, group in self._fuse([getattr(self, step) for step in steps]):
+            if kind is None or len(group) == 1:
+                df = self._call(group[0], df=df)
+            else:
+                df = self._call(self._fused(group), df=df)
 
         return df
+
+    def _fuse(
+        self, steps: List[Callable]
+    ) -> List[Tuple[Optional[str], List[Callable]]]:
+        """Group row-local steps that can be executed as a single pass.
+
+        Args:
+            steps (List[Callable]): Row-local steps.
+
+        Returns:
+            List[Tuple[Optional[str], List[Callable]]]: Ordered `(fusion,
+                steps)` pairs (see `fuse_steps`).
+        """
+        if not self.options.get("fuse_steps", True):
+            return [(None, [step]) for step in steps]
+
+        return fuse_steps(steps)
+
+    def _fused(self, steps: List[Callable]) -> Callable:
+        """Build a single step out of column steps (see `fuse`).
+
+        Args:
+            steps (List[Callable]): Steps to fuse.
+
+        Returns:
+            Callable: The fused step, named after the steps joined with
+                `+`.
+        """
+
+        def fused(df: pd.DataFrame) -> pd.DataFrame:
+            """Apply the fused steps in a single pass.
+
+            Args:
+                df (pd.DataFrame): Input data.
+
+            Returns:
+                pd.DataFrame: Output data.
+            """
+            for step in steps:
+                self._check_requirements(step, df)
+
+            for step in steps:
+                add_columns(df, getattr(self, f"columns_{step.__name__}")(df=df))
+
+            return df
+
+        fused.__name__ = "+".join(step.__name__ for step in steps)
+
+        return fused
+
+    def _check_requirements(self, step: Callable, df: pd.DataFrame) -> None:
+        """Check the requirements of a step, as the `validate` decorator does.
+
+        Args:
+            step (Callable): A step.
+            df (pd.DataFrame): Input data of the step.
+
+        Raises:
+            ValueError: If the input data is missing any of the required
+                columns, or the pipeline any of the required options.
+        """
+        required_cols: List[str] = getattr(step, "required_cols", [])
+        if not all(col in df.columns for col in required_cols):
+            missing: List[str] = list(set(required_cols) - set(df.columns))
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+        required_opts: List[str] = getattr(step, "required_opts", [])
+        if not all(opt in self.options for opt in required_opts):
+            raise ValueError(f"Missing required options: {', '.join(required_opts)}")
+
+    @property
+    def execution_plan(
+        self,
+    ) -> List[Tuple[str, List[Tuple[Optional[str], List[Callable]]]]]:
+        """How the pipeline steps are executed.
+
+        The steps are grouped into stages (see `pipeline_stages`), and
+        within row-local stages, consecutive steps declared fusable with
+        `fuse` are executed as a single pass: steps adding columns add
+        all of their columns at once, in place.
+
+        Returns:
+            List[Tuple[str, List[Tuple[Optional[str], List[Callable]]]]]:
+                Ordered `(scope, groups)` pairs, where groups are ordered
+                `(fusion, steps)` pairs.
+        """
+        return [
+            (kind, self._fuse(steps) if kind == ROW_LOCAL else [(None, steps)])
+            for kind, steps in self.pipeline_stages
+        ]
+
+    def explain(self) -> str:
+        """Describe the execution plan.
+
+        Returns:
+            str: One line per stage, followed by one indented line per
+                (fused) group of steps.
+
+        Examples:
+            >>> print(pipeline.explain())
+            stage 1 (row_local):
+              serialize_rows
+              columns(add_source_name, add_source_uri, add_row_number)
+        """
+        lines: List[str] = []
+        for i, (kind, groups) in enumerate(self.execution_plan, start=1):
+            workers: str = (
+                f", {self.workers} workers"
+                if kind == ROW_LOCAL and self.workers > 1
+                else ""
+            )
+            lines.append(f"stage {i} ({kind}{workers}):")
+            for fusion, steps in groups:
+                names: str = ", ".join(step.__name__ for step in steps)
+                lines.append(f"  {fusion}({names})" if len(steps) > 1 else f"  {names}")
+
+        return "\n".join(lines)
+
+    @property
+    def pipeline_stages(self) -> List[Tuple[str, List[Callable]]]:
+        """The pipeline steps, grouped by how they can be executed.
+
+        Consecutive row-local steps are grouped into a single stage,
+        while every global step forms a stage of its own.
+
+        Returns:
+            List[Tuple[str, List[Callable]]]: Ordered `(scope, steps)`
+                pairs.
+        """
+        stages: List[Tuple[str, List[Callable]]] = []
+        for step in self.pipeline_steps:
+            kind: str = get_scope(step)
+            if kind == ROW_LOCAL and stages and stages[-1][0] == ROW_LOCAL:
+                stages[-1][1].append(step)
+            else:
+                stages.append((kind, [step]))
+
+        return stages
+
+    def run_chunked(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Apply the transformations to a stream of input chunks.
+
+        Each chunk (e.g. from `pd.read_csv(chunksize=...)`) is pushed
+        through consecutive row-local steps on its own, so only one
+        chunk needs to be in memory at a time (with the `workers`
+        option, a few chunks at a time are transformed in worker
+        processes, keeping their order). An aggregate step makes
+        two passes: every chunk is fed to its accumulators and spilled
+        to disk, then the spilled chunks are transformed one at a time.
+        A global step is a barrier: the chunks reaching it are
+        concatenated, the step is applied to all of the data, and the
+        result is split back into chunks (as large as the largest input
+        chunk) for the remaining steps, unless the pipeline provides an
+        out-of-core implementation of the step named `step` as a
+        `stream_step(chunks)` method (e.g. an external sort), which is
+        used instead.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Input data, in chunks.
+
+        Yields:
+            pd.DataFrame: Output data, transformed by the pipeline, in
+                chunks.
+        """
+        stream: Iterable[pd.DataFrame] = chunks
+        for kind, steps in self.pipeline_stages:
+            if kind == ROW_LOCAL:
+                stream = self._stream(steps, stream)
+            elif kind == AGGREGATE:
+                stream = self._two_pass(steps[0], stream)
+            elif hasattr(self, f"stream_{steps[0].__name__}"):
+                name: str = steps[0].__name__
+                stream = getattr(self, f"stream_{name}")(chunks=stream)
+                if self.hooks:
+                    stream = self._hooked(name, iter(stream))
+            else:
+                stream = self._barrier(steps[0], stream)
+
+        yield from stream
+
+    def _stream(
+        self, steps: List[Callable], chunks: Iterable[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """Push each chunk through a sequence of row-local steps.
+
+        Args:
+            steps (List[Callable]): Row-local steps.
+            chunks (Iterable[pd.DataFrame]): Input data, in chunks.
+
+        Yields:
+            pd.DataFrame: Transformed chunks.
+        """
+        if self.workers > 1:
+            # transform several chunks at once in worker processes
+            yield from self._call_parallel(
+                steps,
+                map_partitions(
+                    self,
+                    [step.__name__ for step in steps],
+                    self._offsets(chunks),
+                    self.workers,
+                ),
+            )
+            return
+
+        for offset, chunk in self._offsets(chunks):
+            self.offset = offset
+
+            yield self.run_stage([step.__name__ for step in steps], df=chunk)
+
+    @staticmethod
+    def _offsets(chunks: Iterable[pd.DataFrame]) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """Pair each chunk with the position of its first row in the stream.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Input data, in chunks.
+
+        Yields:
+            Tuple[int, pd.DataFrame]: Offset and chunk.
+        """
+        offset: int = 0
+        for chunk in chunks:
+            rows: int = len(chunk)
+            yield offset, chunk
+            offset += rows
+
+    def _two_pass(
+        self, step: Callable, chunks: Iterable[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """Apply an aggregate step in two passes over the chunks.
+
+        Args:
+            step (Callable): Aggregate step.
+            chunks (Iterable[pd.DataFrame]): Input data, in chunks.
+
+        Yields:
+            pd.DataFrame: Transformed chunks.
+        """
+        fit: Callable = getattr(self, f"fit_{step.__name__}")
+        apply: Callable = getattr(self, f"apply_{step.__name__}")
+
+        with TemporaryDirectory(dir=self.options.get("spill_dir")) as spill_dir:
+            # first pass: accumulate statistics, spilling chunks to disk
+            accumulators: Dict[str, Any] = {}
+            paths: List[str] = []
+            for chunk in chunks:
+                accumulators = merge_accumulators(
+                    accumulators, self._call(fit, df=chunk)
+                )
+
+                path: str = os.path.join(spill_dir, f"{len(paths)}.pkl")
+                chunk.to_pickle(path)
+                paths.append(path)
+
+            # second pass: transform the spilled chunks
+            for path in paths:
+                yield self._call(
+                    apply, df=pd.read_pickle(path), accumulators=accumulators
+                )
+
+    def _barrier(
+        self, step: Callable, chunks: Iterable[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """Apply a global step to all chunks at once.
+
+        Args:
+            step (Callable): Global step.
+            chunks (Iterable[pd.DataFrame]): Input data, in chunks.
+
+        Yields:
+            pd.DataFrame: Transformed data, re-split into chunks.
+        """
+        collected: List[pd.DataFrame] = list(chunks)
+        if not collected:
+            return
+
+        chunksize: int = max(max(len(chunk) for chunk in collected), 1)
+
+        self.offset = 0
+        df: pd.DataFrame = self._call(step, df=pd.concat(collected))
+        del collected
+
+        for start in range(0, max(len(df), 1), chunksize):
+            yield df.iloc[start : start + chunksize].copy()
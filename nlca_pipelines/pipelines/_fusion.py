@@ -0,0 +1,118 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import pandas as pd
+
+# the step only adds columns computed without reading any other column
+# (e.g. constants or row numbers)
+COLUMNS: str = "columns"
+
+FUSIONS = (COLUMNS,)
+
+
+def fuse(kind: str) -> Callable:
+    """Decorator declaring how a row-local step can be fused with others.
+
+    Consecutive steps of the same kind are executed as a single pass
+    (see `BasePipeline.execution_plan`). A column step named `step` must
+    come with a `columns_step(df)` method returning the new columns (a
+    dict of scalars or arrays), which are then added to the data in one
+    go, in place. Column steps must not require any column.
+
+    Args:
+        kind (str): `COLUMNS`.
+
+    Returns:
+        Callable: Decorator function.
+
+    Examples:
+        >>> class MyPipeline(BasePipeline):
+        ...     def columns_add_two(self, df: pd.DataFrame) -> Dict[str, Any]:
+        ...         return {"two": 2}
+        ...
+        ...     @scope(ROW_LOCAL)
+        ...     @fuse(COLUMNS)
+        ...     def add_two(self, df: pd.DataFrame) -> pd.DataFrame:
+        ...         return add_columns(df, self.columns_add_two(df))
+    """
+    if kind not in FUSIONS:
+        raise ValueError(f"Unknown step fusion '{kind}'.")
+
+    def inner(func: Any) -> Any:
+        """Record the fusion kind as an attribute of the method.
+
+        Args:
+            func (Any): The method (or static method) to be decorated.
+
+        Returns:
+            Any: The same method.
+        """
+        setattr(func, "fusion", kind)
+        if isinstance(func, staticmethod):
+            setattr(func.__func__, "fusion", kind)
+
+        return func
+
+    return inner
+
+
+def add_columns(df: pd.DataFrame, columns: Dict[str, Any]) -> pd.DataFrame:
+    """Add columns to data, in place.
+
+    Args:
+        df (pd.DataFrame): Input data.
+        columns (Dict[str, Any]): New columns (scalars or arrays).
+
+    Returns:
+        pd.DataFrame: The same data, with the new columns.
+    """
+    for col, value in columns.items():
+        df[col] = value
+
+    return df
+
+
+def get_fusion(step: Callable) -> Optional[str]:
+    """Fusion kind of a pipeline step, if any.
+
+    Args:
+        step (Callable): A (bound) pipeline step.
+
+    Returns:
+        Optional[str]: The step's fusion kind (None if it can't be
+            fused).
+    """
+    kind: Optional[str] = getattr(step, "fusion", None)
+    if kind == COLUMNS and getattr(step, "required_cols", None):
+        # the required columns may be added by a step fused with it
+        return None
+
+    return kind
+
+
+def fuse_steps(steps: List[Callable]) -> List[Tuple[Optional[str], List[Callable]]]:
+    """Group consecutive steps of the same fusion kind.
+
+    Args:
+        steps (List[Callable]): Row-local steps.
+
+    Returns:
+        List[Tuple[Optional[str], List[Callable]]]: Ordered `(fusion,
+            steps)` pairs; steps that can't be fused form a group of
+            their own, with a fusion of None.
+    """
+    groups: List[Tuple[Optional[str], List[Callable]]] = []
+    for step in steps:
+        kind: Optional[str] = get_fusion(step)
+        if kind is not None and groups and groups[-1][0] == kind:
+            groups[-1][1].append(step)
+        else:
+            groups.append((kind, [step]))
+
+    return groups
@@ -0,0 +1,94 @@
+"""Bulk generation of UUIDs for the bronze `id` column.
+
+Rather than creating a `uuid.UUID` object per row, the raw 16 bytes of
+every id are generated at once, the version and variant bits are set
+with NumPy, and the ids are formatted to their canonical string form
+in bulk.
+"""
+
+import binascii
+import hashlib
+import os
+import uuid
+from typing import Iterable
+
+import numpy as np
+
+# byte offsets of the dashes in the canonical 36 character form
+_DASHES: np.ndarray = np.array([8, 13, 18, 23])
+# positions of the 32 hex digits within the 36 character form
+_HEX_POSITIONS: np.ndarray = np.delete(np.arange(36), _DASHES)
+
+
+def _set_version(raw: np.ndarray, version: int) -> np.ndarray:
+    """Set the RFC 4122 version and variant bits of raw ids.
+
+    Args:
+        raw (np.ndarray): `(n, 16)` array of `uint8`.
+        version (int): UUID version (4 for random, 5 for SHA-1 names).
+
+    Returns:
+        np.ndarray: The same array, modified in place.
+    """
+    raw[:, 6] = (raw[:, 6] & 0x0F) | (version << 4)
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+
+    return raw
+
+
+def format_uuids(raw: np.ndarray) -> np.ndarray:
+    """Format raw ids in their canonical string form.
+
+    Args:
+        raw (np.ndarray): `(n, 16)` array of `uint8`.
+
+    Returns:
+        np.ndarray: Array of `n` strings like
+            `"12345678-1234-4234-8234-123456789abc"`.
+    """
+    n: int = raw.shape[0]
+    hex_digits: np.ndarray = np.frombuffer(
+        binascii.hexlify(raw.tobytes()), dtype=np.uint8
+    ).reshape(n, 32)
+
+    chars: np.ndarray = np.full((n, 36), ord("-"), dtype=np.uint8)
+    chars[:, _HEX_POSITIONS] = hex_digits
+
+    return chars.view("S36").ravel().astype("U36")
+
+
+def random_uuids(n: int) -> np.ndarray:
+    """Generate random (version 4) UUIDs in bulk.
+
+    Args:
+        n (int): Number of ids.
+
+    Returns:
+        np.ndarray: Array of `n` canonical UUID strings.
+    """
+    raw: np.ndarray = np.frombuffer(os.urandom(16 * n), dtype=np.uint8)
+
+    return format_uuids(_set_version(raw.reshape(n, 16).copy(), version=4))
+
+
+def name_uuids(names: Iterable[str], namespace: uuid.UUID) -> np.ndarray:
+    """Generate name-based (version 5) UUIDs in bulk.
+
+    The ids are identical to `uuid.uuid5(namespace, name)`, so the same
+    names always produce the same ids.
+
+    Args:
+        names (Iterable[str]): Name of each id.
+        namespace (uuid.UUID): Namespace of the names.
+
+    Returns:
+        np.ndarray: Array of canonical UUID strings, one per name.
+    """
+    prefix: bytes = namespace.bytes
+    digests: bytes = b"".join(
+        hashlib.sha1(prefix + name.encode(), usedforsecurity=False).digest()[:16]
+        for name in names
+    )
+    raw: np.ndarray = np.frombuffer(digests, dtype=np.uint8).reshape(-1, 16)
+
+    return format_uuids(_set_version(raw.copy(), version=5))
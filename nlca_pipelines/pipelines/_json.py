@@ -0,0 +1,223 @@
+"""Bulk encoding and decoding of the JSON serialized `source_row` column.
+
+Decoding uses `orjson` when it is installed, otherwise the standard
+library `json` module. Encoding always reproduces the standard library
+`json.dumps` output byte for byte.
+"""
+
+import json
+import logging
+import re
+import time
+from json.encoder import encode_basestring_ascii  # type: ignore
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    infer_dtype,
+    is_bool_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_numeric_dtype,
+)
+
+try:
+    import orjson  # type: ignore
+
+    DECODER: str = "orjson"
+    _loads: Callable[[str], Any] = orjson.loads  # pylint: disable=no-member
+except ImportError:
+    DECODER = "json"
+    _loads = json.loads
+
+logger = logging.getLogger()
+
+
+def may_have_values(rows: pd.Series, keys: List[str]) -> np.ndarray:
+    """Rows of JSON objects that may have a value for every key.
+
+    A cheap scan of the serialized rows, without decoding them: a row
+    is rejected only if, for one of the keys, no member of that name
+    has a value other than null or an empty string (anywhere in the
+    object). Quotes within JSON strings are escaped, so a string value
+    can't be mistaken for a member. The check is conservative: nested
+    members of the same name may keep a row whose top-level value is
+    missing, so the decoded rows still need to be filtered.
+
+    Args:
+        rows (pd.Series): JSON serialized objects, one per row.
+        keys (List[str]): Keys that must have a value.
+
+    Returns:
+        np.ndarray: False where a row is certain to miss a value.
+    """
+    mask: np.ndarray = np.ones(len(rows), dtype=bool)
+    for key in keys:
+        member: str = re.escape(json.dumps(key))
+        pattern: str = member + r'\s*:(?!\s*(?:""|null\s*[,}]))'
+        mask &= rows.str.contains(pattern, regex=True).fillna(False).to_numpy(bool)
+
+    return mask
+
+
+def decode_rows(
+    rows: pd.Series, keys: Optional[List[str]] = None
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Decode a column of JSON objects straight into columns.
+
+    Each row is decoded and its values are appended to the lists of
+    their columns at once, so only one decoded object is alive at a
+    time (rather than a list of one dict per row, transposed after),
+    and the columns are typed by pandas inference rather than going
+    through `pd.json_normalize`. Keys missing from some rows are filled
+    with NaN; nested objects are kept as-is (not flattened).
+
+    Args:
+        rows (pd.Series): JSON serialized objects, one per row.
+        keys (Optional[List[str]]): If given, only the columns of these
+            keys are built (those found in the rows, in the order they
+            are first seen).
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, Any]]: The decoded columns
+            (sharing the index of `rows`), and throughput statistics.
+    """
+    start: float = time.perf_counter()
+
+    wanted: Optional[Set[str]] = None if keys is None else set(keys)
+    # the values of each column, in the order the keys are first seen
+    columns: Dict[str, List[Any]] = {}
+    chars: int = 0
+    for i, row in enumerate(rows.tolist()):
+        chars += len(row)
+        found: int = 0
+        for key, value in _loads(row).items():
+            column: Optional[List[Any]] = columns.get(key)
+            if column is None:
+                if wanted is not None and key not in wanted:
+                    continue
+                column = columns[key] = [np.nan] * i
+            column.append(value)
+            found += 1
+        if found < len(columns):
+            for column in columns.values():
+                if len(column) == i:
+                    column.append(np.nan)
+
+    decoded: pd.DataFrame = pd.DataFrame(columns, index=rows.index)
+
+    seconds: float = time.perf_counter() - start
+    stats: Dict[str, Any] = {
+        "decoder": DECODER,
+        "rows": len(rows),
+        "chars": chars,
+        "seconds": seconds,
+        "rows_per_second": len(rows) / seconds if seconds else float("inf"),
+    }
+    logger.info(
+        "Decoded %d rows with %s in %.3fs (%.0f rows/s).",
+        stats["rows"],
+        DECODER,
+        seconds,
+        stats["rows_per_second"],
+    )
+
+    return decoded, stats
+
+
+def normalize_rows(rows: pd.Series) -> pd.DataFrame:
+    """Decode a column of JSON objects with `pd.json_normalize`.
+
+    This is the original (slower) decoding path, kept for compatibility;
+    unlike `decode_rows` it flattens nested objects into dotted columns.
+
+    Args:
+        rows (pd.Series): JSON serialized objects, one per row.
+
+    Returns:
+        pd.DataFrame: The decoded columns, sharing the index of `rows`.
+    """
+    return pd.json_normalize(rows.map(json.loads).tolist()).set_index(rows.index)
+
+
+def _upcasts_ints(df: pd.DataFrame) -> bool:
+    """Whether the rows of a dataframe hold its integers as floats.
+
+    A row (as from `df.apply(..., axis=1)` or `df.iloc`) has the common
+    dtype of the columns: float when every column is a number (not a
+    boolean) and one of them is a float.
+    """
+    dtypes: List[Any] = df.dtypes.tolist()
+
+    return any(is_float_dtype(dtype) for dtype in dtypes) and all(
+        is_numeric_dtype(dtype) and not is_bool_dtype(dtype) for dtype in dtypes
+    )
+
+
+def _encode_column(col: pd.Series, upcast: bool = False) -> Iterable[str]:
+    """JSON encode every value of a column, as `json.dumps` would.
+
+    Args:
+        col (pd.Series): A column of the input data.
+        upcast (bool): Whether integers are encoded as floats (see
+            `_upcasts_ints`).
+
+    Returns:
+        Iterable[str]: The encoded values, in order.
+    """
+    values: List[Any] = col.tolist()
+
+    if is_bool_dtype(col.dtype):
+        return ["true" if v else "false" for v in values]
+    if is_integer_dtype(col.dtype) and upcast:
+        return map(json.dumps, col.astype("float64").tolist())
+    if is_integer_dtype(col.dtype):
+        return map(str, values)
+    if infer_dtype(col, skipna=False) == "string":
+        # the C string encoder used internally by `json.dumps`
+        return map(encode_basestring_ascii, values)
+
+    # floats (NaN, Infinity), nulls and mixed columns
+    return map(json.dumps, values)
+
+
+def encode_rows(df: pd.DataFrame) -> pd.Series:
+    """Serialize each row of a dataframe to a JSON object string.
+
+    The output is identical to `json.dumps(row.to_dict())` for every
+    row (including integers encoded as floats, when the rows have a
+    float dtype), but is built column by column: each column is encoded
+    in bulk, then the rows are assembled with a format template compiled
+    once for the dataframe's columns.
+
+    Args:
+        df (pd.DataFrame): Input data.
+
+    Returns:
+        pd.Series: JSON serialized rows, sharing the index of `df`.
+    """
+    # encode each key exactly as `json.dumps` would (e.g. non-str keys)
+    keys: List[str] = [json.dumps({key: 0})[1:-4] for key in df.columns]
+    template: str = (
+        "{" + ", ".join(key.replace("%", "%%") + ": %s" for key in keys) + "}"
+    )
+
+    upcast: bool = _upcasts_ints(df)
+    columns: List[Iterable[str]] = [
+        _encode_column(df[col], upcast) for col in df.columns
+    ]
+    rows: List[str] = (
+        list(map(template.__mod__, zip(*columns))) if keys else ["{}"] * len(df)
+    )
+
+    return pd.Series(rows, index=df.index, dtype=object)
@@ -0,0 +1,104 @@
+"""Execution of row-local steps on a pool of worker processes.
+
+Partitions of the data are sent, with a copy of the pipeline, to worker
+processes, which apply a sequence of row-local steps to them; results
+are returned in the order the partitions were submitted.
+"""
+
+import copy
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import (
+    Any,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
+
+# default minimum number of rows per partition; below it, the cost of
+# sending the data to (and back from) a worker outweighs the gain
+MIN_ROWS_PER_WORKER: int = 50_000
+
+
+def apply_steps(
+    pipeline: Any, steps: List[str], df: pd.DataFrame, offset: int
+) -> pd.DataFrame:
+    """Apply a sequence of steps to a partition (in a worker process).
+
+    Args:
+        pipeline (Any): The pipeline (a `BasePipeline`).
+        steps (List[str]): Names of the steps.
+        df (pd.DataFrame): The partition.
+        offset (int): Position of the partition's first row in the
+            whole input stream.
+
+    Returns:
+        pd.DataFrame: The transformed partition.
+    """
+    pipeline.offset = offset
+
+    return pipeline.run_stage(steps, df=df)
+
+
+def split(df: pd.DataFrame, parts: int) -> List[Tuple[int, pd.DataFrame]]:
+    """Split data into contiguous partitions of (nearly) equal size.
+
+    Args:
+        df (pd.DataFrame): Data to split.
+        parts (int): Number of partitions.
+
+    Returns:
+        List[Tuple[int, pd.DataFrame]]: The position of each partition's
+            first row, and the partition (a copy).
+    """
+    bounds: np.ndarray = np.linspace(0, len(df), parts + 1).astype(int)
+
+    return [
+        (int(start), df.iloc[start:stop].copy())
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+def map_partitions(
+    pipeline: Any,
+    steps: List[str],
+    partitions: Iterable[Tuple[int, pd.DataFrame]],
+    workers: int,
+) -> Iterator[Tuple[pd.DataFrame, "Future[pd.DataFrame]"]]:
+    """Apply a sequence of steps to partitions on a pool of workers.
+
+    At most twice as many partitions as there are workers are in flight
+    at once, so partitions can be streamed without all of them being
+    held in memory.
+
+    Args:
+        pipeline (Any): The pipeline (a `BasePipeline`); its hooks are
+            not sent to the workers.
+        steps (List[str]): Names of the steps.
+        partitions (Iterable[Tuple[int, pd.DataFrame]]): Position of the
+            first row of each partition, and the partition.
+        workers (int): Number of worker processes.
+
+    Yields:
+        Tuple[pd.DataFrame, Future[pd.DataFrame]]: Each partition, and
+            the future of the transformed partition, in order.
+    """
+    worker_pipeline: Any = copy.copy(pipeline)
+    worker_pipeline.hooks = []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Tuple[pd.DataFrame, "Future[pd.DataFrame]"]] = deque()
+        for offset, df in partitions:
+            pending.append(
+                (df, executor.submit(apply_steps, worker_pipeline, steps, df, offset))
+            )
+            if len(pending) >= 2 * workers:
+                yield pending.popleft()
+
+        while pending:
+            yield pending.popleft()
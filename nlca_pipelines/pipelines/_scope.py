@@ -0,0 +1,79 @@
+from typing import Any, Callable
+
+# the step transforms each row independently, so it can be streamed
+ROW_LOCAL: str = "row_local"
+# the step needs to see all of the data at once (e.g. sorting)
+GLOBAL: str = "global"
+# the step aggregates over all of the data, then transforms each row
+AGGREGATE: str = "aggregate"
+
+SCOPES = (ROW_LOCAL, GLOBAL, AGGREGATE)
+
+
+def scope(kind: str) -> Callable:
+    """Decorator declaring how a pipeline step can be executed.
+
+    Row-local steps transform each row independently of every other
+    row, so chunks of the input can be pushed through them one at a
+    time (see `BasePipeline.run_chunked`). Global steps need all of the
+    data at once. Undecorated steps are treated as global. A global
+    step named `step` may come with a `stream_step(chunks)` method,
+    yielding its output in chunks without holding all of the data in
+    memory, which is then used when running in chunks.
+
+    Aggregate steps are streamed in two passes: a step named `step`
+    must come with a `fit_step(df)` method returning mergeable
+    accumulators (see `nlca_pipelines.pipelines.accumulators`), which
+    is fed every chunk, and an `apply_step(df, accumulators)` method,
+    which then transforms each chunk using the merged accumulators.
+
+    Args:
+        kind (str): One of `ROW_LOCAL`, `GLOBAL` or `AGGREGATE`.
+
+    Returns:
+        Callable: Decorator function.
+
+    Examples:
+        The decorator can be combined with `validate`, in either order,
+        on both static and instance methods.
+        >>> class MyPipeline(BasePipeline):
+        ...     @scope(ROW_LOCAL)
+        ...     @validate(required_cols=["age"])
+        ...     @staticmethod
+        ...     def add_two(df: pd.DataFrame) -> pd.DataFrame:
+        ...         df["age2"] = df["age"] + 2
+        ...         return df
+        >>> getattr(MyPipeline.add_two, "scope")
+        'row_local'
+    """
+    if kind not in SCOPES:
+        raise ValueError(f"Unknown step scope '{kind}'.")
+
+    def inner(func: Any) -> Any:
+        """Record the scope as an attribute of the method.
+
+        Args:
+            func (Any): The method (or static method) to be decorated.
+
+        Returns:
+            Any: The same method.
+        """
+        setattr(func, "scope", kind)
+        if isinstance(func, staticmethod):
+            setattr(func.__func__, "scope", kind)
+
+        return func
+
+    return inner
+
+
+def get_scope(step: Callable) -> str:
+    """Scope of a pipeline step, defaulting to `GLOBAL`.
+
+    Args:
+        step (Callable): A (bound) pipeline step.
+
+    Returns:
+        str: The step's scope.
+    """
+    return getattr(step, "scope", GLOBAL)
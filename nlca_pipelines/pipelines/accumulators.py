@@ -0,0 +1,227 @@
+"""Mergeable accumulators for computing column statistics in chunks.
+
+An accumulator is fed a column chunk by chunk (`update`), can be merged
+with accumulators fed other chunks of the same column (`merge`, e.g.
+from other workers), and can be saved to and loaded from disk. Its
+`value` is the statistic over all of the data it has seen.
+"""
+
+import pickle
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_datetime64_any_dtype,
+    is_float_dtype,
+    is_numeric_dtype,
+)
+
+AccumulatorT = TypeVar("AccumulatorT", bound="Accumulator")
+
+
+class Accumulator(ABC):
+    """Base class of the mergeable accumulators."""
+
+    @abstractmethod
+    def update(self: AccumulatorT, s: pd.Series) -> AccumulatorT:
+        """Feed a chunk of the column to the accumulator.
+
+        Args:
+            s (pd.Series): A chunk of the column.
+
+        Returns:
+            Accumulator: The accumulator itself.
+        """
+
+    @abstractmethod
+    def merge(self: AccumulatorT, other: AccumulatorT) -> AccumulatorT:
+        """Merge another accumulator of the same column into this one.
+
+        Args:
+            other (Accumulator): Accumulator fed other chunks.
+
+        Returns:
+            Accumulator: The accumulator itself.
+        """
+
+    @property
+    @abstractmethod
+    def value(self) -> Any:
+        """The statistic over all of the data seen, or None if no
+        (non-missing) data was seen."""
+
+    def save(self, path: str) -> None:
+        """Save the accumulator to disk.
+
+        Args:
+            path (str): Destination file.
+        """
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @classmethod
+    def load(cls: type, path: str) -> Any:
+        """Load an accumulator saved with `save`.
+
+        Only load files written by a trusted process, as they are
+        unpickled.
+
+        Args:
+            path (str): Source file.
+
+        Returns:
+            Accumulator: The loaded accumulator.
+        """
+        with open(path, "rb") as f:
+            accumulator = pickle.load(f)
+
+        if not isinstance(accumulator, cls):
+            raise TypeError(f"'{path}' does not hold a {cls.__name__}.")
+
+        return accumulator
+
+
+class MeanAccumulator(Accumulator):
+    """Running sum and count of a numeric or datetime column.
+
+    Each chunk is summed in float64 as by `pd.Series.mean` (missing
+    values count as zeros in the sum, but not in the count), and the
+    mean is the float64 sum divided by the count, so a column fed in a
+    single chunk has exactly the mean pandas computes. Sums of several
+    chunks are added in float64, so they may differ from the sum of the
+    whole column by its rounding errors. Datetime means are truncated to
+    nanoseconds, as by pandas.
+    """
+
+    def __init__(self) -> None:
+        self.total: float = 0.0
+        self.count: int = 0
+        self.kind: Optional[str] = None
+
+    def update(self, s: pd.Series) -> "MeanAccumulator":
+        count: int = int(s.count())
+        if not count:
+            return self
+
+        if is_datetime64_any_dtype(s.dtype):
+            # int64 nanoseconds, missing ones summed as zeros
+            values: np.ndarray = np.where(
+                s.isna().to_numpy(),
+                0,
+                s.to_numpy(dtype="datetime64[ns]").view(np.int64),
+            )
+            return self._add("datetime", float(values.sum(dtype=np.float64)), count)
+
+        s = s if is_numeric_dtype(s.dtype) else pd.to_numeric(s)
+        if is_float_dtype(s.dtype) or not isinstance(s.dtype, np.dtype):
+            # pandas' own float (or masked) sum, as in `pd.Series.mean`
+            return self._add("number", float(s.sum()), count)
+
+        return self._add("number", float(s.to_numpy().sum(dtype=np.float64)), count)
+
+    def merge(self, other: "MeanAccumulator") -> "MeanAccumulator":
+        if other.count:
+            self._add(other.kind or "number", other.total, other.count)
+
+        return self
+
+    def _add(self, kind: str, total: float, count: int) -> "MeanAccumulator":
+        """Add a partial sum and count.
+
+        Args:
+            kind (str): `"number"` or `"datetime"`.
+            total (float): Partial sum.
+            count (int): Number of values summed.
+
+        Returns:
+            MeanAccumulator: The accumulator itself.
+        """
+        if self.kind is not None and self.kind != kind:
+            raise ValueError(f"Cannot mix {self.kind} and {kind} values.")
+
+        self.kind = kind
+        self.total += total
+        self.count += count
+
+        return self
+
+    @property
+    def value(self) -> Any:
+        """The mean (a `pd.Timestamp` for datetime columns)."""
+        if not self.count:
+            return None
+        mean: float = self.total / self.count
+        if self.kind == "datetime":
+            # truncated to int64 nanoseconds, as by pandas
+            return pd.Timestamp(int(mean))
+
+        return mean
+
+
+class ModeAccumulator(Accumulator):
+    """Counts of each distinct value of a column.
+
+    As with `pd.Series.mode()[0]`, the mode is the most common value,
+    with ties broken by taking the smallest value. Missing values are
+    ignored.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()
+
+    def update(self, s: pd.Series) -> "ModeAccumulator":
+        counts: pd.Series = s.value_counts(dropna=True, sort=False)
+        self.counts.update(counts[counts > 0].to_dict())
+
+        return self
+
+    def merge(self, other: "ModeAccumulator") -> "ModeAccumulator":
+        self.counts.update(other.counts)
+
+        return self
+
+    @property
+    def value(self) -> Any:
+        """The most common value."""
+        if not self.counts:
+            return None
+
+        most: int = max(self.counts.values())
+        tied: List[Hashable] = [v for v, n in self.counts.items() if n == most]
+        try:
+            return min(tied)  # type: ignore
+        except TypeError:
+            # values that cannot be ordered: keep the first seen
+            return tied[0]
+
+
+def merge_accumulators(
+    left: Dict[str, AccumulatorT], right: Dict[str, AccumulatorT]
+) -> Dict[str, AccumulatorT]:
+    """Merge two collections of per-column accumulators.
+
+    Args:
+        left (Dict[str, Accumulator]): Accumulators by column, updated
+            in place.
+        right (Dict[str, Accumulator]): Accumulators by column.
+
+    Returns:
+        Dict[str, Accumulator]: The merged accumulators (`left`).
+    """
+    for col, accumulator in right.items():
+        if col in left:
+            left[col].merge(accumulator)
+        else:
+            left[col] = accumulator
+
+    return left
@@ -1,16 +1,96 @@
 # pylint: disable=bad-staticmethod-argument
 # ^^^ Due to known pylint issue: https://github.com/pylint-dev/pylint/issues/5441
+# pylint: disable=unused-argument
+# ^^^ The `columns_*` methods all take the data, whether they read it or not
 
-import json
 import uuid
-from typing import List, Optional
-
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+import numpy as np
 import pandas as pd
 
 from ..validation import validate
 from ._base import BasePipeline
+from ._fusion import (
+    COLUMNS,
+    add_columns,
+    fuse,
+)
+from ._ids import name_uuids, random_uuids
+from ._json import encode_rows
+from ._scope import ROW_LOCAL, scope
 from .options import BronzePipelineOptionsDict
 
+# prefix of the input columns kept by `defer_serialize_rows`
+SOURCE_ROW_PREFIX: str = "source_row."
+
+
+def source_columns(df: pd.DataFrame) -> List[str]:
+    """The input columns kept by `defer_serialize_rows`.
+
+    Args:
+        df (pd.DataFrame): Bronze data.
+
+    Returns:
+        List[str]: The prefixed input columns, in input order.
+    """
+    return [
+        col
+        for col in df.columns
+        if isinstance(col, str) and col.startswith(SOURCE_ROW_PREFIX)
+    ]
+
+
+def source_rows(df: pd.DataFrame) -> pd.Series:
+    """The `source_row` of bronze data, serializing deferred rows.
+
+    Args:
+        df (pd.DataFrame): Bronze data, with either the `source_row`
+            column or the input columns kept by `defer_serialize_rows`.
+
+    Returns:
+        pd.Series: JSON serialized input rows.
+    """
+    if "source_row" in df.columns:
+        return df["source_row"]
+
+    cols: List[str] = source_columns(df)
+
+    return encode_rows(
+        df[cols].rename(columns=lambda col: col[len(SOURCE_ROW_PREFIX) :])
+    )
+
+
+def materialize_source_row(df: pd.DataFrame) -> pd.DataFrame:
+    """Serialize the input columns kept by `defer_serialize_rows`.
+
+    The result is identical to running `serialize_rows` in place of
+    `defer_serialize_rows`, so the bronze output doesn't depend on
+    whether serialization was deferred.
+
+    Args:
+        df (pd.DataFrame): Bronze data.
+
+    Returns:
+        pd.DataFrame: Bronze data with the `source_row` column (as is,
+            if it has no deferred input columns).
+    """
+    cols: List[str] = source_columns(df)
+    if not cols:
+        return df
+
+    position: int = df.columns.get_loc(cols[0])
+    rows: pd.Series = source_rows(df)
+    df = df.drop(columns=cols)
+    df.insert(position, "source_row", rows)
+
+    return df
+
 
 class BronzePipeline(BasePipeline):
     """A pipeline to ingest data to the bronze tier.
@@ -38,27 +118,82 @@ class BronzePipeline(BasePipeline):
     ) -> None:
         super().__init__(steps=steps, options=options)
 
+    @staticmethod
+    def columns_add_id(df: pd.DataFrame) -> Dict[str, Any]:
+        """The column added by `add_id`.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            Dict[str, Any]: The `id` column.
+        """
+        return {"id": pd.array(random_uuids(len(df)), dtype="string")}
+
+    @scope(ROW_LOCAL)
+    @fuse(COLUMNS)
     @staticmethod
     def add_id(df: pd.DataFrame) -> pd.DataFrame:
         """Add Id column.
 
+        The ids are random (version 4) UUIDs, generated in bulk and
+        stored in their canonical string form.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            pd.DataFrame: Data with a new `id` column.
+        """
+        return add_columns(df, BronzePipeline.columns_add_id(df=df))
+
+    @scope(ROW_LOCAL)
+    @validate(required_cols=["source_uri", "source_row_number"])
+    @staticmethod
+    def add_deterministic_id(df: pd.DataFrame) -> pd.DataFrame:
+        """Add a deterministic Id column.
+
+        The ids are name-based (version 5) UUIDs derived from the
+        `source_uri` and `source_row_number`, so re-running the pipeline
+        on the same source produces the same ids (making reruns
+        idempotent). Use this step in place of `add_id`, after
+        `add_source_uri` and `add_row_number`.
+
         Args:
             df (pd.DataFrame): Input data.
 
         Returns:
             pd.DataFrame: Data with a new `id` column.
         """
-        df["id"] = df.apply(lambda _: uuid.uuid4(), axis=1)
+        names = df["source_uri"].astype(str) + "#" + df["source_row_number"].astype(str)
+        df["id"] = pd.array(name_uuids(names, uuid.NAMESPACE_URL), dtype="string")
 
         return df
 
+    def columns_add_row_number(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """The column added by `add_row_number`.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            Dict[str, Any]: The `source_row_number` column.
+        """
+        start: int = self.offset + self.options["skiprows"]
+
+        return {"source_row_number": np.arange(start, start + len(df))}
+
+    @scope(ROW_LOCAL)
+    @fuse(COLUMNS)
     @validate(required_opts=["skiprows"])
     def add_row_number(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add the `source_row_number` column.
 
         We add the `skiprows` attribute to the row number, so that the
         value corresponds to the row number in the original source file
-        (some files often have multiple header rows).
+        (some files often have multiple header rows). When running in
+        chunks, rows are numbered from the chunk's `offset` within the
+        whole input.
 
         Args:
             df (pd.DataFrame): Input data.
@@ -66,11 +201,9 @@ class BronzePipeline(BasePipeline):
         Returns:
             pd.DataFrame: Data with a new `source_row_number` column.
         """
-        df["source_row_number"] = range(len(df))
-        df["source_row_number"] = df["source_row_number"] + self.options["skiprows"]
-
-        return df
+        return add_columns(df, self.columns_add_row_number(df=df))
 
+    @scope(ROW_LOCAL)
     @validate(required_opts=["source_created_at"])
     def add_source_created_at(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add the `source_created_at` column.
@@ -88,6 +221,19 @@ class BronzePipeline(BasePipeline):
 
         return df
 
+    def columns_add_source_name(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """The column added by `add_source_name`.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            Dict[str, Any]: The `source_name` column.
+        """
+        return {"source_name": self.options["source_name"]}
+
+    @scope(ROW_LOCAL)
+    @fuse(COLUMNS)
     @validate(required_opts=["source_name"])
     def add_source_name(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add the `source_name` column.
@@ -100,10 +246,21 @@ class BronzePipeline(BasePipeline):
         Returns:
             pd.DataFrame: Data with a new `source_name` column.
         """
-        df["source_name"] = self.options["source_name"]
+        return add_columns(df, self.columns_add_source_name(df=df))
 
-        return df
+    def columns_add_source_updated_at(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """The column added by `add_source_updated_at`.
+
+        Args:
+            df (pd.DataFrame): Input data.
 
+        Returns:
+            Dict[str, Any]: The `source_updated_at` column.
+        """
+        return {"source_updated_at": self.options["source_updated_at"]}
+
+    @scope(ROW_LOCAL)
+    @fuse(COLUMNS)
     @validate(required_opts=["source_updated_at"])
     def add_source_updated_at(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add the `source_updated_at` column.
@@ -116,10 +273,21 @@ class BronzePipeline(BasePipeline):
         Returns:
             pd.DataFrame: Data with a new `source_updated_at` column.
         """
-        df["source_updated_at"] = self.options["source_updated_at"]
+        return add_columns(df, self.columns_add_source_updated_at(df=df))
 
-        return df
+    def columns_add_source_uri(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """The column added by `add_source_uri`.
 
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            Dict[str, Any]: The `source_uri` column.
+        """
+        return {"source_uri": self.options["source_uri"]}
+
+    @scope(ROW_LOCAL)
+    @fuse(COLUMNS)
     @validate(required_opts=["source_uri"])
     def add_source_uri(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add the `source_uri` column.
@@ -133,14 +301,16 @@ class BronzePipeline(BasePipeline):
         Returns:
             pd.DataFrame: Data with a new `source_uri` column.
         """
-        df["source_uri"] = self.options["source_uri"]
-
-        return df
+        return add_columns(df, self.columns_add_source_uri(df=df))
 
+    @scope(ROW_LOCAL)
     @staticmethod
     def serialize_rows(df: pd.DataFrame) -> pd.DataFrame:
         """Serializes the input data into a JSON string.
 
+        Rows are serialized column by column (see `encode_rows`), with
+        output identical to `json.dumps(row.to_dict())`.
+
         Args:
             df (pd.DataFrame): Input data.
 
@@ -153,9 +323,29 @@ class BronzePipeline(BasePipeline):
         input_cols = df.columns.tolist()
 
         # serialize input data to json
-        df["source_row"] = df.apply(lambda row: json.dumps(row.to_dict()), axis=1)
+        df["source_row"] = encode_rows(df)
 
         # drop the original data rows
         df = df.drop(input_cols, axis=1)
 
         return df
+
+    @scope(ROW_LOCAL)
+    @staticmethod
+    def defer_serialize_rows(df: pd.DataFrame) -> pd.DataFrame:
+        """Keep the input data as columns, to be serialized later.
+
+        An in-process alternative to `serialize_rows`: rather than
+        encoding every row to JSON only for `SilverPipeline.parse_json`
+        to decode it again, the input columns are kept (prefixed with
+        `SOURCE_ROW_PREFIX`) and the silver pipeline reads them
+        directly. `materialize_source_row` serializes them into the
+        `source_row` column, e.g. before writing the bronze output.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            pd.DataFrame: Data with its columns prefixed.
+        """
+        return df.rename(columns=lambda col: f"{SOURCE_ROW_PREFIX}{col}")
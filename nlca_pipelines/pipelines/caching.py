@@ -0,0 +1,237 @@
+"""Content-addressed cache of pipeline step results.
+
+The output of each stage of a pipeline run (see `BasePipeline.run`) is
+stored on disk under a key hashing the names and source code of its
+steps, the pipeline options they may read, and the content of the input
+data. Re-running identical steps on identical data then loads the stored
+output instead. The cache is bounded in size, evicting the least
+recently used results first.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+import pandas as pd
+from typing_extensions import TypedDict
+
+# default maximum size (bytes) of the cached results
+DEFAULT_CACHE_SIZE: int = 1024**3
+
+# options only changing how steps are executed, not their results
+EXECUTION_OPTIONS: List[str] = [
+    "cache_dir",
+    "cache_size",
+    "fuse_steps",
+    "min_rows_per_worker",
+    "sort_memory_budget",
+    "spill_dir",
+    "workers",
+]
+
+# prefixes of the companion methods of a step (e.g. `columns_add_id`)
+_COMPANIONS: List[str] = ["apply_", "columns_", "fit_", "stream_"]
+
+
+class CacheStatsDict(TypedDict):
+    """Statistics of a step cache.
+
+    Attributes:
+        evictions (int): Number of results evicted to bound the size.
+        hits (int): Number of results loaded from the cache.
+        misses (int): Number of results computed (and stored).
+        size_bytes (int): Size of the cached results.
+        steps (Dict[str, Dict[str, int]]): Hits and misses of each
+            stage, named after its steps joined with `+`.
+    """
+
+    evictions: int
+    hits: int
+    misses: int
+    size_bytes: int
+    steps: Dict[str, Dict[str, int]]
+
+
+def _source(func: Callable) -> str:
+    """Source code of a function (its qualified name if unavailable)."""
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return getattr(func, "__qualname__", repr(func))
+
+
+def fingerprint(df: pd.DataFrame) -> str:
+    """Hash the content of data (values, index, columns and types).
+
+    Args:
+        df (pd.DataFrame): Data.
+
+    Returns:
+        str: Hex digest of the data.
+    """
+    digest = hashlib.sha256()
+    digest.update(repr(list(df.columns)).encode())
+    digest.update(repr(df.dtypes.astype(str).tolist()).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+
+    return digest.hexdigest()
+
+
+class StepCache:
+    """On-disk cache of step results, with least-recently-used eviction.
+
+    Results are pickled (like the chunks spilled by `run_chunked`), one
+    file per key. Steps are expected to be deterministic: the result of
+    a step generating random values (e.g. `add_id`) is reused as is.
+    Changes to the code called by a step (rather than the step itself)
+    aren't detected; `clear` the cache after such changes.
+
+    Args:
+        directory (str): Directory of the cached results (created if it
+            doesn't exist); it may be shared by several pipelines.
+        max_bytes (int): Maximum size of the cached results.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_CACHE_SIZE) -> None:
+        self.directory: str = directory
+        self.max_bytes: int = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.steps: Dict[str, Dict[str, int]] = {}
+
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, pipeline: Any, steps: List[Callable], df: pd.DataFrame) -> str:
+        """Key of the result of a sequence of steps.
+
+        Args:
+            pipeline (Any): The pipeline (a `BasePipeline`); its class,
+                options (except those in `EXECUTION_OPTIONS`) and
+                `offset` are part of the key.
+            steps (List[Callable]): Steps of the pipeline.
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            str: Hex digest identifying the result.
+        """
+        digest = hashlib.sha256()
+        digest.update(type(pipeline).__qualname__.encode())
+        for step in steps:
+            digest.update(step.__name__.encode())
+            digest.update(_source(step).encode())
+            for prefix in _COMPANIONS:
+                companion: Optional[Callable] = getattr(
+                    pipeline, prefix + step.__name__, None
+                )
+                if companion is not None:
+                    digest.update(_source(companion).encode())
+
+        relevant: Dict[str, Any] = {
+            name: value
+            for name, value in pipeline.options.items()
+            if name not in EXECUTION_OPTIONS
+        }
+        digest.update(json.dumps(relevant, sort_keys=True, default=repr).encode())
+        digest.update(str(pipeline.offset).encode())
+        digest.update(fingerprint(df).encode())
+
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Path of the file of a result."""
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key: str, name: str = "") -> Optional[pd.DataFrame]:
+        """Load a result, if cached.
+
+        Args:
+            key (str): Key of the result (see `key`).
+            name (str): Name of the steps, for the statistics.
+
+        Returns:
+            Optional[pd.DataFrame]: The result (None on a miss).
+        """
+        counts: Dict[str, int] = self.steps.setdefault(name, {"hits": 0, "misses": 0})
+        path: str = self._path(key)
+        try:
+            df: pd.DataFrame = pd.read_pickle(path)
+        except (FileNotFoundError, EOFError):
+            self.misses += 1
+            counts["misses"] += 1
+            return None
+
+        # mark the result as recently used
+        os.utime(path)
+        self.hits += 1
+        counts["hits"] += 1
+
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """Store a result, then evict results beyond the maximum size.
+
+        Args:
+            key (str): Key of the result (see `key`).
+            df (pd.DataFrame): The result.
+        """
+        # write to a temporary file first, so readers never see a
+        # partially written result
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        df.to_pickle(tmp)
+        os.replace(tmp, self._path(key))
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Evict the least recently used results beyond the maximum size."""
+        entries: List[os.DirEntry] = sorted(
+            (e for e in os.scandir(self.directory) if e.name.endswith(".pkl")),
+            key=lambda e: e.stat().st_mtime,
+        )
+        size: int = sum(e.stat().st_size for e in entries)
+        for entry in entries:
+            if size <= self.max_bytes:
+                break
+            size -= entry.stat().st_size
+            os.remove(entry.path)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                os.remove(entry.path)
+
+    def size(self) -> int:
+        """Size (bytes) of the cached results."""
+        return sum(
+            e.stat().st_size
+            for e in os.scandir(self.directory)
+            if e.name.endswith(".pkl")
+        )
+
+    def stats(self) -> CacheStatsDict:
+        """Statistics of the cache since it was created.
+
+        Returns:
+            CacheStatsDict: Hits, misses and evictions, overall and per
+                stage, and the size of the cached results.
+        """
+        return {
+            "evictions": self.evictions,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size_bytes": self.size(),
+            "steps": self.steps,
+        }
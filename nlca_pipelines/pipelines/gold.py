@@ -0,0 +1,285 @@
+# pylint: disable=bad-staticmethod-argument
+# ^^^ Due to known pylint issue: https://github.com/pylint-dev/pylint/issues/5441
+
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+import pandas as pd
+
+from ..validation import validate
+from ._base import BasePipeline
+from ._scope import (
+    GLOBAL,
+    ROW_LOCAL,
+    scope,
+)
+from .options import GoldPipelineOptionsDict
+
+# column identifying a well in the top wells tables
+WELL_ID: str = "api10"
+
+# suffix of the partial counts of non-missing values of a summed column
+_COUNT: str = "__count"
+
+
+def _keys(s: pd.Series) -> pd.Series:
+    """Group keys of a column, with missing values as None."""
+    keys: pd.Series = s.astype(object)
+
+    return keys.where(s.notna(), None)
+
+
+def _partial_sums(df: pd.DataFrame, by: str, cols: List[str]) -> pd.DataFrame:
+    """Sums, and counts of rows and of values, of the groups of some data."""
+    values: pd.DataFrame = df[cols].apply(pd.to_numeric, errors="coerce")
+    grouped = values.assign(wells=1).groupby(_keys(df[by]), dropna=False, sort=False)
+
+    return pd.concat([grouped.sum(), grouped[cols].count().add_suffix(_COUNT)], axis=1)
+
+
+def _merge_sums(partials: List[pd.DataFrame]) -> pd.DataFrame:
+    """Add up the partial sums and counts of the same groups."""
+    return pd.concat(partials).groupby(level=0, dropna=False, sort=False).sum()
+
+
+def _ranked(df: pd.DataFrame, col: str) -> pd.DataFrame:
+    """Rows with a value of a column, sorted by it in descending order.
+
+    Ties keep the input order, so the top rows of concatenated top rows
+    are the top rows of the concatenated data.
+    """
+    return df.dropna(subset=[col]).sort_values(col, ascending=False, kind="stable")
+
+
+def _top(ranked: pd.DataFrame, by: Optional[str], n: int) -> pd.DataFrame:
+    """The first rows of ranked data, overall (None) or per group."""
+    if by is None:
+        return ranked.head(n)
+
+    return ranked.groupby(_keys(ranked[by]), dropna=False, sort=False).head(n)
+
+
+class GoldPipeline(BasePipeline):
+    """A pipeline to process data to the gold tier.
+
+    The gold-tier represents small aggregates of the silver-tier, which
+    are precomputed once, so consumers (dashboards, the Part 2 queries)
+    read them instead of scanning all of the silver data.
+
+    The steps don't transform the data: each step computes gold tables
+    from it (stored in `self.tables`, by name) and passes the data on
+    unchanged. When running in chunks, every table is computed in a
+    single pass over the chunks, holding only partial aggregates (a sum
+    per group, and at most `top_n` wells per group) in memory; the
+    tables are complete once the output stream is exhausted. As the
+    tables are only computed by the steps, the results of the steps are
+    never cached (the `cache_dir` option is ignored).
+
+    Args:
+        steps (Optional[List[str]]): The list of steps to be executed
+            during the pipeline.
+        options (Optional[GoldPipelineOptionsDict]): Variables used by
+            steps in the pipeline.
+    """
+
+    cacheable: bool = False
+
+    def __init__(
+        self,
+        steps: Optional[List[str]] = None,
+        options: Optional[GoldPipelineOptionsDict] = None,
+    ) -> None:
+        super().__init__(steps=steps, options=options)
+
+        # gold tables computed by the most recent run, by name
+        self.tables: Dict[str, pd.DataFrame] = {}
+
+    @scope(ROW_LOCAL)
+    @validate(required_cols=["spuddate"])
+    @staticmethod
+    def add_spud_year(df: pd.DataFrame) -> pd.DataFrame:
+        """Add the spud year, to group wells by.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            pd.DataFrame: Output data, with a new `spud_year` column
+                (missing if the spud date is missing or invalid), as
+                the one the silver output is partitioned by.
+        """
+        spuddate = pd.to_datetime(df["spuddate"], errors="coerce")
+
+        return df.assign(spud_year=spuddate.dt.year.astype("Int64"))
+
+    def _production_tables(self, partials: List[pd.DataFrame]) -> None:
+        """Finalize the production tables from partial sums, by group column."""
+        cols: List[str] = self.options["cols_to_sum"]
+        for by, partial in zip(self.options["cols_to_group_by"], partials):
+            table: pd.DataFrame = partial.sort_index(na_position="last")
+            for col in cols:
+                # as in SQL, the sum of missing values only is missing
+                table[col] = table[col].where(table[col + _COUNT] > 0)
+            table = table.rename_axis(by).reset_index()
+            table[by] = _keys(table[by])
+
+            self.tables[f"production_by_{by}"] = table[[by, "wells"] + cols]
+
+    @scope(GLOBAL)
+    @validate(required_opts=["cols_to_group_by", "cols_to_sum"])
+    def aggregate_production(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Aggregate production by group.
+
+        For each of the `cols_to_group_by`, computes a
+        `production_by_<col>` table: the number of wells and the sum of
+        each of the `cols_to_sum`, per value of the column (in order,
+        missing last). When running in chunks,
+        `stream_aggregate_production` is used instead.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            pd.DataFrame: Output data (the input data).
+        """
+        self._production_tables(
+            [
+                _partial_sums(df, by, self.options["cols_to_sum"])
+                for by in self.options["cols_to_group_by"]
+            ]
+        )
+
+        return df
+
+    def stream_aggregate_production(
+        self, chunks: Iterable[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """Aggregate production by group, in a single pass over chunks.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Input data, in chunks.
+
+        Yields:
+            pd.DataFrame: Output data (the input chunks).
+        """
+        cols: List[str] = self.options["cols_to_sum"]
+        groups: List[str] = self.options["cols_to_group_by"]
+
+        partials: List[pd.DataFrame] = []
+        for chunk in chunks:
+            partials = [
+                _merge_sums(([partials[i]] if partials else []) + [sums])
+                for i, sums in enumerate(
+                    _partial_sums(chunk, by, cols) for by in groups
+                )
+            ]
+            yield chunk
+
+        if partials:
+            self._production_tables(partials)
+
+    def _rank_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """The rows that can be ranked, and their ranking columns."""
+        col: str = self.options.get("col_to_rank_by", "cum12moil")
+        groups: List[str] = self.options["cols_to_group_by"]
+
+        mask: pd.Series = pd.Series(True, index=df.index)
+        for filtered, value in self.options.get("rank_filter", {}).items():
+            mask &= df[filtered].isin([value])
+        ranked: pd.DataFrame = df.loc[
+            mask, list(dict.fromkeys(groups + [WELL_ID, col]))
+        ]
+
+        return ranked.assign(**{col: pd.to_numeric(ranked[col], errors="coerce")})
+
+    def _top_rows(self, df: pd.DataFrame) -> Dict[Optional[str], pd.DataFrame]:
+        """The top rows overall (None) and per group column."""
+        col: str = self.options.get("col_to_rank_by", "cum12moil")
+        n: int = self.options.get("top_n", 5)
+        groups: List[Optional[str]] = [None, *self.options["cols_to_group_by"]]
+        ranked: pd.DataFrame = _ranked(df, col)
+
+        return {by: _top(ranked, by, n) for by in groups}
+
+    def _top_tables(self, tops: Dict[Optional[str], pd.DataFrame]) -> None:
+        """Finalize the top wells tables from the top rows, by group column."""
+        col: str = self.options.get("col_to_rank_by", "cum12moil")
+        for by, top in tops.items():
+            if by is None:
+                self.tables["top_wells"] = pd.DataFrame(
+                    {
+                        "rank": range(1, len(top) + 1),
+                        WELL_ID: top[WELL_ID].to_numpy(),
+                        col: top[col].to_numpy(),
+                    }
+                )
+                continue
+
+            keys: pd.Series = _keys(top[by])
+            table: pd.DataFrame = pd.DataFrame(
+                {
+                    by: keys,
+                    "rank": top.groupby(keys, dropna=False, sort=False).cumcount() + 1,
+                    WELL_ID: top[WELL_ID],
+                    col: top[col],
+                }
+            )
+            self.tables[f"top_wells_by_{by}"] = table.sort_values(
+                [by, "rank"], na_position="last", ignore_index=True
+            )
+
+    @scope(GLOBAL)
+    @validate(required_opts=["cols_to_group_by"])
+    def rank_wells(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Rank the top wells, overall and by group.
+
+        Computes a `top_wells` table (the `top_n` wells with the largest
+        `col_to_rank_by`, among those matching the `rank_filter`), and a
+        `top_wells_by_<col>` table with the top wells of each value of
+        each of the `cols_to_group_by`. Ties keep the input order. When
+        running in chunks, `stream_rank_wells` is used instead.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            pd.DataFrame: Output data (the input data).
+        """
+        self._top_tables(self._top_rows(self._rank_rows(df)))
+
+        return df
+
+    def stream_rank_wells(
+        self, chunks: Iterable[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """Rank the top wells, in a single pass over chunks.
+
+        Only the top wells of the chunks seen so far are kept (at most
+        `top_n` per group), and merged with the top wells of each chunk.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Input data, in chunks.
+
+        Yields:
+            pd.DataFrame: Output data (the input chunks).
+        """
+        col: str = self.options.get("col_to_rank_by", "cum12moil")
+        n: int = self.options.get("top_n", 5)
+
+        tops: Dict[Optional[str], pd.DataFrame] = {}
+        for chunk in chunks:
+            for by, top in self._top_rows(self._rank_rows(chunk)).items():
+                tops[by] = (
+                    _top(_ranked(pd.concat([tops[by], top]), col), by, n)
+                    if by in tops
+                    else top
+                )
+            yield chunk
+
+        if tops:
+            self._top_tables(tops)
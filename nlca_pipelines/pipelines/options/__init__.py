@@ -1,4 +1,9 @@
 from .bronze import BronzePipelineOptionsDict
+from .gold import GoldPipelineOptionsDict
 from .silver import SilverPipelineOptionsDict
 
-__all__ = ["BronzePipelineOptionsDict", "SilverPipelineOptionsDict"]
+__all__ = [
+    "BronzePipelineOptionsDict",
+    "GoldPipelineOptionsDict",
+    "SilverPipelineOptionsDict",
+]
@@ -5,16 +5,31 @@ class BronzePipelineOptionsDict(TypedDict, total=False):
     """Enforces typing for the `options` used by the `BronzePipeline`.
 
     Attributes:
+        cache_dir (str): Directory of the cache of step results (no
+            cache if unset).
+        cache_size (int): Maximum size (bytes) of the cached step
+            results (1 GiB by default).
+        fuse_steps (bool): Whether consecutive fusable steps are
+            executed as a single pass (True by default).
+        min_rows_per_worker (int): Minimum number of rows sent to a
+            worker process when running with `workers`.
         skiprows (int): Number of rows to add to the row number.
         source_created_at (str): When the file was created.
         source_name (str): Filename of the input data.
         source_uri (str): The URI of the source (from web, Google Drive,
             S3, etc.).
         source_updated_at (str): When the file was last updated.
+        workers (int): Number of processes to run the (row-local) steps
+            on.
     """
 
+    cache_dir: str
+    cache_size: int
+    fuse_steps: bool
+    min_rows_per_worker: int
     skiprows: int
     source_created_at: str
     source_name: str
     source_uri: str
     source_updated_at: str
+    workers: int
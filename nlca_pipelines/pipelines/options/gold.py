@@ -0,0 +1,25 @@
+from typing import Dict, List
+
+from typing_extensions import TypedDict
+
+
+class GoldPipelineOptionsDict(TypedDict, total=False):
+    """Enforces typing for the `options` used by the `GoldPipeline`.
+
+    Attributes:
+        col_to_rank_by (str): Column the top wells are ranked by, in
+            descending order (`cum12moil` by default).
+        cols_to_group_by (List[str]): List of columns to aggregate
+            production and rank wells by, one gold table per column.
+        cols_to_sum (List[str]): List of columns to sum by group.
+        rank_filter (Dict[str, str]): Value of each column the ranked
+            wells must have (e.g. `{"welltype": "OIL"}`); every well is
+            ranked if unset.
+        top_n (int): Number of top wells kept per group (5 by default).
+    """
+
+    col_to_rank_by: str
+    cols_to_group_by: List[str]
+    cols_to_sum: List[str]
+    rank_filter: Dict[str, str]
+    top_n: int
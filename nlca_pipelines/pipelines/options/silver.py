@@ -7,6 +7,10 @@ class SilverPipelineOptionsDict(TypedDict, total=False):
     """Enforces typing for the `options` used by the `SilverPipeline`.
 
     Attributes:
+        cache_dir (str): Directory of the cache of step results (no
+            cache if unset).
+        cache_size (int): Maximum size (bytes) of the cached step
+            results (1 GiB by default).
         cols_to_elim_invalid_values (List[str]): List of columns to
             eliminate invalid values for.
         cols_to_filter_missing (List[str]): List of columns to filter
@@ -15,12 +19,54 @@ class SilverPipelineOptionsDict(TypedDict, total=False):
             missing values with the mean.
         cols_to_impute_with_mode (List[str]): List of columns to impute
             missing values with the mode.
+        cols_to_keep (List[str]): List of source columns to keep in the
+            output (with the columns used by the steps); other source
+            columns are never decoded. Every source column is kept if
+            unset.
+        cols_to_memoize (List[str]): List of columns to validate once
+            per distinct value, through the process-wide validation
+            cache.
         cols_to_sort_by (List[str]): List of columns to sort the
             dataframe by in ascending order.
+        compact_dtypes (bool): Whether `eliminate_invalid_values`
+            converts validated columns to their compact target dtypes
+            (True by default).
+        fuse_steps (bool): Whether consecutive fusable steps are
+            executed as a single pass (True by default).
+        json_mode (str): How `parse_json` decodes the source rows;
+            `"bulk"` (default) or `"normalize"`.
+        min_rows_per_worker (int): Minimum number of rows sent to a
+            worker process when running with `workers`.
+        pushdown (bool): Whether `parse_json` only decodes the columns
+            used by the pipeline, and rejects rows missing a required
+            value before decoding them (True by default).
+        sort_memory_budget (int): Size (bytes) of the data `sort` may
+            buffer in memory when running in chunks, before spilling
+            sorted runs to disk (256 MiB by default).
+        spill_dir (str): Directory where chunks are spilled to disk
+            when running in chunks.
+        validation_mode (str): How `eliminate_invalid_values` validates
+            columns; `"vectorized"` (default) or `"scalar"`.
+        workers (int): Number of processes to run the row-local steps
+            (`parse_json`, `filter_missing` and
+            `eliminate_invalid_values`) on.
     """
 
+    cache_dir: str
+    cache_size: int
     cols_to_elim_invalid_values: List[str]
     cols_to_filter_missing: List[str]
     cols_to_impute_with_mean: List[str]
     cols_to_impute_with_mode: List[str]
+    cols_to_keep: List[str]
+    cols_to_memoize: List[str]
     cols_to_sort_by: List[str]
+    compact_dtypes: bool
+    fuse_steps: bool
+    json_mode: str
+    min_rows_per_worker: int
+    pushdown: bool
+    sort_memory_budget: int
+    spill_dir: str
+    validation_mode: str
+    workers: int
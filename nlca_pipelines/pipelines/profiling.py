@@ -0,0 +1,230 @@
+"""Instrumentation of pipeline steps.
+
+A pipeline calls the `before_step` and `after_step` methods of each of
+its hooks (see `BasePipeline.add_hook`) around every step it executes;
+when running in chunks, around every chunk. `StepProfiler` is a hook
+recording the cost of each step into a run report.
+"""
+
+import json
+import time
+import tracemalloc
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+import pandas as pd
+from typing_extensions import TypedDict
+
+try:
+    import resource
+except ImportError:  # pragma: no cover (not available on Windows)
+    resource = None  # type: ignore
+
+
+class StepHook:
+    """Base class of the step hooks; every method is a no-op."""
+
+    def before_step(self, name: str, df: Optional[pd.DataFrame]) -> None:
+        """Called before a step is applied.
+
+        Args:
+            name (str): Name of the step.
+            df (Optional[pd.DataFrame]): Input of the step (None when
+                the step pulls its input from a stream of chunks).
+        """
+
+    def after_step(self, name: str, df: Optional[pd.DataFrame]) -> None:
+        """Called after a step is applied.
+
+        Args:
+            name (str): Name of the step.
+            df (Optional[pd.DataFrame]): Output of the step (None when a
+                step producing a stream of chunks turns out to have no
+                more output, and empty when the step outputs statistics
+                rather than data, as the `fit_*` half of a two-pass
+                aggregate step does).
+        """
+
+
+class StepReportDict(TypedDict):
+    """Run report entry of a single step, summed over its calls.
+
+    Attributes:
+        calls (int): Number of times the step was called (once per
+            chunk when running in chunks).
+        cpu_seconds (float): Process CPU time, excluding nested steps.
+        df_memory_bytes (int): Memory usage of the step's output.
+        max_rss_bytes (Optional[int]): Peak resident set size of the
+            process after the step, if available.
+        memory_delta_bytes (Optional[int]): Change in traced memory
+            over the step, if memory is traced.
+        memory_peak_bytes (Optional[int]): Peak traced memory during
+            the step, if memory is traced.
+        name (str): Name of the step.
+        rows_in (int): Number of input rows.
+        rows_out (int): Number of output rows.
+        wall_seconds (float): Elapsed time, excluding nested steps.
+    """
+
+    calls: int
+    cpu_seconds: float
+    df_memory_bytes: int
+    max_rss_bytes: Optional[int]
+    memory_delta_bytes: Optional[int]
+    memory_peak_bytes: Optional[int]
+    name: str
+    rows_in: int
+    rows_out: int
+    wall_seconds: float
+
+
+def _max_rss() -> Optional[int]:
+    """Peak resident set size of the process (bytes), if available."""
+    if resource is None:
+        return None
+
+    # kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class StepProfiler(StepHook):
+    """Records time, rows and memory of each step of a pipeline run.
+
+    Steps may be nested (e.g. a streaming sort pulls chunks through the
+    preceding steps), in which case the time spent in nested steps is
+    only counted against them.
+
+    Args:
+        trace_memory (bool): Whether to trace Python memory allocations
+            with `tracemalloc` (which slows execution down noticeably).
+        deep (bool): Whether to measure the memory usage of the step
+            outputs deeply (i.e. including the contents of objects).
+
+    Examples:
+        >>> profiler = StepProfiler()
+        >>> pipeline.add_hook(profiler)
+        >>> df = pipeline.run(df)
+        >>> profiler.report()["steps"][0]["wall_seconds"]
+        0.0123
+    """
+
+    def __init__(self, trace_memory: bool = False, deep: bool = True) -> None:
+        self.trace_memory: bool = trace_memory
+        self.deep: bool = deep
+
+        self.steps: Dict[str, StepReportDict] = {}
+        self._stack: List[Dict[str, Any]] = []
+        self._started: Optional[float] = None
+        self._stopped: Optional[float] = None
+        # whether tracing was started by (so should be stopped by) us
+        self._tracing: bool = False
+
+    def before_step(self, name: str, df: Optional[pd.DataFrame]) -> None:
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        if self._started is None:
+            self._started = time.perf_counter()
+
+        frame: Dict[str, Any] = {
+            "name": name,
+            "rows_in": 0 if df is None else len(df),
+            "nested_wall": 0.0,
+            "nested_cpu": 0.0,
+            "memory": None,
+        }
+        if self.trace_memory:
+            frame["memory"] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        frame["wall"] = time.perf_counter()
+        frame["cpu"] = time.process_time()
+        self._stack.append(frame)
+
+    def after_step(self, name: str, df: Optional[pd.DataFrame]) -> None:
+        wall: float = time.perf_counter()
+        cpu: float = time.process_time()
+
+        frame: Dict[str, Any] = self._stack.pop()
+        wall -= frame["wall"]
+        cpu -= frame["cpu"]
+        if self._stack:
+            self._stack[-1]["nested_wall"] += wall
+            self._stack[-1]["nested_cpu"] += cpu
+
+        entry: StepReportDict = self.steps.setdefault(
+            name,
+            {
+                "calls": 0,
+                "cpu_seconds": 0.0,
+                "df_memory_bytes": 0,
+                "max_rss_bytes": None,
+                "memory_delta_bytes": None,
+                "memory_peak_bytes": None,
+                "name": name,
+                "rows_in": 0,
+                "rows_out": 0,
+                "wall_seconds": 0.0,
+            },
+        )
+        entry["wall_seconds"] += wall - frame["nested_wall"]
+        entry["cpu_seconds"] += cpu - frame["nested_cpu"]
+        entry["rows_in"] += frame["rows_in"]
+        entry["max_rss_bytes"] = _max_rss()
+        if df is not None:
+            entry["calls"] += 1
+            entry["rows_out"] += len(df)
+            entry["df_memory_bytes"] += int(df.memory_usage(deep=self.deep).sum())
+
+        if frame["memory"] is not None:
+            current, peak = tracemalloc.get_traced_memory()
+            entry["memory_delta_bytes"] = (entry["memory_delta_bytes"] or 0) + (
+                current - frame["memory"]
+            )
+            entry["memory_peak_bytes"] = max(entry["memory_peak_bytes"] or 0, peak)
+
+        if self._tracing and not self._stack:
+            # don't slow down anything but the steps
+            tracemalloc.stop()
+            self._tracing = False
+
+        self._stopped = time.perf_counter()
+
+    def report(self) -> Dict[str, Any]:
+        """The run report.
+
+        Returns:
+            Dict[str, Any]: The `steps` (a `StepReportDict` per step, in
+                the order they first completed) and the elapsed
+                `wall_seconds` from the first step starting to the last
+                one completing.
+        """
+        elapsed: float = 0.0
+        if self._started is not None and self._stopped is not None:
+            elapsed = self._stopped - self._started
+
+        return {
+            "steps": [dict(entry) for entry in self.steps.values()],
+            "wall_seconds": elapsed,
+        }
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """Serialize the run report to JSON.
+
+        Args:
+            path (Optional[str]): If given, also write the report to
+                this file.
+
+        Returns:
+            str: The JSON serialized report.
+        """
+        serialized: str = json.dumps(self.report(), indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(serialized)
+
+        return serialized
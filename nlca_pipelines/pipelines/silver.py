@@ -2,16 +2,46 @@
 # ^^^ Due to known pylint issue: https://github.com/pylint-dev/pylint/issues/5441
 
 from typing import (
-    Callable,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    Tuple,
 )
 
+import numpy as np
 import pandas as pd
 
-from ..validation import validate, values
+from ..validation import (
+    VALIDATION_CACHE,
+    validate,
+    values,
+)
+from ..validation.schema import to_silver_dtype
 from ._base import BasePipeline
+from ._json import (
+    decode_rows,
+    may_have_values,
+    normalize_rows,
+)
+from ._scope import (
+    AGGREGATE,
+    GLOBAL,
+    ROW_LOCAL,
+    scope,
+)
+from .accumulators import MeanAccumulator, ModeAccumulator
+from .bronze import SOURCE_ROW_PREFIX, source_columns
 from .options import SilverPipelineOptionsDict
+from .sorting import DEFAULT_MEMORY_BUDGET, external_sort
+
+# supported values for the `json_mode` option
+JSON_MODES: Tuple[str, ...] = ("bulk", "normalize")
+
+# supported values for the `validation_mode` option
+VALIDATION_MODES: Tuple[str, ...] = ("vectorized", "scalar")
 
 
 class SilverPipeline(BasePipeline):
@@ -38,6 +68,81 @@ class SilverPipeline(BasePipeline):
     ) -> None:
         super().__init__(steps=steps, options=options)
 
+        # throughput of the most recent bulk `parse_json`
+        self.decode_stats: Dict[str, Any] = {}
+
+    @property
+    def pushdown_plan(self) -> Tuple[Optional[List[str]], List[str]]:
+        """What `parse_json` can skip, given the configured options.
+
+        The projection is the union of the columns used by the steps
+        (the columns to filter, validate, memoize, impute and sort by)
+        and the `cols_to_keep` option; without the latter, every source
+        column is kept. Rows missing a value of `cols_to_filter_missing`
+        are rejected before decoding when `filter_missing` immediately
+        follows `parse_json` (no step in between could fill them in).
+        Setting the `pushdown` option to False disables both.
+
+        Returns:
+            Tuple[Optional[List[str]], List[str]]: The source columns to
+                decode (None for all of them) and the columns rows must
+                have a value of.
+        """
+        if not self.options.get("pushdown", True):
+            return None, []
+
+        columns: Optional[List[str]] = None
+        if "cols_to_keep" in self.options:
+            options: List[str] = [
+                "cols_to_keep",
+                "cols_to_filter_missing",
+                "cols_to_elim_invalid_values",
+                "cols_to_memoize",
+                "cols_to_impute_with_mean",
+                "cols_to_impute_with_mode",
+                "cols_to_sort_by",
+            ]
+            columns = list(
+                dict.fromkeys(
+                    col for opt in options for col in self.options.get(opt, [])
+                )
+            )
+
+        required: List[str] = []
+        steps: List[str] = self.steps + [""]
+        if (
+            "parse_json" in self.steps
+            and steps[steps.index("parse_json") + 1] == "filter_missing"
+        ):
+            # `id` is added by the bronze tier, rather than serialized
+            required = [
+                col
+                for col in self.options.get("cols_to_filter_missing", [])
+                if col != "id"
+            ]
+
+        return columns, required
+
+    def explain(self) -> str:
+        """Describe the execution plan, and what is pushed into decoding.
+
+        Returns:
+            str: As `BasePipeline.explain`, followed by the projection
+                and predicate pushed into `parse_json` (if any).
+        """
+        explained: str = super().explain()
+        if "parse_json" not in self.steps:
+            return explained
+
+        columns, required = self.pushdown_plan
+        if columns is not None:
+            explained += f"\nparse_json columns: {', '.join(columns)}"
+        if required:
+            explained += f"\nparse_json requires: {', '.join(required)}"
+
+        return explained
+
+    @scope(ROW_LOCAL)
     def parse_json(self, df: pd.DataFrame) -> pd.DataFrame:
         """Parse source data from the bronze-tier.
 
@@ -45,30 +150,93 @@ class SilverPipeline(BasePipeline):
         Here, we parse the serialized data into columns. Generally, this
         should be the first step in a silver pipeline.
 
+        By default the whole `source_row` column is decoded in one pass
+        (with `orjson` when installed) and the decoding throughput is
+        recorded in `self.decode_stats`. Setting the `json_mode` option
+        to `"normalize"` uses `pd.json_normalize` instead, which also
+        flattens nested objects.
+
+        Data from a bronze pipeline that ran `defer_serialize_rows`
+        (rather than `serialize_rows`) has no `source_row` column to
+        decode: its input columns are taken as they are (with strings as
+        Python objects, as decoding would give).
+
+        Only the source columns the pipeline uses are materialized, and
+        rows certain to be dropped by `filter_missing` are rejected by a
+        scan of their serialized text, before they are decoded (see
+        `pushdown_plan`). The number of rejected rows is recorded as
+        `skipped_rows` in `self.decode_stats`.
+
         Args:
             df (pd.DataFrame): Input data.
 
         Returns:
             pd.DataFrame: Output data, with source data parsed into
                 columns.
+
+        Raises:
+            ValueError: If the `json_mode` option is not recognized.
         """
+        mode: str = self.options.get("json_mode", "bulk")
+        if mode not in JSON_MODES:
+            raise ValueError(f"Unknown JSON mode '{mode}'.")
+
         # extract the input columns (to be dropped later)
         input_cols: List[str] = [col for col in df.columns.tolist() if col != "id"]
 
+        columns, required = self.pushdown_plan
+
         # parse the serialized JSON data
-        df = df.join(pd.json_normalize(df["source_row"].apply(eval)))
+        parsed: pd.DataFrame
+        deferred: List[str] = source_columns(df)
+        if deferred and "source_row" not in df.columns:
+            # input columns handed over in-process need no decoding
+            if columns is not None:
+                deferred = [
+                    col for col in deferred if col[len(SOURCE_ROW_PREFIX) :] in columns
+                ]
+            parsed = df[deferred].rename(
+                columns=lambda col: col[len(SOURCE_ROW_PREFIX) :]
+            )
+            parsed = parsed.astype(
+                {
+                    col: object
+                    for col, dtype in parsed.dtypes.items()
+                    if isinstance(dtype, pd.StringDtype)
+                }
+            )
+            self.decode_stats = {}
+        else:
+            skipped: int = 0
+            if required:
+                # rows certain to be filtered out are never decoded
+                kept: np.ndarray = may_have_values(df["source_row"], required)
+                skipped = len(df) - int(kept.sum())
+                df = df[kept]
+            if mode == "bulk":
+                parsed, self.decode_stats = decode_rows(df["source_row"], columns)
+            else:
+                parsed = normalize_rows(df["source_row"])
+                if columns is not None:
+                    parsed = parsed[[col for col in parsed.columns if col in columns]]
+                self.decode_stats = {}
+            if required:
+                self.decode_stats["skipped_rows"] = skipped
+        df = df.join(parsed)
 
         # drop the original input columns
         df = df.drop(input_cols, axis=1)
 
         return df
 
+    @scope(ROW_LOCAL)
     @validate(required_opts=["cols_to_filter_missing"])
     def filter_missing(self, df: pd.DataFrame) -> pd.DataFrame:
         """Filter invalid rows.
 
         Some rows **must** have values in order to be valid. Here, we
-        filter rows with missing/empty values.
+        filter rows with missing/empty values, with a single mask over
+        all of the relevant columns.
 
         Args:
             df (pd.DataFrame): Inpput data.
@@ -76,15 +244,11 @@ class SilverPipeline(BasePipeline):
         Returns:
             pd.DataFrame: Output data, having invalid rows filtered out.
         """
-        # filter out nulls
-        df = df.dropna(subset=self.options["cols_to_filter_missing"])
+        cols: pd.DataFrame = df[self.options["cols_to_filter_missing"]]
 
-        # filter out empty strings
-        for col in self.options["cols_to_filter_missing"]:
-            df = df[df[col] != ""]
-
-        return df
+        return df[(cols.notna() & (cols != "")).all(axis=1)]
 
+    @scope(ROW_LOCAL)
     @validate(required_opts=["cols_to_elim_invalid_values"])
     def eliminate_invalid_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """Eliminate invalid values.
@@ -92,31 +256,106 @@ class SilverPipeline(BasePipeline):
         If a value is not the correct type, replace it with a null
         value.
 
+        By default each column is validated in bulk through the
+        validator's `validate_series` method. Columns listed in the
+        `cols_to_memoize` option (low-cardinality columns, such as
+        categoricals and dates) are instead validated once per distinct
+        value through the process-wide `VALIDATION_CACHE`. Setting the
+        `validation_mode` option to `"scalar"` builds the pydantic
+        validator object for every cell, which is much slower but
+        useful as a reference implementation.
+
+        Unless the `compact_dtypes` option is False, validated columns
+        are then converted to their target dtype (see
+        `validation.schema.SILVER_DTYPES`): categorical columns to a
+        `pd.CategoricalDtype` over their domain, production volumes to
+        `Float64` and spud dates to `datetime64[ns]`.
+
         Args:
             df (pd.DataFrame): Input data.
 
         Returns:
             pd.DataFrame: Output data, with the relevant columns having
                 invalid values replaced with nulls.
+
+        Raises:
+            ValueError: If a column has no matching validator, or the
+                `validation_mode` option is not recognized.
         """
+        mode: str = self.options.get("validation_mode", "vectorized")
+        if mode not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode '{mode}'.")
+
+        memoized: List[str] = self.options.get("cols_to_memoize", [])
+        compact: bool = self.options.get("compact_dtypes", True)
+
         for col in self.options["cols_to_elim_invalid_values"]:
             # retrieve the validator object for the column
-            validator: Optional[Callable] = getattr(values, col.capitalize())
+            validator: Optional[Any] = getattr(values, col.capitalize(), None)
             if validator is None:
                 raise ValueError(f"No matching validator for '{col}'.")
 
-            # apply the validator to all rows
-            df[col] = df[col].apply(
-                lambda x: getattr(validator(**{col.lower(): x}), col.lower()),
-            )
+            if mode == "scalar":
+                # apply the validator to all rows
+                df[col] = df[col].apply(
+                    lambda x: getattr(validator(**{col.lower(): x}), col.lower()),
+                )
+            elif col in memoized:
+                # validate each distinct value once
+                df[col] = VALIDATION_CACHE.validate_series(df[col], validator)
+            else:
+                # validate the whole column at once
+                df[col] = validator.validate_series(df[col])
+
+            if compact:
+                df[col] = to_silver_dtype(df[col])
+
+        return df
+
+    def fit_impute_with_mean(self, df: pd.DataFrame) -> Dict[str, MeanAccumulator]:
+        """Accumulate the data needed to impute with the mean value.
+
+        Args:
+            df (pd.DataFrame): Input data (or a chunk of it).
+
+        Returns:
+            Dict[str, MeanAccumulator]: Running sum and count for each
+                of the relevant columns.
+        """
+        return {
+            col: MeanAccumulator().update(df[col])
+            for col in self.options["cols_to_impute_with_mean"]
+        }
+
+    def apply_impute_with_mean(
+        self, df: pd.DataFrame, accumulators: Dict[str, MeanAccumulator]
+    ) -> pd.DataFrame:
+        """Fill missing values with accumulated mean values.
+
+        Args:
+            df (pd.DataFrame): Input data (or a chunk of it).
+            accumulators (Dict[str, MeanAccumulator]): Accumulated over
+                all of the data.
+
+        Returns:
+            pd.DataFrame: Output data, with missing values imputed with
+                the mean for the relevant columns.
+        """
+        for col in self.options["cols_to_impute_with_mean"]:
+            mean: Any = accumulators[col].value
+            if mean is not None:
+                df[col] = df[col].fillna(mean)
 
         return df
 
+    @scope(AGGREGATE)
     def impute_with_mean(self, df: pd.DataFrame) -> pd.DataFrame:
         """Impute missing values with the mean value.
 
         Replace missing values in each column with the mean value of
-        that column.
+        that column. When running in chunks, the means are accumulated
+        over all chunks (`fit_impute_with_mean`) before any chunk is
+        filled (`apply_impute_with_mean`).
 
         Args:
             df (pd.DataFrame): Input data.
@@ -130,11 +369,51 @@ class SilverPipeline(BasePipeline):
 
         return df
 
+    def fit_impute_with_mode(self, df: pd.DataFrame) -> Dict[str, ModeAccumulator]:
+        """Accumulate the data needed to impute with the mode value.
+
+        Args:
+            df (pd.DataFrame): Input data (or a chunk of it).
+
+        Returns:
+            Dict[str, ModeAccumulator]: Value counts for each of the
+                relevant columns.
+        """
+        return {
+            col: ModeAccumulator().update(df[col])
+            for col in self.options["cols_to_impute_with_mode"]
+        }
+
+    def apply_impute_with_mode(
+        self, df: pd.DataFrame, accumulators: Dict[str, ModeAccumulator]
+    ) -> pd.DataFrame:
+        """Fill missing values with accumulated mode values.
+
+        Args:
+            df (pd.DataFrame): Input data (or a chunk of it).
+            accumulators (Dict[str, ModeAccumulator]): Accumulated over
+                all of the data.
+
+        Returns:
+            pd.DataFrame: Output data, with missing values imputed with
+                the mode for the relevant columns.
+        """
+        for col in self.options["cols_to_impute_with_mode"]:
+            mode: Any = accumulators[col].value
+            if mode is not None:
+                df[col] = df[col].fillna(mode)
+
+        return df
+
+    @scope(AGGREGATE)
     def impute_with_mode(self, df: pd.DataFrame) -> pd.DataFrame:
         """Impute missing values with the mode value.
 
         Replace missing values in each column with the mode value of
-        that column (the most common value).
+        that column (the most common value). When running in chunks,
+        the value counts are accumulated over all chunks
+        (`fit_impute_with_mode`) before any chunk is filled
+        (`apply_impute_with_mode`).
 
         Args:
             df (pd.DataFrame): Input data.
@@ -143,14 +422,15 @@ class SilverPipeline(BasePipeline):
             pd.DataFrame: Output data, with missing values imputed with
                 the mode for the relevant columns.
         """
-        for col in self.options["cols_to_impute_with_mode"]:
-            df[col] = df[col].fillna(df[col].mode()[0])
-
-        return df
+        return self.apply_impute_with_mode(df, self.fit_impute_with_mode(df))
 
+    @scope(GLOBAL)
     def sort(self, df: pd.DataFrame) -> pd.DataFrame:
         """Sort by the values.
 
+        The sort is stable: rows with equal values keep their input
+        order. When running in chunks, `stream_sort` is used instead.
+
         Args:
             df (pd.DataFrame): Input data.
 
@@ -158,4 +438,27 @@ class SilverPipeline(BasePipeline):
             pd.DataFrame: Output data, sorted in ascending order by the
                 given columns.
         """
-        return df.sort_values(by=self.options["cols_to_sort_by"])
+        return df.sort_values(by=self.options["cols_to_sort_by"], kind="stable")
+
+    def stream_sort(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Sort a stream of chunks, without holding them all in memory.
+
+        Chunks are buffered in memory up to the `sort_memory_budget`
+        option (bytes); beyond that, the buffered data is sorted and
+        spilled to disk (under the `spill_dir` option), and the spilled
+        runs are merged into sorted chunks. The output is identical to
+        that of `sort` on all of the data.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Input data, in chunks.
+
+        Yields:
+            pd.DataFrame: Output data, sorted in ascending order by the
+                given columns, in chunks.
+        """
+        yield from external_sort(
+            chunks,
+            by=self.options["cols_to_sort_by"],
+            memory_budget=self.options.get("sort_memory_budget", DEFAULT_MEMORY_BUDGET),
+            spill_dir=self.options.get("spill_dir"),
+        )
@@ -0,0 +1,255 @@
+"""External merge sort of a stream of dataframe chunks.
+
+Incoming chunks are buffered until they exceed a memory budget, at
+which point the buffer is sorted and spilled to disk as a "run" (a
+sequence of sorted blocks). The runs are then merged, a block per run
+at a time, into sorted output chunks. If everything fits within the
+budget, nothing is spilled and the data is sorted in memory.
+"""
+
+import os
+from tempfile import TemporaryDirectory
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
+
+# default memory budget for buffered chunks (bytes)
+DEFAULT_MEMORY_BUDGET: int = 256 * 1024**2
+
+
+def _sort(df: pd.DataFrame, by: List[str]) -> pd.DataFrame:
+    """Stable sort, with missing values last.
+
+    Args:
+        df (pd.DataFrame): Data to sort.
+        by (List[str]): Columns to sort by, in ascending order.
+
+    Returns:
+        pd.DataFrame: Sorted data.
+    """
+    return df.sort_values(by=by, kind="stable", na_position="last")
+
+
+def _key_order(key: Tuple[Any, ...]) -> Tuple[Tuple[bool, Any], ...]:
+    """Sort order of a key, with missing values last.
+
+    Args:
+        key (Tuple[Any, ...]): Values of the sort columns for one row.
+
+    Returns:
+        Tuple[Tuple[bool, Any], ...]: Comparable representation.
+    """
+    return tuple((True, None) if pd.isna(v) else (False, v) for v in key)
+
+
+def _before(df: pd.DataFrame, by: List[str], key: Tuple[Any, ...]) -> int:
+    """Number of leading rows of sorted data that sort strictly before a key.
+
+    Args:
+        df (pd.DataFrame): Data sorted by `by`, with missing values last.
+        by (List[str]): Columns the data is sorted by.
+        key (Tuple[Any, ...]): Values of the sort columns.
+
+    Returns:
+        int: Number of rows sorting before `key`.
+    """
+    less: np.ndarray = np.zeros(len(df), dtype=bool)
+    equal: np.ndarray = np.ones(len(df), dtype=bool)
+    for col, k in zip(by, key):
+        values: pd.Series = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype) and not pd.isna(k):
+            # compare in category order, as `sort_values` does
+            k = values.cat.categories.get_loc(k)
+            values = values.cat.codes.where(values.notna())
+        if pd.isna(k):
+            col_less, col_equal = values.notna(), values.isna()
+        else:
+            col_less = (values < k).fillna(False)
+            col_equal = (values == k).fillna(False)
+
+        less |= equal & col_less.to_numpy(dtype=bool)
+        equal &= col_equal.to_numpy(dtype=bool)
+
+    return int(less.sum())
+
+
+class _Run:
+    """A sorted run spilled to disk as a sequence of blocks.
+
+    Args:
+        paths (List[str]): Files holding the blocks, in order.
+    """
+
+    def __init__(self, paths: List[str]) -> None:
+        self.paths: List[str] = paths
+        self.buffer: pd.DataFrame = pd.DataFrame()
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether every block has been loaded into the buffer."""
+        return not self.paths
+
+    def load(self) -> None:
+        """Append the next block to the buffer."""
+        block: pd.DataFrame = pd.read_pickle(self.paths.pop(0))
+        self.buffer = pd.concat([self.buffer, block]) if len(self.buffer) else block
+
+    def take(self, n: int) -> pd.DataFrame:
+        """Remove and return the first rows of the buffer.
+
+        Args:
+            n (int): Number of rows.
+
+        Returns:
+            pd.DataFrame: The removed rows.
+        """
+        head, self.buffer = self.buffer.iloc[:n], self.buffer.iloc[n:]
+
+        return head
+
+
+def _spill(
+    df: pd.DataFrame, by: List[str], spill_dir: str, run: int, chunksize: int
+) -> _Run:
+    """Sort data and spill it to disk as a run of blocks.
+
+    Args:
+        df (pd.DataFrame): Data to spill.
+        by (List[str]): Columns to sort by.
+        spill_dir (str): Directory for the blocks.
+        run (int): Number of the run.
+        chunksize (int): Rows per block.
+
+    Returns:
+        _Run: The spilled run.
+    """
+    df = _sort(df, by)
+
+    paths: List[str] = []
+    for start in range(0, len(df), chunksize):
+        path: str = os.path.join(spill_dir, f"run-{run}-{len(paths)}.pkl")
+        df.iloc[start : start + chunksize].to_pickle(path)
+        paths.append(path)
+
+    return _Run(paths)
+
+
+def _merge(runs: List[_Run], by: List[str], chunksize: int) -> Iterator[pd.DataFrame]:
+    """K-way merge of sorted runs.
+
+    Rather than merging row by row, each round emits (in bulk) every
+    buffered row sorting before the smallest "last buffered key" of the
+    runs that still have blocks on disk; those rows can't be preceded
+    by anything not yet loaded. The run(s) holding that smallest key
+    then load their next block.
+
+    Args:
+        runs (List[_Run]): Sorted runs, in input order.
+        by (List[str]): Columns the runs are sorted by.
+        chunksize (int): Rows per output chunk.
+
+    Yields:
+        pd.DataFrame: Sorted output, in chunks.
+    """
+    pending: List[pd.DataFrame] = []
+    pending_rows: int = 0
+    while True:
+        # runs with blocks left on disk bound what can safely be emitted
+        for run in runs:
+            while not run.exhausted and run.buffer.empty:
+                run.load()
+        open_runs: List[_Run] = [run for run in runs if not run.exhausted]
+
+        batch: List[pd.DataFrame]
+        if not open_runs:
+            # everything is loaded: emit all that is left
+            batch = [run.take(len(run.buffer)) for run in runs]
+        else:
+            lasts: List[Tuple[Any, ...]] = [
+                tuple(run.buffer[by].iloc[-1]) for run in open_runs
+            ]
+            frontier: Tuple[Any, ...] = min(lasts, key=_key_order)
+            batch = [
+                run.take(_before(run.buffer, by, frontier))
+                for run in runs
+                if len(run.buffer)
+            ]
+
+            # load the next block of the runs holding the frontier
+            for run, last in zip(open_runs, lasts):
+                if _key_order(last) == _key_order(frontier):
+                    run.load()
+
+        batch = [rows for rows in batch if len(rows)]
+        if batch:
+            pending.append(_sort(pd.concat(batch), by))
+            pending_rows += len(pending[-1])
+
+        while pending_rows >= chunksize or (not open_runs and pending_rows):
+            merged: pd.DataFrame = pd.concat(pending)
+            yield merged.iloc[:chunksize].copy()
+            pending = [merged.iloc[chunksize:]]
+            pending_rows = len(pending[0])
+
+        if not open_runs:
+            return
+
+
+def external_sort(
+    chunks: Iterable[pd.DataFrame],
+    by: List[str],
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    spill_dir: Optional[str] = None,
+) -> Iterator[pd.DataFrame]:
+    """Sort a stream of chunks, spilling to disk beyond a memory budget.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Input data, in chunks.
+        by (List[str]): Columns to sort by, in ascending order.
+        memory_budget (int): Maximum size (bytes) of the chunks buffered
+            in memory before they are spilled to disk.
+        spill_dir (Optional[str]): Directory to spill to (the system
+            default temporary directory if None).
+
+    Yields:
+        pd.DataFrame: Sorted output, in chunks as large as the largest
+            input chunk.
+    """
+    with TemporaryDirectory(dir=spill_dir) as tmp_dir:
+        runs: List[_Run] = []
+        buffered: List[pd.DataFrame] = []
+        buffered_bytes: int = 0
+        chunksize: int = 1
+
+        for chunk in chunks:
+            chunksize = max(chunksize, len(chunk))
+            buffered.append(chunk)
+            buffered_bytes += int(chunk.memory_usage(deep=True).sum())
+
+            if buffered_bytes > memory_budget:
+                runs.append(
+                    _spill(pd.concat(buffered), by, tmp_dir, len(runs), chunksize)
+                )
+                buffered, buffered_bytes = [], 0
+
+        if not runs:
+            # fast path: everything fits in memory
+            if buffered:
+                df: pd.DataFrame = _sort(pd.concat(buffered), by)
+                for start in range(0, max(len(df), 1), chunksize):
+                    yield df.iloc[start : start + chunksize].copy()
+            return
+
+        if buffered:
+            runs.append(_spill(pd.concat(buffered), by, tmp_dir, len(runs), chunksize))
+        del buffered
+
+        yield from _merge(runs, by, chunksize)
@@ -0,0 +1,22 @@
+CREATE EXTERNAL TABLE IF NOT EXISTS `silver`.`wells_parquet` (
+    `id` string,
+    `api10` string,
+    `direction` string,
+    `wellname` string,
+    `welltype` string,
+    `operator` string,
+    `basin` string,
+    `subbasin` string,
+    `state` string,
+    `county` string,
+    `spuddate` date,
+    `cum12moil` double,
+    `cum12mgas` double,
+    `cum12mwater` double
+)
+COMMENT "silver wells"
+STORED AS PARQUET
+LOCATION 's3://nlca-silver/parquet/'
+TBLPROPERTIES (
+    'classification' = 'parquet'
+);
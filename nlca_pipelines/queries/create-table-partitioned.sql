@@ -0,0 +1,25 @@
+CREATE EXTERNAL TABLE IF NOT EXISTS `silver`.`wells_partitioned` (
+    `id` string,
+    `api10` string,
+    `direction` string,
+    `wellname` string,
+    `welltype` string,
+    `operator` string,
+    `subbasin` string,
+    `state` string,
+    `county` string,
+    `spuddate` date,
+    `cum12moil` double,
+    `cum12mgas` double,
+    `cum12mwater` double
+)
+COMMENT "silver wells, partitioned by basin and spud year"
+PARTITIONED BY (
+    `basin` string,
+    `spud_year` int
+)
+STORED AS PARQUET
+LOCATION 's3://nlca-silver/partitioned/'
+TBLPROPERTIES (
+    'classification' = 'parquet'
+);
@@ -0,0 +1,6 @@
+SELECT      api10,
+            cum12moil
+FROM        silver.wells_parquet
+WHERE       welltype = 'OIL'
+ORDER BY    cum12moil DESC
+LIMIT       5;
@@ -0,0 +1,277 @@
+"""Local file source of the input well file.
+
+`LocalFileClient` reads an input file from local disk, as
+`GoogleDriveClient` reads it from Google Drive (with the same
+`io_options` and source metadata), so the `main` command can run
+offline and be benchmarked without any network time.
+
+The file is memory-mapped rather than read into memory: the parser
+reads the pages of the file straight from the operating system's page
+cache, so there is never a full in-memory copy of its text. With the
+pyarrow engine, each part of the file is handed to the pyarrow CSV
+parser as a zero-copy slice of pyarrow's own map of the file.
+
+The file can be split into byte ranges ending at line boundaries (see
+`byte_ranges`), which are parsed concurrently. Splitting assumes that
+no quoted value spans lines, which holds for the well file.
+"""
+
+import io
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import pandas as pd
+import pyarrow as pa  # type: ignore
+import pyarrow.csv as pacsv  # type: ignore
+
+# `pd.read_csv` options set per range, rather than from the `io_options`
+_RANGE_OPTIONS: List[str] = ["engine", "header", "names"]
+
+
+def _timestamp(seconds: float) -> str:
+    """ISO 8601 representation of a file timestamp (in UTC)."""
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).isoformat()
+
+
+def _header_end(mapped: mmap.mmap) -> int:
+    """Offset of the first byte after the header line."""
+    end: int = mapped.find(b"\n")
+
+    return len(mapped) if end == -1 else end + 1
+
+
+def byte_ranges(path: str, parts: int) -> List[Tuple[int, int]]:
+    """Split the rows of a CSV file into byte ranges of similar sizes.
+
+    Each range starts at the beginning of a line and ends after a
+    newline (or at the end of the file); the header line is excluded.
+
+    Args:
+        path (str): Path of the file.
+        parts (int): Number of ranges to split the rows into (fewer are
+            returned if the file has fewer lines).
+
+    Returns:
+        List[Tuple[int, int]]: Start (inclusive) and end (exclusive)
+            offsets of each range, in file order.
+
+    Raises:
+        ValueError: If `parts` is not positive.
+    """
+    if parts < 1:
+        raise ValueError("The number of parts must be positive.")
+    if not os.path.getsize(path):
+        return []
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        start: int = _header_end(m)
+        size: int = len(m)
+        step: int = max(1, (size - start) // parts)
+
+        bounds: List[int] = [start]
+        for target in range(start + step, size, step):
+            if target <= bounds[-1]:
+                continue
+            newline: int = m.find(b"\n", target - 1)
+            if newline == -1:
+                break
+            bounds.append(newline + 1)
+        if bounds[-1] < size:
+            bounds.append(size)
+
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+class _RangeReader(io.RawIOBase):
+    """Binary file-like view of a byte range of a memory map.
+
+    Args:
+        mapped (mmap.mmap): Memory map of the file.
+        start (int): First byte of the range.
+        end (int): Byte after the range.
+    """
+
+    def __init__(self, mapped: mmap.mmap, start: int, end: int) -> None:
+        super().__init__()
+        self.mapped: mmap.mmap = mapped
+        self.position: int = start
+        self.end: int = end
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        n: int = max(0, min(len(buffer), self.end - self.position))
+        buffer[:n] = self.mapped[self.position : self.position + n]
+        self.position += n
+
+        return n
+
+
+class LocalFileClient:
+    """Client reading an input file from local disk.
+
+    Args:
+        path (str): Path of the CSV file.
+        io_options (Optional[Dict[str, Any]]): Options of `pd.read_csv`
+            (see `ingestion.read_options`); the `pyarrow` engine parses
+            the file with the pyarrow CSV reader.
+
+    Attributes:
+        source_created_at (str): When the file was created (its status
+            change time, in UTC).
+        source_filename (str): Name of the file.
+        source_updated_at (str): When the file was last modified (in
+            UTC).
+        source_uri (str): `file://` URI of the file.
+    """
+
+    def __init__(self, path: str, io_options: Optional[Dict[str, Any]] = None) -> None:
+        self.path: str = os.path.abspath(path)
+        self.io_options: Dict[str, Any] = dict(io_options or {})
+
+        stat: os.stat_result = os.stat(self.path)
+        self.source_created_at: str = _timestamp(stat.st_ctime)
+        self.source_filename: str = os.path.basename(self.path)
+        self.source_updated_at: str = _timestamp(stat.st_mtime)
+        self.source_uri: str = Path(self.path).as_uri()
+
+    def columns(self) -> List[str]:
+        """Names of the columns, from the header line.
+
+        Returns:
+            List[str]: The column names.
+        """
+        header: pd.DataFrame = pd.read_csv(
+            self.path, nrows=0, encoding=self.io_options.get("encoding", "utf-8")
+        )
+
+        return [str(col) for col in header.columns]
+
+    def _categorical_columns(self) -> List[str]:
+        """Columns read as categories (see `ingestion.read_dtypes`)."""
+        dtype: Any = self.io_options.get("dtype")
+        if not isinstance(dtype, dict):
+            return []
+
+        return [col for col, col_dtype in dtype.items() if col_dtype == "category"]
+
+    def _read_range(
+        self, mapped: mmap.mmap, names: List[str], byte_range: Tuple[int, int]
+    ) -> pd.DataFrame:
+        """Parse a byte range of the file."""
+        start, end = byte_range
+        if self.io_options.get("engine") == "pyarrow":
+            categorical: List[str] = self._categorical_columns()
+            usecols: List[str] = self.io_options.get("usecols", names)
+            with pa.memory_map(self.path) as source:
+                # zero-copy slice of pyarrow's own map of the file
+                source.seek(start)
+                table: Any = pacsv.read_csv(
+                    pa.BufferReader(source.read_buffer(end - start)),
+                    read_options=pacsv.ReadOptions(column_names=names),
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={
+                            name: (
+                                pa.dictionary(pa.int32(), pa.string())
+                                if name in categorical
+                                else pa.string()
+                            )
+                            for name in names
+                        },
+                        include_columns=[name for name in names if name in usecols],
+                        strings_can_be_null=False,
+                        quoted_strings_can_be_null=False,
+                    ),
+                )
+
+            return table.to_pandas(
+                types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get
+            )
+
+        options: Dict[str, Any] = {
+            k: v for k, v in self.io_options.items() if k not in _RANGE_OPTIONS
+        }
+
+        return pd.read_csv(
+            _RangeReader(mapped, start, end),
+            header=None,
+            names=names,
+            engine="c",
+            **options,
+        )
+
+    def read(self, parts: int = 1, workers: int = 1) -> pd.DataFrame:
+        """Read the whole file.
+
+        Args:
+            parts (int): Number of byte ranges the file is split into.
+            workers (int): Number of byte ranges parsed at once (by
+                threads; both parsers release the GIL).
+
+        Returns:
+            pd.DataFrame: The data, with a `RangeIndex`.
+        """
+        names: List[str] = self.columns()
+        ranges: List[Tuple[int, int]] = byte_ranges(self.path, parts)
+        if not ranges:
+            return pd.read_csv(self.path, **self.io_options)
+
+        with open(self.path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            frames: List[pd.DataFrame]
+            if workers > 1 and len(ranges) > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    frames = list(
+                        executor.map(
+                            lambda r: self._read_range(mapped, names, r), ranges
+                        )
+                    )
+            else:
+                frames = [self._read_range(mapped, names, r) for r in ranges]
+
+        # each range has categories of its own, which concatenate to objects
+        df: pd.DataFrame = pd.concat(frames, ignore_index=True)
+
+        return df.astype({col: "category" for col in self._categorical_columns()})
+
+    def iter_read(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Stream the file in chunks, from a memory map.
+
+        The chunks are parsed with the C parser (the pyarrow one can't
+        stream), one at a time, so only the current chunk is held in
+        memory.
+
+        Args:
+            chunksize (int): Maximum number of rows per chunk.
+
+        Yields:
+            pd.DataFrame: Consecutive chunks of the file; an empty file
+                yields one empty chunk.
+        """
+        options: Dict[str, Any] = {
+            k: v for k, v in self.io_options.items() if k != "engine"
+        }
+
+        empty: bool = True
+        with pd.read_csv(
+            self.path, engine="c", memory_map=True, chunksize=chunksize, **options
+        ) as reader:
+            for chunk in reader:
+                empty = False
+                yield chunk
+
+        if empty:
+            yield pd.read_csv(self.path, nrows=0, **options)
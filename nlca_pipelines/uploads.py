@@ -0,0 +1,666 @@
+"""Streaming multipart uploads of the outputs to S3.
+
+A dataframe is serialized (as CSV or Parquet) straight into a
+`MultipartWriter`, which uploads each part of the object as soon as it
+is full, while the rest of the data is still being serialized; only a
+few parts are held in memory at a time. The objects of several tiers
+are serialized and uploaded concurrently (see `upload_frames`), their
+parts by a shared pool of threads.
+
+Any client with the S3 API of `boto3` can be used: an S3-compatible
+server (e.g. `moto_server` or MinIO, through the client's
+`endpoint_url`), or `LocalS3Client`, a stand-in storing the objects in a
+local directory, so uploads can be tested (and benchmarked, with a
+simulated latency) offline.
+
+The outputs of the `main` command (see `write_outputs` and
+`write_gold`) are written either to local disk or through such a client
+(see `create_s3_client`).
+"""
+
+import io
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import (
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+)
+from types import SimpleNamespace, TracebackType
+from typing import (
+    IO,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Type,
+    cast,
+)
+
+import boto3
+import pandas as pd
+from typing_extensions import TypedDict
+
+from .parquet import (
+    BRONZE_COLUMNS,
+    SILVER_COLUMNS,
+    write_parquet,
+)
+from .pipelines import materialize_source_row
+
+# minimum size of every part of a multipart upload but the last (S3 limit)
+MIN_PART_SIZE: int = 5 * 1024**2
+
+# default size of the parts of a multipart upload
+PART_SIZE: int = 8 * 1024**2
+
+# maximum number of parts of an object being uploaded at once
+MAX_PENDING_PARTS: int = 4
+
+
+class NoSuchKey(Exception):
+    """The requested object doesn't exist (as raised by `boto3`)."""
+
+
+class LocalS3Client:
+    """Stand-in for an S3 client, storing objects in a local directory.
+
+    Implements the subset of the `boto3` S3 client API used by the
+    outputs: objects are files under `root/<bucket>/<key>`, and the
+    parts of multipart uploads are files under `root/.multipart/`. It is
+    thread-safe.
+
+    Args:
+        root (str): Directory of the buckets (created if it doesn't
+            exist).
+        latency (float): Seconds every request waits, to simulate the
+            round trip to S3.
+        min_part_size (int): Minimum size of every part of a multipart
+            upload but the last, checked when completing the upload.
+
+    Attributes:
+        exceptions (SimpleNamespace): Exceptions raised by the client,
+            as on a `boto3` client.
+        requests (Dict[str, int]): Number of requests made, by method.
+    """
+
+    exceptions: SimpleNamespace = SimpleNamespace(NoSuchKey=NoSuchKey)
+
+    def __init__(
+        self, root: str, latency: float = 0.0, min_part_size: int = MIN_PART_SIZE
+    ) -> None:
+        self.root: str = root
+        self.latency: float = latency
+        self.min_part_size: int = min_part_size
+        self.requests: Dict[str, int] = {}
+        self._lock: threading.Lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _request(self, method: str) -> None:
+        """Count a request, and wait for the simulated round trip."""
+        with self._lock:
+            self.requests[method] = self.requests.get(method, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _path(self, bucket: str, key: str) -> str:
+        """Path of the file of an object."""
+        return os.path.join(self.root, bucket, *key.split("/"))
+
+    def _parts_dir(self, upload_id: str) -> str:
+        """Directory of the parts of a multipart upload."""
+        return os.path.join(self.root, ".multipart", upload_id)
+
+    def put_object(self, Bucket: str, Key: str, Body: Any) -> Dict[str, Any]:
+        """Write an object."""
+        # pylint: disable=invalid-name
+        self._request("put_object")
+        path: str = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(Body if isinstance(Body, (bytes, bytearray)) else Body.read())
+
+        return {}
+
+    def get_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        """Read an object."""
+        # pylint: disable=invalid-name
+        self._request("get_object")
+        path: str = self._path(Bucket, Key)
+        if not os.path.isfile(path):
+            raise NoSuchKey(f"s3://{Bucket}/{Key}")
+        with open(path, "rb") as f:
+            return {"Body": io.BytesIO(f.read())}
+
+    def list_objects_v2(
+        self,
+        Bucket: str,
+        Prefix: str = "",
+        ContinuationToken: str = "",
+        MaxKeys: int = 1000,
+    ) -> Dict[str, Any]:
+        """List the objects whose key starts with a prefix, in key order.
+
+        At most `MaxKeys` objects are listed at once; the listing goes
+        on from the `NextContinuationToken` of a truncated response.
+        """
+        # pylint: disable=invalid-name
+        self._request("list_objects_v2")
+        bucket_dir: str = os.path.join(self.root, Bucket)
+        keys: List[str] = sorted(
+            os.path.relpath(os.path.join(path, name), bucket_dir).replace(os.sep, "/")
+            for path, _, names in os.walk(bucket_dir)
+            for name in names
+        )
+        keys = [
+            key for key in keys if key.startswith(Prefix) and key > ContinuationToken
+        ]
+        response: Dict[str, Any] = {
+            "IsTruncated": len(keys) > MaxKeys,
+            "KeyCount": min(len(keys), MaxKeys),
+        }
+        if keys:
+            response["Contents"] = [
+                {"Key": key, "Size": os.path.getsize(self._path(Bucket, key))}
+                for key in keys[:MaxKeys]
+            ]
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = keys[MaxKeys - 1]
+
+        return response
+
+    def delete_objects(self, Bucket: str, Delete: Dict[str, Any]) -> Dict[str, Any]:
+        """Delete objects (missing ones are ignored, as by S3)."""
+        # pylint: disable=invalid-name
+        self._request("delete_objects")
+        bucket_dir: str = os.path.join(self.root, Bucket)
+        for obj in Delete["Objects"]:
+            path: str = self._path(Bucket, obj["Key"])
+            if os.path.isfile(path):
+                os.remove(path)
+            # S3 has no directories: remove the ones left empty
+            path = os.path.dirname(path)
+            while path != bucket_dir and os.path.isdir(path) and not os.listdir(path):
+                os.rmdir(path)
+                path = os.path.dirname(path)
+
+        return {"Deleted": [{"Key": obj["Key"]} for obj in Delete["Objects"]]}
+
+    def create_multipart_upload(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        """Start a multipart upload."""
+        # pylint: disable=invalid-name,unused-argument
+        self._request("create_multipart_upload")
+        upload_id: str = uuid.uuid4().hex
+        os.makedirs(self._parts_dir(upload_id))
+
+        return {"UploadId": upload_id}
+
+    def upload_part(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, Bucket: str, Key: str, PartNumber: int, UploadId: str, Body: bytes
+    ) -> Dict[str, Any]:
+        """Upload a part of a multipart upload."""
+        # pylint: disable=invalid-name,unused-argument
+        self._request("upload_part")
+        with open(os.path.join(self._parts_dir(UploadId), str(PartNumber)), "wb") as f:
+            f.write(Body)
+
+        return {"ETag": f'"{UploadId}-{PartNumber}"'}
+
+    def complete_multipart_upload(
+        self, Bucket: str, Key: str, UploadId: str, MultipartUpload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Assemble the parts of a multipart upload into the object.
+
+        Raises:
+            ValueError: If the parts aren't numbered consecutively from
+                1, or a part but the last is too small.
+        """
+        # pylint: disable=invalid-name
+        self._request("complete_multipart_upload")
+        numbers: List[int] = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        if numbers != list(range(1, len(numbers) + 1)):
+            raise ValueError(f"Invalid part numbers: {numbers}.")
+
+        parts_dir: str = self._parts_dir(UploadId)
+        paths: List[str] = [os.path.join(parts_dir, str(n)) for n in numbers]
+        if any(os.path.getsize(p) < self.min_part_size for p in paths[:-1]):
+            raise ValueError("A part but the last is smaller than the minimum.")
+
+        path: str = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            for part in paths:
+                with open(part, "rb") as p:
+                    shutil.copyfileobj(p, f)
+        shutil.rmtree(parts_dir)
+
+        return {}
+
+    def abort_multipart_upload(
+        self, Bucket: str, Key: str, UploadId: str
+    ) -> Dict[str, Any]:
+        """Discard the parts of a multipart upload."""
+        # pylint: disable=invalid-name,unused-argument
+        self._request("abort_multipart_upload")
+        shutil.rmtree(self._parts_dir(UploadId), ignore_errors=True)
+
+        return {}
+
+
+class MultipartWriter(io.RawIOBase):  # pylint: disable=too-many-instance-attributes
+    """Binary file-like object uploading what is written to an S3 object.
+
+    Written bytes are buffered until a part is full, which is then
+    uploaded (on the `executor`, if given, while writing goes on); at
+    most `MAX_PENDING_PARTS` parts are in flight. Closing the writer
+    uploads the last part and completes the upload; an object smaller
+    than a part is uploaded with a single `put_object` instead. Leaving
+    a `with` block on an exception aborts the upload.
+
+    Args:
+        client (Any): S3 client.
+        bucket (str): Name of the bucket.
+        key (str): Key of the object.
+        part_size (int): Size of the parts (at least `MIN_PART_SIZE`
+            for S3).
+        executor (Optional[Executor]): Executor uploading the parts
+            (parts are uploaded by the writing thread if None).
+
+    Raises:
+        ValueError: If the part size is not positive.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        client: Any,
+        bucket: str,
+        key: str,
+        part_size: int = PART_SIZE,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        super().__init__()
+        if part_size < 1:
+            raise ValueError("The part size must be positive.")
+
+        self.client: Any = client
+        self.bucket: str = bucket
+        self.key: str = key
+        self.part_size: int = part_size
+        self.executor: Optional[Executor] = executor
+
+        self.upload_id: Optional[str] = None
+        self.size: int = 0
+        self._buffer: bytearray = bytearray()
+        self._parts: List[Future] = []
+        self._aborted: bool = False
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.size
+
+    def write(self, b: Any) -> int:  # type: ignore[override]
+        self._checkClosed()
+        data: memoryview = memoryview(b).cast("B")
+        self._buffer += data
+        self.size += len(data)
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+
+        return len(data)
+
+    def _put_part(self, number: int, body: bytes) -> Dict[str, Any]:
+        """Upload a part, returning its entry in the completed upload."""
+        response: Dict[str, Any] = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            PartNumber=number,
+            UploadId=self.upload_id,
+            Body=body,
+        )
+
+        return {"ETag": response["ETag"], "PartNumber": number}
+
+    def _upload_part(self, body: bytes) -> None:
+        """Upload the next part (starting the multipart upload)."""
+        if self.upload_id is None:
+            self.upload_id = self.client.create_multipart_upload(
+                Bucket=self.bucket, Key=self.key
+            )["UploadId"]
+
+        number: int = len(self._parts) + 1
+        future: Future = Future()
+        if self.executor is None:
+            future.set_result(self._put_part(number, body))
+        else:
+            # bound the parts held in memory
+            pending: List[Future] = [part for part in self._parts if not part.done()]
+            if len(pending) >= MAX_PENDING_PARTS:
+                pending[0].result()
+            future = self.executor.submit(self._put_part, number, body)
+        self._parts.append(future)
+
+    def abort(self) -> None:
+        """Abort the upload, discarding the parts already uploaded."""
+        if self._aborted:
+            return
+        self._aborted = True
+        for part in self._parts:
+            part.exception()
+        if self.upload_id is not None:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self.upload_id
+            )
+        super().close()
+
+    def close(self) -> None:
+        """Upload what remains, and complete the upload."""
+        if self.closed or self._aborted:
+            return
+
+        try:
+            if self.upload_id is None:
+                self.client.put_object(
+                    Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer)
+                )
+            else:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+                self.client.complete_multipart_upload(
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    UploadId=self.upload_id,
+                    MultipartUpload={"Parts": [part.result() for part in self._parts]},
+                )
+        except BaseException:
+            self.abort()
+            raise
+        finally:
+            self._buffer = bytearray()
+
+        super().close()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class UploadDict(TypedDict, total=False):
+    """An object to upload.
+
+    Attributes:
+        bucket (str): Name of the bucket.
+        columns (Dict[str, str]): Athena type of each column, if they
+            should be converted (Parquet only, see `write_parquet`).
+        df (pd.DataFrame): Data to upload.
+        key (str): Key of the object.
+    """
+
+    bucket: str
+    columns: Dict[str, str]
+    df: pd.DataFrame
+    key: str
+
+
+def upload_frame(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    upload: UploadDict,
+    client: Any,
+    output_format: str,
+    executor: Optional[Executor] = None,
+    part_size: int = PART_SIZE,
+    io_options: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> int:
+    """Serialize a dataframe into a multipart upload.
+
+    Args:
+        upload (UploadDict): The object to upload.
+        client (Any): S3 client.
+        output_format (str): Format of the object, `csv` or `parquet`.
+        executor (Optional[Executor]): Executor uploading the parts.
+        part_size (int): Size of the parts.
+        io_options (Optional[Dict[str, Any]]): Options of `to_csv`.
+        **kwargs (Any): Options of `write_parquet` (e.g. `compression`).
+
+    Returns:
+        int: Size of the object (bytes).
+    """
+    with MultipartWriter(
+        client, upload["bucket"], upload["key"], part_size, executor
+    ) as writer:
+        if output_format == "parquet":
+            write_parquet(
+                upload["df"],
+                cast(IO[bytes], writer),
+                columns=upload.get("columns"),
+                **kwargs,
+            )
+        else:
+            # buffered, so `to_csv` hands over large writes
+            buffered: io.BufferedWriter = io.BufferedWriter(writer, 1024**2)
+            text: io.TextIOWrapper = io.TextIOWrapper(
+                buffered, encoding="utf-8", newline=""
+            )
+            upload["df"].to_csv(text, **(io_options or {}))
+            # flushed into the writer, which is left open
+            text.detach()
+            buffered.detach()
+
+    return writer.size
+
+
+def upload_frames(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    uploads: List[UploadDict],
+    client: Any,
+    output_format: str,
+    workers: int = MAX_PENDING_PARTS,
+    part_size: int = PART_SIZE,
+    io_options: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> List[int]:
+    """Serialize and upload dataframes concurrently.
+
+    Each dataframe is serialized by its own thread, into a multipart
+    upload whose parts are uploaded by a pool of `workers` threads; with
+    a single worker, everything happens in turn, in the calling thread.
+
+    Args:
+        uploads (List[UploadDict]): The objects to upload.
+        client (Any): S3 client (thread-safe, as `boto3` clients are).
+        output_format (str): Format of the objects, `csv` or `parquet`.
+        workers (int): Number of threads uploading parts.
+        part_size (int): Size of the parts.
+        io_options (Optional[Dict[str, Any]]): Options of `to_csv`.
+        **kwargs (Any): Options of `write_parquet` (e.g. `compression`).
+
+    Returns:
+        List[int]: Size of each object (bytes), in order.
+    """
+    options: Dict[str, Any] = {
+        "part_size": part_size,
+        "io_options": io_options,
+        **kwargs,
+    }
+    if workers <= 1 or not uploads:
+        return [upload_frame(u, client, output_format, **options) for u in uploads]
+
+    with ThreadPoolExecutor(max_workers=workers) as parts, ThreadPoolExecutor(
+        max_workers=len(uploads)
+    ) as serializers:
+        futures: List[Future] = [
+            serializers.submit(
+                upload_frame, u, client, output_format, executor=parts, **options
+            )
+            for u in uploads
+        ]
+
+        return [future.result() for future in futures]
+
+
+def create_s3_client(endpoint_url: Optional[str] = None) -> Any:
+    """Create the S3 client of the remote outputs.
+
+    Args:
+        endpoint_url (Optional[str]): If given, the URL of an
+            S3-compatible server to use instead of S3 (e.g. a local
+            `moto_server` or MinIO), or a `file://` URL of a local
+            directory to store the buckets in (see `LocalS3Client`).
+
+    Returns:
+        Any: The S3 client.
+    """
+    if endpoint_url and endpoint_url.startswith("file://"):
+        return LocalS3Client(endpoint_url[len("file://") :])
+
+    return boto3.client("s3", endpoint_url=endpoint_url)
+
+
+def upload_parquet(
+    df: pd.DataFrame, bucket: str, key: str, client: Any = None, **kwargs: Any
+) -> None:
+    """Write data to a Parquet file on S3.
+
+    The file is uploaded in parts while it is being written (see
+    `upload_frame`).
+
+    Args:
+        df (pd.DataFrame): Data to write.
+        bucket (str): Name of the S3 bucket.
+        key (str): Key of the file in the bucket.
+        client (Any): S3 client (a new one if None).
+        **kwargs (Any): Options of `write_parquet` (e.g. `compression`).
+    """
+    columns: Optional[Dict[str, str]] = kwargs.pop("columns", None)
+    upload: UploadDict = {"df": df, "bucket": bucket, "key": key}
+    if columns:
+        upload["columns"] = columns
+
+    upload_frame(upload, client or create_s3_client(), "parquet", **kwargs)
+
+
+def write_outputs(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    bronze_df: pd.DataFrame,
+    silver_df: pd.DataFrame,
+    filename: str,
+    output_format: str,
+    output_local: bool,
+    partitioned: bool = False,
+    client: Any = None,
+    **kwargs: Any,
+) -> None:
+    """Write the bronze and silver outputs.
+
+    Locally, only the silver output is written. Remotely, both outputs
+    are serialized and uploaded concurrently, in parts (see
+    `upload_frames`).
+
+    Args:
+        bronze_df (pd.DataFrame): Bronze data; deferred input columns
+            are serialized into `source_row` before being written (see
+            `materialize_source_row`).
+        silver_df (pd.DataFrame): Silver data.
+        filename (str): Path of the output files.
+        output_format (str): Format of the output files, `csv` or
+            `parquet`.
+        output_local (bool): Whether to write to local disk (True), or
+            remotely on S3 (False).
+        partitioned (bool): Whether the silver output is written as Hive
+            partitions instead (see
+            `partitioning.write_silver_partitions`), leaving only the
+            bronze output; Parquet only.
+        client (Any): S3 client of the remote outputs (a new one if
+            None, see `create_s3_client`).
+        **kwargs (Any): Options of `write_parquet` (e.g. `compression`).
+    """
+    if os.path.dirname(filename) and output_local:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+    if not output_local:
+        bronze_df = materialize_source_row(bronze_df)
+        client = client or create_s3_client()
+    uploads: List[UploadDict] = [
+        {"df": bronze_df, "bucket": "nlca-bronze", "key": filename},
+        {"df": silver_df, "bucket": "nlca-silver", "key": filename},
+    ]
+
+    if output_format == "csv":
+        io_opts: Dict[str, Any] = {
+            "date_format": "%Y-%m-%d",
+            "index": False,
+            "sep": "|",
+        }
+        if output_local:
+            silver_df.to_csv(filename, **io_opts)
+        else:
+            upload_frames(uploads, client, output_format, io_options=io_opts)
+        return
+
+    uploads[0]["columns"] = BRONZE_COLUMNS
+    uploads[1]["columns"] = SILVER_COLUMNS
+    if partitioned:
+        if not output_local:
+            upload_frame(uploads[0], client, output_format, **kwargs)
+    elif output_local:
+        write_parquet(silver_df, filename, SILVER_COLUMNS, **kwargs)
+    else:
+        upload_frames(uploads, client, output_format, **kwargs)
+
+
+def write_gold(
+    tables: Dict[str, pd.DataFrame],
+    output_format: str,
+    output_local: bool,
+    client: Any = None,
+) -> List[str]:
+    """Write the gold tables.
+
+    Each table is written as its own file, under the `gold/` prefix (of
+    the gold bucket, or of the working directory).
+
+    Args:
+        tables (Dict[str, pd.DataFrame]): Gold tables, by name (see
+            `GoldPipeline`).
+        output_format (str): Format of the output files, `csv` or
+            `parquet`.
+        output_local (bool): Whether to write to local disk (True), or
+            remotely on S3 (False).
+        client (Any): S3 client of the remote outputs (a new one if
+            None, see `create_s3_client`).
+
+    Returns:
+        List[str]: Paths of the files written (keys in the gold bucket,
+            if remote).
+    """
+    io_opts: Dict[str, Any] = {"index": False, "sep": "|"}
+    if not output_local:
+        client = client or create_s3_client()
+    if output_local:
+        os.makedirs("gold", exist_ok=True)
+
+    paths: List[str] = []
+    for name, table in tables.items():
+        path: str = f"gold/{name}.{output_format}"
+        if output_format == "parquet" and output_local:
+            write_parquet(table, path)
+        elif output_format == "parquet":
+            upload_parquet(table, "nlca-gold", path, client=client)
+        elif output_local:
+            table.to_csv(path, **io_opts)
+        else:
+            client.put_object(
+                Bucket="nlca-gold", Key=path, Body=table.to_csv(**io_opts).encode()
+            )
+        paths.append(path)
+
+    return paths
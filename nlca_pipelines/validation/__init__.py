@@ -1,5 +1,7 @@
 # pylint: disable=R0801
 
+from .cache import VALIDATION_CACHE, ValidationCache
+from .schema import SILVER_DTYPES
 from .validate import validate  # type: ignore
 from .values import (
     Basin,
@@ -16,6 +18,9 @@ from .values import (
 
 __all__ = [
     "validate",
+    "ValidationCache",
+    "VALIDATION_CACHE",
+    "SILVER_DTYPES",
     "Basin",
     "County",
     "Cum12mgas",
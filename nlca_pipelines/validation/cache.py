@@ -0,0 +1,128 @@
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Tuple,
+    Type,
+)
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from .values._series import finalize
+
+
+class ValidationCache:
+    """Memoizing validation engine backed by a bounded LRU cache.
+
+    Well data is very repetitive, so rather than validating every row,
+    each column is factorized and only its distinct raw values are
+    validated (with the regular `values.*` validator objects). The
+    results are broadcast back to the rows by code.
+
+    Validated values are kept in a least-recently-used cache keyed on
+    the validator and the raw value, so they are reused across chunks
+    and across pipeline runs in the same process.
+
+    Args:
+        maxsize (int): Maximum number of cached (validator, raw value)
+            entries.
+
+    Examples:
+        >>> cache = ValidationCache(maxsize=1_000)
+        >>> cache.validate_series(pd.Series(["oil", "Oil", "oil"]), Welltype)
+        0    OIL
+        1    OIL
+        2    OIL
+        dtype: object
+        >>> cache.stats()
+        {'hits': 0, 'misses': 2, 'size': 2, 'maxsize': 1000}
+    """
+
+    def __init__(self, maxsize: int = 65_536) -> None:
+        if maxsize < 1:
+            raise ValueError("The cache must hold at least one entry.")
+
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: "OrderedDict[Tuple[str, Hashable], Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Summarize the cache usage.
+
+        Returns:
+            Dict[str, int]: Hit and miss counts, current and maximum
+                size of the cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def validate(self, v: Hashable, validator: Type[BaseModel]) -> Any:
+        """Validate a single raw value, reusing cached results.
+
+        Args:
+            v (Hashable): Raw value.
+            validator (Type[BaseModel]): Validator object from
+                `nlca_pipelines.validation.values`.
+
+        Returns:
+            Any: Sanitized and validated value.
+        """
+        key: Tuple[str, Hashable] = (validator.__name__, v)
+        try:
+            result: Any = self._entries[key]
+        except KeyError:
+            self.misses += 1
+
+            field: str = validator.__name__.lower()
+            result = getattr(validator(**{field: v}), field)
+
+            self._entries[key] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+        return result
+
+    def validate_series(self, s: pd.Series, validator: Type[BaseModel]) -> pd.Series:
+        """Validate a column, validating each distinct value only once.
+
+        Args:
+            s (pd.Series): Raw values.
+            validator (Type[BaseModel]): Validator object from
+                `nlca_pipelines.validation.values`.
+
+        Returns:
+            pd.Series: Sanitized and validated values, identical to
+                applying the validator to every row.
+        """
+        codes, uniques = pd.factorize(s.astype(object), use_na_sentinel=True)
+
+        # one validation per distinct value; the trailing None serves missing values
+        mapped: np.ndarray = np.array(
+            [self.validate(v, validator) for v in uniques] + [None], dtype=object
+        )
+
+        return finalize(mapped[codes], like=s)
+
+
+# process-wide cache shared by all pipelines
+VALIDATION_CACHE: ValidationCache = ValidationCache()
@@ -0,0 +1,92 @@
+"""Target dtypes of the validated silver-tier columns.
+
+Once validated, a column holds a small set of known values, so it can
+be stored compactly: categorical columns (whose values are registered
+in `CATEGORICAL_DOMAINS`) as a `pd.CategoricalDtype` over their domain,
+production volumes as nullable floats, and spud dates as datetimes.
+
+The categories of each domain are sorted, so sorting a categorical
+column (which sorts by category) gives the same order as sorting its
+values as strings.
+"""
+
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Mapping,
+)
+
+import pandas as pd
+
+from .values import CATEGORICAL_DOMAINS
+
+
+def categorical_dtype(name: str) -> pd.CategoricalDtype:
+    """Categorical dtype of a column with a registered domain.
+
+    Args:
+        name (str): Column name the domain is registered under.
+
+    Returns:
+        pd.CategoricalDtype: Unordered categories of the canonical
+            values of the domain, sorted.
+
+    Raises:
+        ValueError: If no domain is registered for the column.
+    """
+    if name not in CATEGORICAL_DOMAINS:
+        raise ValueError(f"No categorical domain for '{name}'.")
+
+    return pd.CategoricalDtype(
+        categories=sorted(set(CATEGORICAL_DOMAINS[name].values())), ordered=False
+    )
+
+
+_DTYPES: Dict[str, Any] = {
+    **{name: categorical_dtype(name) for name in sorted(CATEGORICAL_DOMAINS)},
+    "cum12mgas": "Float64",
+    "cum12moil": "Float64",
+    "cum12mwater": "Float64",
+    "spuddate": "datetime64[ns]",
+}
+
+# read-only view of the target dtype of each validated column
+SILVER_DTYPES: Mapping[str, Any] = MappingProxyType(_DTYPES)
+
+
+def to_silver_dtype(s: pd.Series) -> pd.Series:
+    """Convert a validated column to its target dtype.
+
+    Values outside the domain of a categorical column become missing,
+    as do values that aren't numbers or dates in the other columns.
+
+    Args:
+        s (pd.Series): Validated values (named after the column).
+
+    Returns:
+        pd.Series: The column, converted if it has a target dtype.
+    """
+    dtype: Any = SILVER_DTYPES.get(str(s.name))
+    if dtype is None or s.dtype == dtype:
+        return s
+    if dtype == "Float64":
+        return pd.to_numeric(s, errors="coerce").astype(dtype)
+    if dtype == "datetime64[ns]":
+        return pd.to_datetime(s, errors="coerce").astype(dtype)
+
+    return s.astype(dtype)
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert every column with a target dtype.
+
+    Args:
+        df (pd.DataFrame): Validated data.
+
+    Returns:
+        pd.DataFrame: The data, with its columns converted.
+    """
+    return df.assign(
+        **{col: to_silver_dtype(df[col]) for col in df.columns if col in SILVER_DTYPES}
+    )
@@ -1,3 +1,4 @@
+from ._domains import CATEGORICAL_DOMAINS
 from .basin import Basin
 from .county import County
 from .cum12mgas import Cum12mgas
@@ -10,6 +11,7 @@ from .subbasin import Subbasin
 from .welltype import Welltype
 
 __all__ = [
+    "CATEGORICAL_DOMAINS",
     "Basin",
     "County",
     "Cum12mgas",
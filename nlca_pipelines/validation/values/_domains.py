@@ -0,0 +1,57 @@
+"""Registry of the categorical domains used by the value validators.
+
+Each categorical validator registers its `Enum` of valid (lower-case)
+values here once, at import time. The registry stores a frozen mapping
+from the normalized raw string to the canonical upper-case value, so
+validating a value is a single dictionary lookup.
+"""
+
+from enum import Enum
+from types import MappingProxyType
+from typing import (
+    Dict,
+    Mapping,
+    Optional,
+    Type,
+)
+
+_REGISTRY: Dict[str, Mapping[str, str]] = {}
+
+# read-only view of every registered domain, keyed by column name
+CATEGORICAL_DOMAINS: Mapping[str, Mapping[str, str]] = MappingProxyType(_REGISTRY)
+
+
+def register_domain(name: str, enum: Type[Enum]) -> Mapping[str, str]:
+    """Register the valid values of a categorical column.
+
+    Args:
+        name (str): Column name the domain applies to.
+        enum (Type[Enum]): Enum whose values are the valid lower-case
+            values of the column.
+
+    Returns:
+        Mapping[str, str]: Frozen mapping from normalized raw value to
+            canonical upper-case value.
+    """
+    domain: Mapping[str, str] = MappingProxyType(
+        {member.value: member.value.upper() for member in enum}
+    )
+    _REGISTRY[name] = domain
+
+    return domain
+
+
+def lookup(domain: Mapping[str, str], v: object) -> Optional[str]:
+    """Sanitize a single raw value against a domain.
+
+    Args:
+        domain (Mapping[str, str]): A registered domain.
+        v (object): Raw value; anything but a string is invalid.
+
+    Returns:
+        Optional[str]: Canonical value, or None if invalid.
+    """
+    if not isinstance(v, str):
+        return None
+
+    return domain.get(v.lower().strip())
@@ -0,0 +1,149 @@
+"""Vectorized helpers shared by the `validate_series` methods.
+
+Each helper reproduces the result of applying the matching scalar
+pydantic validator to every cell of a column, but operates on whole
+columns with pandas string/datetime operations. Values that fall
+outside the well-understood fast path are handed to the scalar
+validator, so both paths always agree.
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Mapping,
+)
+
+import numpy as np
+import pandas as pd
+
+from ._domains import lookup
+
+# canonical representations handled by the vectorized fast paths
+COUNT_PATTERN: str = r"[0-9]{1,18}"
+DATE_PATTERN: str = r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+DATE_FORMAT: str = "%Y-%m-%d"
+
+
+def finalize(results: np.ndarray, like: pd.Series) -> pd.Series:
+    """Wrap validated values in a series shaped like the input.
+
+    The dtype is inferred exactly as `pd.Series.apply` would infer it,
+    so the vectorized and scalar paths produce identical columns.
+
+    Args:
+        results (np.ndarray): Object array of validated values.
+        like (pd.Series): The input series (for its index and name).
+
+    Returns:
+        pd.Series: Validated values.
+    """
+    return pd.Series(
+        results, index=like.index, name=like.name, dtype=object
+    ).infer_objects()
+
+
+def non_str(s: pd.Series) -> np.ndarray:
+    """Boolean mask of the non-missing cells that are not strings.
+
+    Args:
+        s (pd.Series): Input series (object dtype).
+
+    Returns:
+        np.ndarray: True where the cell holds a non-string value.
+    """
+    mask: np.ndarray = (s.notna() & s.str.len().isna()).to_numpy()
+
+    return mask
+
+
+def validate_categorical(s: pd.Series, domain: Mapping[str, str]) -> pd.Series:
+    """Vectorized sanitization of a categorical column.
+
+    The column is factorized, so each distinct raw value is looked up
+    in the domain once and the results are broadcast back by code.
+
+    Args:
+        s (pd.Series): Raw values.
+        domain (Mapping[str, str]): A registered categorical domain.
+
+    Returns:
+        pd.Series: Upper-case valid values, or None.
+    """
+    codes, uniques = pd.factorize(s.astype(object), use_na_sentinel=True)
+
+    # one lookup per distinct value; the trailing None serves missing values
+    mapped: np.ndarray = np.array(
+        [lookup(domain, v) for v in uniques] + [None], dtype=object
+    )
+
+    return finalize(mapped[codes], like=s)
+
+
+def validate_count(s: pd.Series, scalar: Callable[[Any], Any]) -> pd.Series:
+    """Vectorized sanitization of a non-negative integer column.
+
+    Plain ASCII digit strings are converted in bulk; other strings that
+    Python considers numeric (and any non-string value) fall back to
+    the scalar validator. Missing values are returned as None.
+
+    Args:
+        s (pd.Series): Raw values.
+        scalar (Callable[[Any], Any]): The scalar validator.
+
+    Returns:
+        pd.Series: Integer values, or None.
+    """
+    strings: pd.Series = s.astype(object)
+    fast: np.ndarray = (
+        strings.str.fullmatch(COUNT_PATTERN).fillna(False).to_numpy(dtype=bool)
+    )
+    slow: np.ndarray = non_str(strings) | (
+        ~fast & strings.str.isnumeric().fillna(False).to_numpy(dtype=bool)
+    )
+
+    results: np.ndarray = np.full(len(s), None, dtype=object)
+    results[fast] = strings[fast].astype(np.int64).tolist()
+    results[slow] = [scalar(v) for v in strings[slow]]
+
+    return finalize(results, like=s)
+
+
+def validate_date(s: pd.Series, scalar: Callable[[Any], Any]) -> pd.Series:
+    """Vectorized sanitization of a `YYYY-MM-DD` date column.
+
+    Canonical `YYYY-MM-DD` strings are parsed in bulk; anything else
+    that is not an empty string falls back to the scalar validator.
+    Missing values are returned as None.
+
+    Args:
+        s (pd.Series): Raw values.
+        scalar (Callable[[Any], Any]): The scalar validator.
+
+    Returns:
+        pd.Series: Past dates, or None.
+    """
+    strings: pd.Series = s.astype(object)
+    fast: np.ndarray = (
+        strings.str.fullmatch(DATE_PATTERN).fillna(False).to_numpy(dtype=bool)
+    )
+    parsed: pd.Series = pd.to_datetime(
+        strings[fast], format=DATE_FORMAT, errors="coerce"
+    )
+
+    # out-of-bounds or impossible dates are re-checked by the scalar
+    parsed_ok: np.ndarray = parsed.notna().to_numpy()
+    fast_idx: np.ndarray = np.flatnonzero(fast)
+    fast[fast_idx[~parsed_ok]] = False
+    parsed = parsed[parsed_ok]
+
+    empty: np.ndarray = (strings.isna() | (strings == "")).to_numpy()
+    slow: np.ndarray = ~fast & ~empty
+
+    results: np.ndarray = np.full(len(s), None, dtype=object)
+    # spud dates must be in the past
+    dates: np.ndarray = parsed.to_numpy(dtype=object)
+    dates[(parsed > pd.Timestamp.now()).to_numpy()] = None
+    results[fast] = dates
+    results[slow] = [scalar(v) for v in strings[slow]]
+
+    return finalize(results, like=s)
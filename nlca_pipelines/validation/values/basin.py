@@ -1,8 +1,25 @@
 from enum import Enum
-from typing import Optional
+from typing import Mapping, Optional
 
+import pandas as pd
 from pydantic import BaseModel, field_validator
 
+from ._domains import register_domain
+from ._series import validate_categorical
+
+
+class BasinEnum(Enum):
+    """Valid basin values (lower-case)."""
+
+    ANADARKO = "anadarko"
+    BARNETT = "barnett"
+    EAGLEFORD = "eagle ford"
+    OTHER = "other"
+    PERMIAN = "permian"
+
+
+BASIN_DOMAIN: Mapping[str, str] = register_domain("basin", BasinEnum)
+
 
 class Basin(BaseModel):
     """Represents the basin the well is located.
@@ -24,26 +41,20 @@ class Basin(BaseModel):
         Returns:
             Optional[str]: Sanitized and validated basin.
         """
-
-        # pylint: disable=missing-class-docstring
-        class BasinEnum(Enum):
-            ANADARKO = "anadarko"
-            BARNETT = "barnett"
-            EAGLEFORD = "eagle ford"
-            OTHER = "other"
-            PERMIAN = "permian"
-
-        # pylint: enable=missing-class-docstring
-
         # sanitizing input string
         v = v.lower().strip()
 
-        # initialize basin as missing
-        basin: Optional[str] = None
-        try:
-            # sanitize valid values
-            basin = BasinEnum(v).value.upper()
-        except ValueError:
-            pass
+        # sanitize valid values (missing if outside the domain)
+        return BASIN_DOMAIN.get(v)
+
+    @classmethod
+    def validate_series(cls, s: pd.Series) -> pd.Series:
+        """Vectorized equivalent of `validate_basin` for a whole column.
 
-        return basin
+        Args:
+            s (pd.Series): Raw basin values.
+
+        Returns:
+            pd.Series: Sanitized and validated basin values.
+        """
+        return validate_categorical(s, domain=BASIN_DOMAIN)
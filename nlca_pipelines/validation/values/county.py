@@ -1,8 +1,36 @@
 from enum import Enum
-from typing import Optional
+from typing import Mapping, Optional
 
+import pandas as pd
 from pydantic import BaseModel, field_validator
 
+from ._domains import register_domain
+from ._series import validate_categorical
+
+
+class CountyEnum(Enum):
+    """Valid county values (lower-case)."""
+
+    ANDERSON = "anderson"
+    ATASCOSA = "atascosa"
+    BORDEN = "borden"
+    COOKE = "cooke"
+    CRANE = "crane"
+    DEWITT = "dewitt"
+    KNOX = "knox"
+    MARTIN = "martin"
+    MATAGORDA = "matagorda"
+    NOLAN = "nolan"
+    PECOS = "pecos"
+    REFUGIO = "refugio"
+    ROBERTSON = "robertson"
+    RUNNELS = "runnels"
+    YOAKUM = "yoakum"
+    YOUNG = "young"
+
+
+COUNTY_DOMAIN: Mapping[str, str] = register_domain("county", CountyEnum)
+
 
 class County(BaseModel):
     """Represents US county the well is located in.
@@ -24,37 +52,20 @@ class County(BaseModel):
         Returns:
             Optional[str]: Sanitized and validated US county.
         """
-
-        # pylint: disable=missing-class-docstring
-        class CountyEnum(Enum):
-            ANDERSON = "anderson"
-            ATASCOSA = "atascosa"
-            BORDEN = "borden"
-            COOKE = "cooke"
-            CRANE = "crane"
-            DEWITT = "dewitt"
-            KNOX = "knox"
-            MARTIN = "martin"
-            MATAGORDA = "matagorda"
-            NOLAN = "nolan"
-            PECOS = "pecos"
-            REFUGIO = "refugio"
-            ROBERTSON = "robertson"
-            RUNNELS = "runnels"
-            YOAKUM = "yoakum"
-            YOUNG = "young"
-
-        # pylint: enable=missing-class-docstring
-
         # sanitizing input string
         v = v.lower().strip()
 
-        # initialize US county as missing
-        county: Optional[str] = None
-        try:
-            # sanitize valid values
-            county = CountyEnum(v).value.upper()
-        except ValueError:
-            pass
+        # sanitize valid values (missing if outside the domain)
+        return COUNTY_DOMAIN.get(v)
+
+    @classmethod
+    def validate_series(cls, s: pd.Series) -> pd.Series:
+        """Vectorized equivalent of `validate_county` for a whole column.
 
-        return county
+        Args:
+            s (pd.Series): Raw county values.
+
+        Returns:
+            pd.Series: Sanitized and validated county values.
+        """
+        return validate_categorical(s, domain=COUNTY_DOMAIN)
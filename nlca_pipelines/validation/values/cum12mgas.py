@@ -1,7 +1,10 @@
 from typing import Optional, Union
 
+import pandas as pd
 from pydantic import BaseModel, field_validator
 
+from ._series import validate_count
+
 
 class Cum12mgas(BaseModel):
     """Represents cumulative 12 month gas production for the well.
@@ -26,3 +29,16 @@ class Cum12mgas(BaseModel):
                 gas production.
         """
         return int(v) if v.isnumeric() and int(v) >= 0 else None
+
+    @classmethod
+    def validate_series(cls, s: pd.Series) -> pd.Series:
+        """Vectorized equivalent of `validate_cum12mgas` for a whole column.
+
+        Args:
+            s (pd.Series): Raw cumulative 12 month gas production.
+
+        Returns:
+            pd.Series: Sanitized and validated cumulative 12 month
+                gas production.
+        """
+        return validate_count(s, scalar=cls.validate_cum12mgas)
@@ -1,8 +1,22 @@
 from enum import Enum
-from typing import Optional
+from typing import Mapping, Optional
 
+import pandas as pd
 from pydantic import BaseModel, field_validator
 
+from ._domains import register_domain
+from ._series import validate_categorical
+
+
+class DirectionEnum(Enum):
+    """Valid direction values (lower-case)."""
+
+    HORIZONTAL = "horizontal"
+    VERTICAL = "vertical"
+
+
+DIRECTION_DOMAIN: Mapping[str, str] = register_domain("direction", DirectionEnum)
+
 
 class Direction(BaseModel):
     """Represents direction of the wellbore.
@@ -24,23 +38,20 @@ class Direction(BaseModel):
         Returns:
             Optional[str]: Sanitized and validated direction.
         """
-
-        # pylint: disable=missing-class-docstring
-        class DirectionEnum(Enum):
-            HORIZONTAL = "horizontal"
-            VERTICAL = "vertical"
-
-        # pylint: enable=missing-class-docstring
-
         # sanitizing input string
         v = v.lower().strip()
 
-        # initialize direction as missing
-        direction: Optional[str] = None
-        try:
-            # sanitize valid values
-            direction = DirectionEnum(v).value.upper()
-        except ValueError:
-            pass
+        # sanitize valid values (missing if outside the domain)
+        return DIRECTION_DOMAIN.get(v)
+
+    @classmethod
+    def validate_series(cls, s: pd.Series) -> pd.Series:
+        """Vectorized equivalent of `validate_direction` for a whole column.
 
-        return direction
+        Args:
+            s (pd.Series): Raw direction values.
+
+        Returns:
+            pd.Series: Sanitized and validated direction values.
+        """
+        return validate_categorical(s, domain=DIRECTION_DOMAIN)
@@ -1,8 +1,11 @@
 from datetime import datetime
 from typing import Optional, Union
 
+import pandas as pd
 from pydantic import BaseModel, field_validator
 
+from ._series import validate_date
+
 
 class Spuddate(BaseModel):
     """Represents the spud date of the well.
@@ -36,3 +39,15 @@ class Spuddate(BaseModel):
             pass
 
         return spuddate
+
+    @classmethod
+    def validate_series(cls, s: pd.Series) -> pd.Series:
+        """Vectorized equivalent of `validate_spuddate` for a whole column.
+
+        Args:
+            s (pd.Series): Raw spud dates.
+
+        Returns:
+            pd.Series: Sanitized and validated Spud Date's.
+        """
+        return validate_date(s, scalar=cls.validate_spuddate)
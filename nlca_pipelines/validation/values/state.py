@@ -1,8 +1,21 @@
 from enum import Enum
-from typing import Optional
+from typing import Mapping, Optional
 
+import pandas as pd
 from pydantic import BaseModel, field_validator
 
+from ._domains import register_domain
+from ._series import validate_categorical
+
+
+class StateEnum(Enum):
+    """Valid state values (lower-case)."""
+
+    TEXAS = "texas"
+
+
+STATE_DOMAIN: Mapping[str, str] = register_domain("state", StateEnum)
+
 
 class State(BaseModel):
     """Represents US state the well is located in.
@@ -24,22 +37,20 @@ class State(BaseModel):
         Returns:
             Optional[str]: Sanitized and validated US state.
         """
-
-        # pylint: disable=missing-class-docstring
-        class StateEnum(Enum):
-            TEXAS = "texas"
-
-        # pylint: enable=missing-class-docstring
-
         # sanitizing input string
         v = v.lower().strip()
 
-        # initialize US state as missing
-        state: Optional[str] = None
-        try:
-            # sanitize valid values
-            state = StateEnum(v).value.upper()
-        except ValueError:
-            pass
+        # sanitize valid values (missing if outside the domain)
+        return STATE_DOMAIN.get(v)
+
+    @classmethod
+    def validate_series(cls, s: pd.Series) -> pd.Series:
+        """Vectorized equivalent of `validate_state` for a whole column.
 
-        return state
+        Args:
+            s (pd.Series): Raw state values.
+
+        Returns:
+            pd.Series: Sanitized and validated state values.
+        """
+        return validate_categorical(s, domain=STATE_DOMAIN)
@@ -1,8 +1,32 @@
 from enum import Enum
-from typing import Optional
+from typing import Mapping, Optional
 
+import pandas as pd
 from pydantic import BaseModel, field_validator
 
+from ._domains import register_domain
+from ._series import validate_categorical
+
+
+class SubbasinEnum(Enum):
+    """Valid subbasin values (lower-case)."""
+
+    BARNETT = "barnett"
+    CENTRAL_BASIN_PLATFORM = "central basin platform"
+    CENTRAL_EAGLE_FORD = "central eagle ford"
+    DELAWARE = "delaware"
+    EASTERN_SHELF = "eastern shelf"
+    GRANITE_WASH = "granite wash"
+    MAVERICK_BASIN = "maverick basin"
+    MIDLAND = "midland"
+    NORTHEASTERN_EAGLE_FORD = "northeastern eagle ford"
+    NORTHWEST_SHELF = "northwest shelf"
+    OTHER = "other"
+    SCOOP = "scoop"
+
+
+SUBBASIN_DOMAIN: Mapping[str, str] = register_domain("subbasin", SubbasinEnum)
+
 
 class Subbasin(BaseModel):
     """Represents subbasin the well is located in.
@@ -24,33 +48,20 @@ class Subbasin(BaseModel):
         Returns:
             Optional[str]: Sanitized and validated subbasin.
         """
-
-        # pylint: disable=missing-class-docstring
-        class SubbasinEnum(Enum):
-            BARNETT = "barnett"
-            CENTRAL_BASIN_PLATFORM = "central basin platform"
-            CENTRAL_EAGLE_FORD = "central eagle ford"
-            DELAWARE = "delaware"
-            EASTERN_SHELF = "eastern shelf"
-            GRANITE_WASH = "granite wash"
-            MAVERICK_BASIN = "maverick basin"
-            MIDLAND = "midland"
-            NORTHEASTERN_EAGLE_FORD = "northeastern eagle ford"
-            NORTHWEST_SHELF = "northwest shelf"
-            OTHER = "other"
-            SCOOP = "scoop"
-
-        # pylint: enable=missing-class-docstring
-
         # sanitizing input string
         v = v.lower().strip()
 
-        # intiialize subbasin as missing
-        subbasin: Optional[str] = None
-        try:
-            # sanitize valid values
-            subbasin = SubbasinEnum(v).value.upper()
-        except ValueError:
-            pass
+        # sanitize valid values (missing if outside the domain)
+        return SUBBASIN_DOMAIN.get(v)
+
+    @classmethod
+    def validate_series(cls, s: pd.Series) -> pd.Series:
+        """Vectorized equivalent of `validate_subbasin` for a whole column.
 
-        return subbasin
+        Args:
+            s (pd.Series): Raw subbasin values.
+
+        Returns:
+            pd.Series: Sanitized and validated subbasin values.
+        """
+        return validate_categorical(s, domain=SUBBASIN_DOMAIN)
@@ -1,8 +1,22 @@
 from enum import Enum
-from typing import Optional
+from typing import Mapping, Optional
 
+import pandas as pd
 from pydantic import BaseModel, field_validator
 
+from ._domains import register_domain
+from ._series import validate_categorical
+
+
+class WelltypeEnum(Enum):
+    """Valid welltype values (lower-case)."""
+
+    GAS = "gas"
+    OIL = "oil"
+
+
+WELLTYPE_DOMAIN: Mapping[str, str] = register_domain("welltype", WelltypeEnum)
+
 
 class Welltype(BaseModel):
     """Represents the type of well.
@@ -24,23 +38,20 @@ class Welltype(BaseModel):
         Returns:
             Optional[str]: Sanitized and validated well type.
         """
-
-        # pylint: disable=missing-class-docstring
-        class WelltypeEnum(Enum):
-            GAS = "gas"
-            OIL = "oil"
-
-        # pylint: enable=missing-class-docstring
-
         # sanitizing input string
         v = v.lower().strip()
 
-        # initialize well type as missing
-        welltype: Optional[str] = None
-        try:
-            # sanitize valid values
-            welltype = WelltypeEnum(v).value.upper()
-        except ValueError:
-            pass
+        # sanitize valid values (missing if outside the domain)
+        return WELLTYPE_DOMAIN.get(v)
+
+    @classmethod
+    def validate_series(cls, s: pd.Series) -> pd.Series:
+        """Vectorized equivalent of `validate_welltype` for a whole column.
 
-        return welltype
+        Args:
+            s (pd.Series): Raw welltype values.
+
+        Returns:
+            pd.Series: Sanitized and validated welltype values.
+        """
+        return validate_categorical(s, domain=WELLTYPE_DOMAIN)
@@ -0,0 +1,326 @@
+"""Local analytic database of the silver tier.
+
+A `Warehouse` bulk-loads silver data into a local database file, so the
+Part 2 questions (the top oil wells, production by basin) are answered
+locally rather than through Athena. The Athena queries, bundled with the
+package (under `queries/`, which Terraform reads too), are run as they
+are: the database is attached as the `silver` schema, the data is loaded
+into its `wells` table, and the Parquet and partitioned tables the other
+queries read from are views of it.
+
+DuckDB is an optional dependency: when installed, the data is handed to
+it as an Arrow table, which it scans in place rather than inserting row
+by row. Otherwise, the data is loaded into SQLite. The table is indexed on `INDEXED_COLUMNS`.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Type,
+)
+
+import pandas as pd
+import pyarrow as pa  # type: ignore
+
+from .parquet import SILVER_COLUMNS
+
+try:
+    import duckdb  # type: ignore
+except ImportError:
+    duckdb = None  # type: ignore
+
+# supported values for the database `engine` (`auto` picks DuckDB if installed)
+DATABASE_ENGINES: List[str] = ["auto", "duckdb", "sqlite"]
+
+# directory of the bundled Athena queries
+QUERIES_DIR: str = str(Path(__file__).resolve().parent / "queries")
+
+# queries answering Part 2 of the assignment
+PART_2_QUERIES: List[str] = ["top-5-oil-wells", "sum-prod-by-basin"]
+
+# columns of the silver table with an index
+INDEXED_COLUMNS: List[str] = ["api10", "basin"]
+
+# SQL types of the Athena types of the silver columns
+_SQL_TYPES: Dict[str, str] = {
+    "bigint": "BIGINT",
+    "date": "DATE",
+    "double": "DOUBLE",
+    "string": "VARCHAR",
+}
+
+# spud year of a row, for the view of the partitioned table
+_SPUD_YEAR: Dict[str, str] = {
+    "duckdb": "CAST(year(spuddate) AS INTEGER)",
+    "sqlite": "CAST(strftime('%Y', spuddate) AS INTEGER)",
+}
+
+_SQLITE_HEADER: bytes = b"SQLite format 3\x00"
+
+
+def bundled_queries(queries_dir: str = QUERIES_DIR) -> Dict[str, str]:
+    """The queries of a directory of SQL files.
+
+    The Athena DDL (`create-*.sql`) is left out: the tables are created
+    when loading the data.
+
+    Args:
+        queries_dir (str): Directory of the SQL files.
+
+    Returns:
+        Dict[str, str]: Path of each query, by name (the file name,
+            without its extension), in name order.
+    """
+    return {
+        path.stem: str(path)
+        for path in sorted(Path(queries_dir).glob("*.sql"))
+        if not path.stem.startswith("create-")
+    }
+
+
+def read_query(name: str, queries_dir: str = QUERIES_DIR) -> str:
+    """Read a bundled query.
+
+    Args:
+        name (str): Name of the query (see `bundled_queries`).
+        queries_dir (str): Directory of the SQL files.
+
+    Returns:
+        str: The SQL of the query.
+
+    Raises:
+        ValueError: If there is no such query.
+    """
+    queries: Dict[str, str] = bundled_queries(queries_dir)
+    if name not in queries:
+        raise ValueError(f"Unknown query '{name}'.")
+
+    return Path(queries[name]).read_text(encoding="utf-8")
+
+
+def _detect_engine(path: str) -> str:
+    """Engine of an existing database file, or the preferred one.
+
+    Raises:
+        ImportError: If the file is a DuckDB database, but DuckDB isn't
+            installed.
+    """
+    if os.path.exists(path) and os.path.getsize(path):
+        with open(path, "rb") as f:
+            if f.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER:
+                return "sqlite"
+        if duckdb is None:
+            raise ImportError("The duckdb database engine requires duckdb.")
+        return "duckdb"
+
+    return "sqlite" if duckdb is None else "duckdb"
+
+
+def _typed(df: pd.DataFrame) -> pd.DataFrame:
+    """Silver columns converted to the types of the table.
+
+    Columns read back from a CSV output are text, and categorical
+    columns are compact: both are converted to plain columns, with
+    missing values as nulls.
+    """
+    columns: Dict[str, pd.Series] = {}
+    for col, kind in SILVER_COLUMNS.items():
+        if col not in df.columns:
+            continue
+        s: pd.Series = df[col]
+        if kind == "date":
+            columns[col] = pd.to_datetime(s, errors="coerce").astype("datetime64[ns]")
+        elif kind in ("double", "bigint"):
+            columns[col] = pd.to_numeric(s, errors="coerce").astype("float64")
+        else:
+            columns[col] = s.astype(object).where(s.notna(), None)
+
+    return pd.DataFrame(columns, index=df.index)
+
+
+class Warehouse:
+    """Local database of the silver tier.
+
+    Args:
+        path (str): Path of the database file (created, along with its
+            directory, if it doesn't exist).
+        engine (str): Database engine (one of `DATABASE_ENGINES`); `auto`
+            opens an existing file with the engine that created it.
+
+    Raises:
+        ValueError: If the engine is not recognized.
+        ImportError: If the DuckDB engine is requested, or `auto` opens a
+            DuckDB file, but DuckDB isn't installed.
+
+    Examples:
+        >>> with Warehouse("data/silver.duckdb") as warehouse:
+        ...     warehouse.load(silver_df)
+        ...     top_wells = warehouse.run_query("top-5-oil-wells")
+    """
+
+    def __init__(self, path: str, engine: str = "auto") -> None:
+        if engine not in DATABASE_ENGINES:
+            raise ValueError(f"Unknown database engine '{engine}'.")
+        if engine == "duckdb" and duckdb is None:
+            raise ImportError("The duckdb database engine requires duckdb.")
+        if engine == "auto":
+            engine = _detect_engine(path)
+
+        self.path: str = path
+        self.engine: str = engine
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # the file is attached as the schema the Athena queries read from
+        self.connection: Any
+        if engine == "duckdb":
+            self.connection = duckdb.connect()
+            quoted: str = path.replace("'", "''")
+            self.connection.execute(f"ATTACH '{quoted}' AS silver")
+        else:
+            self.connection = sqlite3.connect(":memory:")
+            self.connection.execute("ATTACH DATABASE ? AS silver", (path,))
+
+    def __enter__(self) -> "Warehouse":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def _insert(self, df: pd.DataFrame) -> None:
+        """Insert typed silver data into the (empty) table."""
+        if self.engine == "duckdb":
+            # scanned in place by DuckDB, without a copy per row
+            frame: Any = pa.Table.from_pandas(df, preserve_index=False)
+            self.connection.register("silver_frame", frame)
+            try:
+                self.connection.execute(
+                    "INSERT INTO silver.wells SELECT * FROM silver_frame"
+                )
+            finally:
+                self.connection.unregister("silver_frame")
+            return
+
+        values: pd.DataFrame = df.astype(object)
+        for col, kind in SILVER_COLUMNS.items():
+            if kind == "date" and col in df.columns:
+                values[col] = df[col].dt.strftime("%Y-%m-%d").astype(object)
+        values = values.where(df.notna(), None)
+        self.connection.executemany(
+            f"INSERT INTO silver.wells VALUES ({', '.join('?' * df.shape[1])})",
+            values.itertuples(index=False, name=None),
+        )
+
+    def load(self, df: pd.DataFrame) -> int:
+        """Replace the silver table with the given data.
+
+        Args:
+            df (pd.DataFrame): Silver data (as output by the silver
+                pipeline, or read back from its output files); columns
+                outside `SILVER_COLUMNS` are left out.
+
+        Returns:
+            int: Number of rows loaded.
+
+        Raises:
+            ValueError: If the data has none of the silver columns.
+        """
+        typed: pd.DataFrame = _typed(df)
+        if typed.columns.empty:
+            raise ValueError("No silver columns to load.")
+
+        table: str = "silver.wells"
+        definitions: str = ", ".join(
+            f"{col} {_SQL_TYPES[SILVER_COLUMNS[col]]}" for col in typed.columns
+        )
+        indexed: List[str] = [col for col in INDEXED_COLUMNS if col in typed.columns]
+        spud_year: str = (
+            f", {_SPUD_YEAR[self.engine]} AS spud_year"
+            if "spuddate" in typed.columns
+            else ""
+        )
+
+        # views resolve their tables within the attached database
+        source: str = table if self.engine == "duckdb" else "wells"
+        statements: List[str] = [
+            "DROP VIEW IF EXISTS silver.wells_parquet",
+            "DROP VIEW IF EXISTS silver.wells_partitioned",
+            f"DROP TABLE IF EXISTS {table}",
+            f"CREATE TABLE {table} ({definitions})",
+        ]
+        for statement in statements:
+            self.connection.execute(statement)
+        self._insert(typed)
+
+        # indexes are built once, after the bulk insert
+        for col in indexed:
+            self.connection.execute(
+                f"CREATE INDEX wells_{col} ON {table} ({col})"
+                if self.engine == "duckdb"
+                else f"CREATE INDEX silver.wells_{col} ON wells ({col})"
+            )
+        self.connection.execute(
+            f"CREATE VIEW silver.wells_parquet AS SELECT * FROM {source}"
+        )
+        self.connection.execute(
+            "CREATE VIEW silver.wells_partitioned AS "
+            f"SELECT *{spud_year} FROM {source}"
+        )
+        self.connection.commit()
+
+        return int(typed.shape[0])
+
+    def indexes(self) -> List[str]:
+        """Names of the indexes of the silver table.
+
+        Returns:
+            List[str]: The index names, sorted.
+        """
+        sql: str = (
+            "SELECT index_name FROM duckdb_indexes() WHERE database_name = 'silver'"
+            if self.engine == "duckdb"
+            else "SELECT name FROM silver.sqlite_master WHERE type = 'index'"
+        )
+
+        return sorted(str(row[0]) for row in self.connection.execute(sql).fetchall())
+
+    def query(self, sql: str) -> pd.DataFrame:
+        """Run a query.
+
+        Args:
+            sql (str): A single SQL statement.
+
+        Returns:
+            pd.DataFrame: The result set.
+        """
+        cursor: Any = self.connection.execute(sql)
+        columns: List[str] = [str(d[0]) for d in cursor.description]
+
+        return pd.DataFrame(cursor.fetchall(), columns=columns)
+
+    def run_query(self, name: str, queries_dir: str = QUERIES_DIR) -> pd.DataFrame:
+        """Run a bundled query.
+
+        Args:
+            name (str): Name of the query (see `bundled_queries`).
+            queries_dir (str): Directory of the SQL files.
+
+        Returns:
+            pd.DataFrame: The result set.
+        """
+        return self.query(read_query(name, queries_dir))
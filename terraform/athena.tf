@@ -10,9 +10,14 @@ module "aws-athena" {
   bucket_name            = "nlca-silver"
   database_force_destroy = true
   queries = {
-    "create-table" : "queries/create-table.sql"
-    "top-5-oil-wells" : "queries/top-5-oil-wells.sql",
-    "sum-prod-by-basin" : "queries/sum-prod-by-basin.sql"
+    "create-table" : "${path.module}/../nlca_pipelines/queries/create-table.sql"
+    "top-5-oil-wells" : "${path.module}/../nlca_pipelines/queries/top-5-oil-wells.sql",
+    "sum-prod-by-basin" : "${path.module}/../nlca_pipelines/queries/sum-prod-by-basin.sql",
+    "create-table-parquet" : "${path.module}/../nlca_pipelines/queries/create-table-parquet.sql",
+    "top-5-oil-wells-parquet" : "${path.module}/../nlca_pipelines/queries/top-5-oil-wells-parquet.sql",
+    "sum-prod-by-basin-parquet" : "${path.module}/../nlca_pipelines/queries/sum-prod-by-basin-parquet.sql",
+    "create-table-partitioned" : "${path.module}/../nlca_pipelines/queries/create-table-partitioned.sql",
+    "sum-prod-by-basin-partitioned" : "${path.module}/../nlca_pipelines/queries/sum-prod-by-basin-partitioned.sql"
   }
   namespace = ""
   name      = "athena"
@@ -5,3 +5,7 @@ resource "aws_s3_bucket" "bronze" {
 resource "aws_s3_bucket" "silver" {
   bucket = "nlca-silver"
 }
+
+resource "aws_s3_bucket" "gold" {
+  bucket = "nlca-gold"
+}
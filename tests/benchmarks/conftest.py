@@ -0,0 +1,113 @@
+"""Shared fixtures of the benchmarks.
+
+Benchmarks run only when the `NLCA_BENCHMARK` environment variable is
+set. They are configured with further environment variables:
+- `NLCA_BENCHMARK_ROWS`: comma separated data sizes (default `10000`;
+  e.g. `10000,1000000,10000000`).
+- `NLCA_BENCHMARK_RESULTS`: file the timings are written to (default
+  `benchmark-results.json`).
+- `NLCA_BENCHMARK_BASELINE`: timings of a previous run; a benchmark
+  fails if it is slower than its baseline by more than
+  `NLCA_BENCHMARK_TOLERANCE` (default `1.5`, i.e. 50% slower).
+
+$ NLCA_BENCHMARK=1 NLCA_BENCHMARK_ROWS=10000,1000000 pytest tests/benchmarks -s
+"""
+
+import json
+import os
+import platform
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+)
+
+import pandas as pd
+import pytest
+
+from .synthetic import generate_wells, write_wells_csv
+
+ROWS: List[int] = [
+    int(rows) for rows in os.environ.get("NLCA_BENCHMARK_ROWS", "10000").split(",")
+]
+
+
+class BenchmarkResults:
+    """Timings of a benchmark run, compared against a baseline run.
+
+    Args:
+        baseline (Dict[str, float]): Seconds by benchmark name.
+        tolerance (float): Slowdown relative to the baseline allowed.
+    """
+
+    def __init__(self, baseline: Dict[str, float], tolerance: float) -> None:
+        self.baseline: Dict[str, float] = baseline
+        self.tolerance: float = tolerance
+        self.timings: Dict[str, float] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record the timing of a benchmark.
+
+        Args:
+            name (str): Name of the benchmark (including its size).
+            seconds (float): Elapsed time.
+        """
+        self.timings[name] = seconds
+        print(f"\n{name}: {seconds:.3f}s")
+
+        baseline: float = self.baseline.get(name, float("inf"))
+        assert (
+            seconds <= baseline * self.tolerance
+        ), f"{name} regressed: {seconds:.3f}s vs {baseline:.3f}s in the baseline"
+
+    def save(self, path: str) -> None:
+        """Write the timings (and where they were measured) to a file.
+
+        Args:
+            path (str): Destination file.
+        """
+        results: Dict[str, Any] = {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "machine": platform.platform(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "timings": self.timings,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+@pytest.fixture(name="results", scope="session")
+def fixture_results() -> Iterator[BenchmarkResults]:
+    """Timings of the session, saved once every benchmark has run."""
+    baseline: Dict[str, float] = {}
+    if os.environ.get("NLCA_BENCHMARK_BASELINE"):
+        with open(os.environ["NLCA_BENCHMARK_BASELINE"], encoding="utf-8") as f:
+            baseline = json.load(f)["timings"]
+
+    results = BenchmarkResults(
+        baseline, tolerance=float(os.environ.get("NLCA_BENCHMARK_TOLERANCE", "1.5"))
+    )
+    yield results
+
+    if results.timings:
+        results.save(os.environ.get("NLCA_BENCHMARK_RESULTS", "benchmark-results.json"))
+
+
+@pytest.fixture(name="wells", scope="session", params=ROWS, ids=str)
+def fixture_wells(request: pytest.FixtureRequest) -> pd.DataFrame:
+    """Synthetic raw well data, of each of the benchmarked sizes."""
+    return generate_wells(request.param, seed=42)
+
+
+@pytest.fixture(name="wells_csv", scope="session", params=ROWS, ids=str)
+def fixture_wells_csv(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> str:
+    """Synthetic input file, of each of the benchmarked sizes."""
+    path: str = str(tmp_path_factory.mktemp("wells") / f"wells-{request.param}.csv")
+    write_wells_csv(path, request.param, seed=42)
+
+    return path
@@ -0,0 +1,170 @@
+"""Seeded generator of synthetic (raw) well data.
+
+The generated data has the columns of the real input file, as read by
+the `main` command (every value a string, missing values empty). A
+controllable share of the values is missing or invalid, so every
+branch of the silver pipeline is exercised.
+"""
+
+import os
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from nlca_pipelines.validation.values import CATEGORICAL_DOMAINS
+
+# columns of the input file, in order
+COLUMNS: List[str] = [
+    "api10",
+    "direction",
+    "wellname",
+    "welltype",
+    "operator",
+    "basin",
+    "subbasin",
+    "state",
+    "county",
+    "spuddate",
+    "cum12moil",
+    "cum12mgas",
+    "cum12mwater",
+]
+
+# invalid values, by column
+_INVALID: Dict[str, List[str]] = {
+    "categorical": ["unknown", "n/a", "123"],
+    "spuddate": ["2020-13-45", "not a date", "2999-01-01"],
+    "count": ["n/a", "-12", "1.5"],
+}
+
+_OPERATORS: List[str] = ["Acme Oil", "Big Sky Energy", "Lone Star E&P", "Mesa Ops"]
+
+_EPOCH: np.datetime64 = np.datetime64("1990-01-01")
+_DAYS: int = int((np.datetime64("2023-12-31") - _EPOCH).astype(int))
+
+
+def _categorical(rng: np.random.Generator, values: List[str], rows: int) -> np.ndarray:
+    """Random choice of valid values, in the mixed case of the raw data."""
+    cased: List[str] = [v.title() for v in values] + [v.upper() for v in values]
+
+    return rng.choice(np.array(cased, dtype=object), rows)
+
+
+def _spoil(
+    rng: np.random.Generator,
+    col: np.ndarray,
+    invalid: List[str],
+    invalid_rate: float,
+    missing_rate: float,
+) -> np.ndarray:
+    """Replace a share of a column's values with invalid and missing ones."""
+    draw: np.ndarray = rng.random(len(col))
+    is_invalid: np.ndarray = draw < invalid_rate
+    col[is_invalid] = rng.choice(np.array(invalid, dtype=object), is_invalid.sum())
+    col[(draw >= invalid_rate) & (draw < invalid_rate + missing_rate)] = ""
+
+    return col
+
+
+def generate_wells(
+    rows: int,
+    seed: int = 0,
+    invalid_rate: float = 0.01,
+    missing_rate: float = 0.05,
+    offset: int = 0,
+) -> pd.DataFrame:
+    """Generate raw well data.
+
+    Args:
+        rows (int): Number of rows.
+        seed (int): Seed of the random generator; the same arguments
+            always generate the same data.
+        invalid_rate (float): Share of invalid values in each validated
+            column.
+        missing_rate (float): Share of missing (empty) values in each
+            column (including `api10`, so such rows are filtered out).
+        offset (int): Position of the first row in the whole data set,
+            so that data generated in chunks has unique `api10` values.
+
+    Returns:
+        pd.DataFrame: Raw well data, every value a string.
+
+    Raises:
+        ValueError: If the rates are not valid shares.
+    """
+    if min(invalid_rate, missing_rate) < 0 or invalid_rate + missing_rate > 1:
+        raise ValueError("Invalid and missing rates must be shares summing to <= 1.")
+
+    rng = np.random.default_rng(seed=seed)
+    columns: Dict[str, np.ndarray] = {}
+
+    # unique ids, in random order
+    api10: np.ndarray = 4_200_000_000 + offset + rng.permutation(rows)
+    columns["api10"] = _spoil(
+        rng, api10.astype(str).astype(object), [], 0.0, missing_rate
+    )
+
+    for col in ["direction", "welltype", "basin", "subbasin", "state", "county"]:
+        values: List[str] = list(CATEGORICAL_DOMAINS[col])
+        columns[col] = _spoil(
+            rng,
+            _categorical(rng, values, rows),
+            _INVALID["categorical"],
+            invalid_rate,
+            missing_rate,
+        )
+
+    columns["wellname"] = np.char.add("Well #", rng.integers(1, 999, rows).astype(str))
+    columns["operator"] = rng.choice(np.array(_OPERATORS, dtype=object), rows)
+
+    days: np.ndarray = rng.integers(0, _DAYS, rows)
+    spuddate: np.ndarray = np.datetime_as_string(_EPOCH + days, unit="D")
+    columns["spuddate"] = _spoil(
+        rng, spuddate.astype(object), _INVALID["spuddate"], invalid_rate, missing_rate
+    )
+
+    for col in ["cum12moil", "cum12mgas", "cum12mwater"]:
+        production: np.ndarray = rng.lognormal(mean=9, sigma=1.5, size=rows)
+        columns[col] = _spoil(
+            rng,
+            production.astype(np.int64).astype(str).astype(object),
+            _INVALID["count"],
+            invalid_rate,
+            missing_rate,
+        )
+
+    return pd.DataFrame({col: columns[col].astype(object) for col in COLUMNS})
+
+
+def write_wells_csv(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    path: str,
+    rows: int,
+    seed: int = 0,
+    chunksize: int = 1_000_000,
+    invalid_rate: float = 0.01,
+    missing_rate: float = 0.05,
+) -> None:
+    """Generate raw well data into a CSV file, a chunk at a time.
+
+    Args:
+        path (str): Destination file; left as is if it already exists.
+        rows (int): Number of rows.
+        seed (int): Seed of the random generator (each chunk is seeded
+            from it, so the file is reproducible).
+        chunksize (int): Number of rows generated at a time.
+        invalid_rate (float): Share of invalid values.
+        missing_rate (float): Share of missing values.
+    """
+    if os.path.exists(path):
+        return
+
+    for i, start in enumerate(range(0, rows, chunksize)):
+        chunk: pd.DataFrame = generate_wells(
+            min(chunksize, rows - start),
+            seed=seed + i,
+            invalid_rate=invalid_rate,
+            missing_rate=missing_rate,
+            offset=start,
+        )
+        chunk.to_csv(path, mode="a" if i else "w", header=not i, index=False)
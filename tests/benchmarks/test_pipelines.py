@@ -0,0 +1,210 @@
+"""Benchmark every step of both pipelines, the `main` command and uploads.
+
+These run only when the `NLCA_BENCHMARK` environment variable is set
+(see `conftest.py` for the other settings):
+$ NLCA_BENCHMARK=1 pytest tests/benchmarks -s
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import (
+    Dict,
+    List,
+    Optional,
+    cast,
+)
+
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from nlca_pipelines.ingestion import WELLS_SCHEMA, read_options
+from nlca_pipelines.pipelines import (
+    BronzePipeline,
+    BronzePipelineOptionsDict,
+    SilverPipeline,
+    StepProfiler,
+)
+from nlca_pipelines.sources import LocalFileClient
+from nlca_pipelines.uploads import (
+    LocalS3Client,
+    UploadDict,
+    upload_frames,
+)
+
+from .conftest import BenchmarkResults
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("NLCA_BENCHMARK"), reason="benchmarks are opt-in"
+)
+
+# the CLI and its helpers depend on the Google Drive and S3 clients
+helper = pytest.importorskip("nlca_pipelines.helper")
+main_module = pytest.importorskip("nlca_pipelines.__main__")
+
+# timings within 10% of each other are considered equal
+FUSION_NOISE: float = 1.1
+
+
+@pytest.fixture(name="bronze_pipeline")
+def fixture_bronze_pipeline(tmp_path: Path) -> BronzePipeline:
+    """Bronze pipeline, created as by the `main` command."""
+    path: Path = tmp_path / "wells.csv"
+    path.write_text(",".join(WELLS_SCHEMA) + "\n", encoding="utf-8")
+
+    pipeline: BronzePipeline = helper.create_bronze_pipeline(LocalFileClient(str(path)))
+
+    return pipeline
+
+
+@pytest.fixture(name="silver_pipeline")
+def fixture_silver_pipeline() -> SilverPipeline:
+    """Silver pipeline, created as by the `main` command."""
+    pipeline: SilverPipeline = helper.create_silver_pipeline()
+
+    return pipeline
+
+
+def _record_steps(
+    results: BenchmarkResults, tier: str, profiler: StepProfiler, rows: int
+) -> None:
+    """Record the wall time of every profiled step."""
+    for step in profiler.report()["steps"]:
+        results.record(f"{tier}.{step['name']}[{rows}]", step["wall_seconds"])
+
+
+def test_bronze_steps(
+    wells: pd.DataFrame, bronze_pipeline: BronzePipeline, results: BenchmarkResults
+) -> None:
+    """Time each step of the bronze pipeline."""
+    profiler = StepProfiler()
+    bronze_pipeline.add_hook(profiler)
+
+    bronze_pipeline.run(df=wells.copy())
+
+    _record_steps(results, "bronze", profiler, len(wells))
+
+
+def test_silver_steps(
+    wells: pd.DataFrame,
+    bronze_pipeline: BronzePipeline,
+    silver_pipeline: SilverPipeline,
+    results: BenchmarkResults,
+) -> None:
+    """Time each step of the silver pipeline."""
+    bronze_df: pd.DataFrame = bronze_pipeline.run(df=wells.copy())
+    profiler = StepProfiler()
+    silver_pipeline.add_hook(profiler)
+
+    silver_pipeline.run(df=bronze_df)
+
+    _record_steps(results, "silver", profiler, len(wells))
+
+
+def test_fused_columns(
+    wells: pd.DataFrame, bronze_pipeline: BronzePipeline, results: BenchmarkResults
+) -> None:
+    """Time the bronze metadata column steps fused, and on their own.
+
+    Both variants add the same columns in place, so the fused steps must
+    be no slower than the steps on their own (within `FUSION_NOISE`).
+    The runs of both variants are interleaved, keeping the best of each.
+    `add_id` is left out: generating random ids costs the same either
+    way, and would only add noise.
+    """
+    steps: List[str] = [
+        step
+        for step in bronze_pipeline.steps
+        if step.startswith("add_") and step != "add_id"
+    ]
+    options = cast(BronzePipelineOptionsDict, bronze_pipeline.options)
+    pipelines: Dict[str, BronzePipeline] = {
+        mode: BronzePipeline(
+            steps=steps, options={**options, "fuse_steps": mode == "fused"}
+        )
+        for mode in ["fused", "unfused"]
+    }
+    seconds: Dict[str, float] = {mode: float("inf") for mode in pipelines}
+    for _ in range(10):
+        for mode, pipeline in pipelines.items():
+            df: pd.DataFrame = wells.copy()
+            start: float = time.perf_counter()
+            pipeline.run(df=df)
+            seconds[mode] = min(seconds[mode], time.perf_counter() - start)
+
+    for mode, best in seconds.items():
+        results.record(f"bronze.columns.{mode}[{len(wells)}]", best)
+    assert seconds["fused"] <= seconds["unfused"] * FUSION_NOISE
+
+
+@pytest.mark.parametrize("parts", [1, 4])
+def test_read(wells_csv: str, results: BenchmarkResults, parts: int) -> None:
+    """Time reading the columns of a local input file, split into byte ranges."""
+    client = LocalFileClient(wells_csv, io_options=read_options(schema=WELLS_SCHEMA))
+
+    start: float = time.perf_counter()
+    raw_df: pd.DataFrame = client.read(parts=parts, workers=parts)
+    seconds: float = time.perf_counter() - start
+
+    results.record(f"read.parts{parts}[{len(raw_df)}]", seconds)
+
+
+@pytest.mark.parametrize("chunksize", [None, 100_000], ids=["whole", "chunked"])
+def test_main(
+    wells_csv: str,
+    results: BenchmarkResults,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    chunksize: Optional[int],
+) -> None:
+    """Time the `main` command, reading and writing local files.
+
+    The input is read from (and the output written to) local disk, with
+    `--input-path` and `--output-local`, rather than Google Drive and
+    S3, so network time is not included.
+    """
+    monkeypatch.chdir(tmp_path)
+    args: List[str] = ["main", "--input-path", wells_csv, "--output-local"]
+    if chunksize:
+        args += ["--chunksize", str(chunksize)]
+
+    start: float = time.perf_counter()
+    result = CliRunner().invoke(main_module.cli, args, catch_exceptions=False)
+    seconds: float = time.perf_counter() - start
+
+    assert result.exit_code == 0, result.output
+    # the input file is named after its number of rows (see `fixture_wells_csv`)
+    rows: int = int(Path(wells_csv).stem.split("-")[-1])
+    mode: str = "chunked" if chunksize else "whole"
+    results.record(f"main.{mode}[{rows}]", seconds)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_upload(
+    wells: pd.DataFrame, results: BenchmarkResults, tmp_path, workers: int
+) -> None:
+    """Time uploading the bronze and silver CSV outputs, in parts.
+
+    The objects are uploaded to a local stand-in for S3 with a simulated
+    latency per request: a single worker serializes and uploads the
+    tiers in turn, more overlap them.
+    """
+    client = LocalS3Client(str(tmp_path), latency=0.05, min_part_size=1)
+    uploads: List[UploadDict] = [
+        {"df": wells, "bucket": bucket, "key": "data/wells.csv"}
+        for bucket in ["nlca-bronze", "nlca-silver"]
+    ]
+
+    start: float = time.perf_counter()
+    upload_frames(
+        uploads,
+        client,
+        "csv",
+        workers=workers,
+        part_size=1024**2,
+        io_options={"index": False, "sep": "|"},
+    )
+    seconds: float = time.perf_counter() - start
+
+    results.record(f"upload.workers{workers}[{len(wells)}]", seconds)
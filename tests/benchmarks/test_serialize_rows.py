@@ -0,0 +1,45 @@
+"""Benchmark the columnar `serialize_rows` against the per-row original.
+
+These run only when the `NLCA_BENCHMARK` environment variable is set:
+$ NLCA_BENCHMARK=1 pytest tests/benchmarks -s
+"""
+
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nlca_pipelines.pipelines import BronzePipeline
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("NLCA_BENCHMARK"), reason="benchmarks are opt-in"
+)
+
+ROWS: int = 1_000_000
+
+
+@pytest.fixture(name="raw_df")
+def fixture_raw_df() -> pd.DataFrame:
+    """1M rows of raw string data, as read from the input file."""
+    rng = np.random.default_rng(seed=42)
+    choices = ["Permian", "Eagle Ford", "OIL", "12345", "2020-01-01", "", 'a"b']
+
+    return pd.DataFrame({f"col{i}": rng.choice(choices, ROWS) for i in range(14)})
+
+
+def test_serialize_rows(raw_df: pd.DataFrame) -> None:
+    """The columnar serializer is identical to, and faster than, per-row."""
+    start = time.perf_counter()
+    expected = raw_df.apply(lambda row: json.dumps(row.to_dict()), axis=1)
+    per_row = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = BronzePipeline.serialize_rows(df=raw_df.copy())["source_row"]
+    columnar = time.perf_counter() - start
+
+    print(f"\nserialize_rows: per-row {per_row:.2f}s, columnar {columnar:.2f}s")
+    pd.testing.assert_series_equal(actual, expected, check_names=False)
+    assert columnar < per_row
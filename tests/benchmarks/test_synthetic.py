@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+
+from nlca_pipelines.pipelines import SilverPipeline
+
+from .synthetic import (
+    COLUMNS,
+    generate_wells,
+    write_wells_csv,
+)
+
+
+def test_generate_wells_seeded() -> None:
+    """Test the same seed generates the same data."""
+    pd.testing.assert_frame_equal(
+        generate_wells(100, seed=1), generate_wells(100, seed=1)
+    )
+    assert not generate_wells(100, seed=1).equals(generate_wells(100, seed=2))
+
+
+def test_generate_wells_rates() -> None:
+    """Test the shares of invalid and missing values."""
+    df = generate_wells(20_000, invalid_rate=0.1, missing_rate=0.2)
+
+    assert df.columns.tolist() == COLUMNS
+    assert (df["api10"] == "").mean() == pytest.approx(0.2, abs=0.02)
+    assert df["api10"][df["api10"] != ""].is_unique
+
+    basin = SilverPipeline(
+        steps=["eliminate_invalid_values"],
+        options={"cols_to_elim_invalid_values": ["basin"]},
+    ).run(df=df[["basin"]].copy())["basin"]
+    assert basin.isna().mean() == pytest.approx(0.3, abs=0.02)
+
+
+def test_generate_wells_invalid_rates() -> None:
+    """Test rates that are not shares are rejected."""
+    with pytest.raises(ValueError):
+        generate_wells(10, invalid_rate=0.6, missing_rate=0.6)
+
+
+def test_write_wells_csv(tmp_path) -> None:
+    """Test data written in chunks has unique ids."""
+    path = str(tmp_path / "wells.csv")
+    write_wells_csv(path, 25, chunksize=10)
+
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+
+    assert len(df) == 25
+    assert df["api10"][df["api10"] != ""].is_unique
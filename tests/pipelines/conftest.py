@@ -1,5 +1,6 @@
 # pylint: disable=bad-staticmethod-argument
 # ^^^ Due to known pylint issue: https://github.com/pylint-dev/pylint/issues/5441
+# pylint: disable=unused-argument
 
 from datetime import datetime
 from typing import (
@@ -14,8 +15,28 @@ import pytest
 
 from nlca_pipelines.pipelines import BronzePipeline
 from nlca_pipelines.pipelines._base import BasePipeline
+from nlca_pipelines.pipelines._fusion import (
+    COLUMNS,
+    add_columns,
+    fuse,
+)
+from nlca_pipelines.pipelines._scope import (
+    GLOBAL,
+    ROW_LOCAL,
+    scope,
+)
 from nlca_pipelines.validation import validate
 
+# steps of the bronze pipeline, as in `create_bronze_pipeline`
+BRONZE_STEPS: List[str] = [
+    "serialize_rows",
+    "add_source_name",
+    "add_source_uri",
+    "add_row_number",
+    "add_source_updated_at",
+    "add_id",
+]
+
 
 class SamplePipeline(BasePipeline):
     """This is a sample pipeline used for testing.
@@ -31,6 +52,7 @@ class SamplePipeline(BasePipeline):
     ) -> None:
         super().__init__(steps, options)
 
+    @scope(ROW_LOCAL)
     @validate(required_cols=["name"])
     @staticmethod
     def step_one(df: pd.DataFrame) -> pd.DataFrame:
@@ -67,6 +89,7 @@ class SamplePipeline(BasePipeline):
 
         return df
 
+    @scope(ROW_LOCAL)
     @staticmethod
     def step_three(df: pd.DataFrame) -> pd.DataFrame:
         """Adds a `step_three` column with the value `3`.
@@ -81,6 +104,71 @@ class SamplePipeline(BasePipeline):
 
         return df
 
+    @scope(GLOBAL)
+    def step_total(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Adds a `total_age` column with the sum of all ages.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            pd.DataFrame: Data with a `total_age` column added.
+        """
+        df["total_age"] = df["age"].sum()
+
+        return df
+
+    @scope(ROW_LOCAL)
+    def step_position(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Adds a `position` column with the row's position in the input.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            pd.DataFrame: Data with a `position` column added.
+        """
+        df["position"] = range(self.offset, self.offset + len(df))
+
+        return df
+
+    @staticmethod
+    def columns_step_four(df: pd.DataFrame) -> Dict[str, Any]:
+        """The column added by `step_four`."""
+        return {"step_four": 4}
+
+    @scope(ROW_LOCAL)
+    @fuse(COLUMNS)
+    @staticmethod
+    def step_four(df: pd.DataFrame) -> pd.DataFrame:
+        """Adds a `step_four` column with the value `4`.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            pd.DataFrame: Data with a `step_four` column added.
+        """
+        return add_columns(df, SamplePipeline.columns_step_four(df))
+
+    def columns_step_five(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """The column added by `step_five`."""
+        return {"step_five": self.options["five"]}
+
+    @scope(ROW_LOCAL)
+    @fuse(COLUMNS)
+    @validate(required_opts=["five"])
+    def step_five(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Adds a `step_five` column with the value of the `five` option.
+
+        Args:
+            df (pd.DataFrame): Input data.
+
+        Returns:
+            pd.DataFrame: Data with a `step_five` column added.
+        """
+        return add_columns(df, self.columns_step_five(df))
+
 
 @pytest.fixture(name="sample_pipeline")
 def fixture_sample_pipeline():
@@ -98,14 +186,7 @@ def fixture_df() -> pd.DataFrame:
 def fixture_bronze_df(df: pd.DataFrame) -> pd.DataFrame:
     """Reusable bronze-tier dataframe as a fixture."""
     bronze_pipeline = BronzePipeline(
-        steps=[
-            "serialize_rows",
-            "add_source_name",
-            "add_source_uri",
-            "add_row_number",
-            "add_source_updated_at",
-            "add_id",
-        ],
+        steps=BRONZE_STEPS,
         options={
             "skiprows": 1,
             "source_created_at": datetime.now().strftime("%Y-%m-%d"),
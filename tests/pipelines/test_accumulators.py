@@ -0,0 +1,157 @@
+import math
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nlca_pipelines.pipelines import MeanAccumulator, ModeAccumulator
+from nlca_pipelines.pipelines.accumulators import Accumulator, merge_accumulators
+
+
+def _chunks(s: pd.Series, size: int):
+    """Split a series into chunks."""
+    return [s.iloc[i : i + size] for i in range(0, len(s), size)]
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        pytest.param(pd.Series([1, 2, None, 6]), id="float-with-nan"),
+        pytest.param(pd.Series([5, 7, 9], dtype="int64"), id="int"),
+        pytest.param(pd.Series([2**62, 2**62, 2**62]), id="int-overflow"),
+        pytest.param(
+            pd.Series(pd.to_datetime(["2023-07-01", None, "2020-01-15", "1960-03-01"])),
+            id="datetime",
+        ),
+    ],
+)
+def test_mean_matches_pandas(s: pd.Series) -> None:
+    """Test the accumulated mean matches `pd.Series.mean`."""
+    assert MeanAccumulator().update(s).value == s.mean()
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_mean_independent_of_chunks(size: int) -> None:
+    """Test the mean is the same however the column is chunked."""
+    rng = np.random.default_rng(seed=0)
+    s = pd.Series(pd.to_datetime(rng.integers(0, 20_000, 10), unit="D"))
+    expected = MeanAccumulator().update(s).value
+
+    accumulator = MeanAccumulator()
+    for chunk in _chunks(s, size):
+        accumulator.merge(MeanAccumulator().update(chunk))
+
+    assert accumulator.value == expected
+    assert isinstance(accumulator.value, pd.Timestamp)
+
+
+@pytest.mark.parametrize("dtype", ["float64", "Float64", "datetime64[ns]"])
+def test_mean_matches_pandas_large(dtype: str) -> None:
+    """Test the mean of a large column is exactly `pd.Series.mean`."""
+    rng = np.random.default_rng(seed=0)
+    values = (
+        rng.integers(-(10**18), 2 * 10**18, 100_000)
+        if dtype == "datetime64[ns]"
+        else rng.random(100_000) * 10.0 ** rng.integers(-3, 9, 100_000)
+    )
+    s = pd.Series(values).astype(dtype).mask(rng.random(100_000) < 0.1)
+
+    assert MeanAccumulator().update(s).value == s.mean()
+
+
+@pytest.mark.parametrize("size", [1, 7, 100])
+def test_float_mean_chunks(size: int) -> None:
+    """Test chunked float means only differ by the rounding of the sums."""
+    rng = np.random.default_rng(seed=0)
+    s = pd.Series(rng.random(1_000) * 10.0 ** rng.integers(-3, 9, 1_000))
+    whole = pd.Series(rng.integers(0, 10**6, 1_000).astype(float))
+
+    accumulator = MeanAccumulator()
+    exact = MeanAccumulator()
+    for chunk, whole_chunk in zip(_chunks(s, size), _chunks(whole, size)):
+        accumulator.merge(MeanAccumulator().update(chunk))
+        exact.merge(MeanAccumulator().update(whole_chunk))
+
+    assert accumulator.value == pytest.approx(math.fsum(s) / len(s), rel=1e-15)
+    assert exact.value == whole.mean()
+
+
+def test_datetime_mean_truncated() -> None:
+    """Test datetime means are truncated toward zero, as by pandas."""
+    s = pd.Series(pd.to_datetime([-3, 0], unit="ns"))
+
+    assert MeanAccumulator().update(s).value == s.mean()
+
+
+def test_accumulator_abstract() -> None:
+    """Test the base class can't be instantiated."""
+    with pytest.raises(TypeError):
+        Accumulator()  # type: ignore[abstract]  # pylint: disable=abstract-class-instantiated
+
+
+def test_mean_empty() -> None:
+    """Test the mean of no values is None."""
+    accumulator = MeanAccumulator().update(pd.Series([None, None], dtype=object))
+
+    assert accumulator.value is None
+
+
+def test_mean_mixed_kinds() -> None:
+    """Test numbers and datetimes cannot be mixed."""
+    accumulator = MeanAccumulator().update(pd.Series([1, 2]))
+
+    with pytest.raises(ValueError):
+        accumulator.update(pd.Series([datetime(2023, 7, 1)]))
+
+
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        pytest.param(pd.Series([1, 2, 1, 2, 1, 2, 3, None]), 1, id="tie-smallest"),
+        pytest.param(pd.Series(["OIL", "GAS", "GAS", None]), "GAS", id="str"),
+        pytest.param(
+            pd.Series(["OIL", "OIL"], dtype=pd.CategoricalDtype(["GAS", "OIL"])),
+            "OIL",
+            id="categorical",
+        ),
+    ],
+)
+def test_mode_matches_pandas(s: pd.Series, expected) -> None:
+    """Test the accumulated mode matches `pd.Series.mode()[0]`."""
+    accumulator = ModeAccumulator()
+    for chunk in _chunks(s, 3):
+        accumulator.merge(ModeAccumulator().update(chunk))
+
+    assert accumulator.value == expected
+    assert accumulator.value == s.mode()[0]
+
+
+def test_mode_empty() -> None:
+    """Test the mode of no values is None."""
+    assert ModeAccumulator().update(pd.Series([None], dtype=object)).value is None
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    """Test accumulators round trip through disk."""
+    path = str(tmp_path / "mode.pkl")
+    ModeAccumulator().update(pd.Series(["OIL", "GAS", "GAS"])).save(path)
+
+    assert ModeAccumulator.load(path).value == "GAS"
+    with pytest.raises(TypeError):
+        MeanAccumulator.load(path)
+
+
+def test_merge_accumulators() -> None:
+    """Test merging collections of accumulators by column."""
+    left = {"a": MeanAccumulator().update(pd.Series([1, 2]))}
+    right = {
+        "a": MeanAccumulator().update(pd.Series([6])),
+        "b": MeanAccumulator().update(pd.Series([4])),
+    }
+
+    merged = merge_accumulators(left, right)
+
+    assert merged["a"].value == 3
+    assert merged["b"].value == 4
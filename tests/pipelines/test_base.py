@@ -3,6 +3,8 @@ from typing import List
 import pandas as pd
 import pytest
 
+from nlca_pipelines.pipelines import StepProfiler
+
 
 def test_run(df: pd.DataFrame, sample_pipeline) -> None:
     """This tests the run method of the `BasePipeline`."""
@@ -60,3 +62,178 @@ def test_required_opts(sample_pipeline) -> None:
     """Test that `required_opts` gets set as a method attribute."""
     pipeline = sample_pipeline(steps=["step_two"])
     assert "force_upper" in getattr(getattr(pipeline, "step_two"), "required_opts")
+
+
+@pytest.mark.parametrize(
+    "steps, expected",
+    [
+        pytest.param(
+            ["step_one", "step_two", "step_three"],
+            [
+                ("row_local", ["step_one"]),
+                ("global", ["step_two"]),
+                ("row_local", ["step_three"]),
+            ],
+            id="undecorated-is-global",
+        ),
+        pytest.param(
+            ["step_one", "step_three", "step_total", "step_position"],
+            [
+                ("row_local", ["step_one", "step_three"]),
+                ("global", ["step_total"]),
+                ("row_local", ["step_position"]),
+            ],
+            id="grouped",
+        ),
+    ],
+)
+def test_pipeline_stages(sample_pipeline, steps: List[str], expected) -> None:
+    """Test consecutive row-local steps are grouped into stages."""
+    pipeline = sample_pipeline(steps=steps, options={"force_upper": True})
+
+    actual = [
+        (kind, [step.__name__ for step in stage])
+        for kind, stage in pipeline.pipeline_stages
+    ]
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 10])
+def test_run_chunked(sample_pipeline, chunksize: int) -> None:
+    """Test running in chunks matches running on the whole input."""
+    df = pd.DataFrame(
+        {
+            "name": ["Alice Amore", "Bob Bogart", "Carol Cole", "Dan Dee", "Eve E"],
+            "age": [5, 7, 9, 11, 13],
+        }
+    )
+    steps = ["step_one", "step_three", "step_total", "step_position", "step_two"]
+    options = {"force_upper": True}
+
+    expected = sample_pipeline(steps=steps, options=options).run(df=df.copy())
+
+    chunks = [df.iloc[i : i + chunksize].copy() for i in range(0, len(df), chunksize)]
+    actual = list(sample_pipeline(steps=steps, options=options).run_chunked(chunks))
+
+    assert all(len(chunk) <= chunksize for chunk in actual)
+    pd.testing.assert_frame_equal(pd.concat(actual), expected)
+
+
+def test_run_chunked_offsets(sample_pipeline) -> None:
+    """Test row-local steps see each chunk's offset in the stream."""
+    chunks = [pd.DataFrame({"age": [1, 2]}), pd.DataFrame({"age": [3, 4, 5]})]
+    pipeline = sample_pipeline(steps=["step_position"])
+
+    actual = pd.concat(pipeline.run_chunked(chunks))
+
+    assert actual["position"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_run_chunked_no_chunks(sample_pipeline) -> None:
+    """Test running on an empty stream yields nothing."""
+    pipeline = sample_pipeline(steps=["step_three", "step_total"])
+
+    assert not list(pipeline.run_chunked(iter([])))
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_run_parallel(sample_pipeline, workers: int) -> None:
+    """Test running on worker processes matches running in-process."""
+    df = pd.DataFrame(
+        {
+            "name": ["Alice Amore", "Bob Bogart", "Carol Cole", "Dan Dee", "Eve E"],
+            "age": [5, 7, 9, 11, 13],
+        }
+    )
+    steps = ["step_one", "step_position", "step_total", "step_three"]
+
+    expected = sample_pipeline(steps=steps).run(df=df.copy())
+    pipeline = sample_pipeline(
+        steps=steps, options={"workers": workers, "min_rows_per_worker": 1}
+    )
+    profiler = StepProfiler()
+    pipeline.add_hook(profiler)
+    actual = pipeline.run(df=df.copy())
+
+    pd.testing.assert_frame_equal(actual, expected)
+    names = [step["name"] for step in profiler.report()["steps"]]
+    assert names == ["step_one+step_position", "step_total", "step_three"]
+
+
+def test_run_parallel_small_input(sample_pipeline) -> None:
+    """Test inputs too small to split are transformed in-process."""
+    pipeline = sample_pipeline(
+        steps=["step_one", "step_three"],
+        options={"workers": 4, "min_rows_per_worker": 3},
+    )
+    profiler = StepProfiler()
+    pipeline.add_hook(profiler)
+
+    pipeline.run(df=pd.DataFrame({"name": ["Alice Amore", "Bob Bogart"]}))
+
+    names = [step["name"] for step in profiler.report()["steps"]]
+    assert names == ["step_one", "step_three"]
+
+
+def test_run_chunked_parallel(sample_pipeline) -> None:
+    """Test running chunks on worker processes keeps order and offsets."""
+    chunks = [pd.DataFrame({"age": range(i, i + 3)}) for i in range(0, 30, 3)]
+    pipeline = sample_pipeline(
+        steps=["step_position", "step_three"], options={"workers": 2}
+    )
+
+    actual = pd.concat(pipeline.run_chunked(chunks))
+
+    assert actual["age"].tolist() == list(range(30))
+    assert actual["position"].tolist() == list(range(30))
+
+
+def test_execution_plan(sample_pipeline) -> None:
+    """Test consecutive column steps are fused within row-local stages."""
+    pipeline = sample_pipeline(
+        steps=["step_four", "step_five", "step_one", "step_total", "step_four"],
+        options={"five": 5},
+    )
+
+    assert pipeline.explain() == "\n".join(
+        [
+            "stage 1 (row_local):",
+            "  columns(step_four, step_five)",
+            "  step_one",
+            "stage 2 (global):",
+            "  step_total",
+            "stage 3 (row_local):",
+            "  step_four",
+        ]
+    )
+
+
+@pytest.mark.parametrize("fuse_steps", [True, False])
+def test_run_fused(sample_pipeline, fuse_steps: bool) -> None:
+    """Test fused steps add the same columns, in place, as on their own."""
+    df = pd.DataFrame({"age": [5, 7, 8]})
+    pipeline = sample_pipeline(
+        steps=["step_four", "step_five"],
+        options={"five": 5, "fuse_steps": fuse_steps},
+    )
+    profiler = StepProfiler()
+    pipeline.add_hook(profiler)
+
+    actual = pipeline.run(df=df)
+
+    assert actual is df
+    assert actual.columns.tolist() == ["age", "step_four", "step_five"]
+    assert actual["step_five"].tolist() == [5, 5, 5]
+    names = [step["name"] for step in profiler.report()["steps"]]
+    assert names == (
+        ["step_four+step_five"] if fuse_steps else ["step_four", "step_five"]
+    )
+
+
+def test_run_fused_required_opts(sample_pipeline) -> None:
+    """Test fused steps still check their requirements."""
+    pipeline = sample_pipeline(steps=["step_four", "step_five"])
+
+    with pytest.raises(ValueError, match="Missing required options: five"):
+        pipeline.run(df=pd.DataFrame({"age": [5]}))
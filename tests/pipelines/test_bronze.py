@@ -1,10 +1,18 @@
+import uuid
 from datetime import datetime
 from typing import List
 
 import pandas as pd
 import pytest
 
-from nlca_pipelines.pipelines import BronzePipeline, BronzePipelineOptionsDict
+from nlca_pipelines.pipelines import (
+    BronzePipeline,
+    BronzePipelineOptionsDict,
+    materialize_source_row,
+    source_rows,
+)
+
+from .conftest import BRONZE_STEPS
 
 NOW: datetime = datetime.now()
 
@@ -38,6 +46,29 @@ def test_add_id(df: pd.DataFrame) -> None:
     actual: pd.DataFrame = BronzePipeline.add_id(df=df)
 
     assert "id" in actual.columns
+    assert actual["id"].is_unique
+    assert all(uuid.UUID(v).version == 4 for v in actual["id"])
+
+
+def test_add_deterministic_id(df: pd.DataFrame) -> None:
+    """Test the `add_deterministic_id` method is idempotent."""
+    pipeline = BronzePipeline(
+        steps=["add_source_uri", "add_row_number", "add_deterministic_id"],
+        options={"skiprows": 1, "source_uri": "https://google.com/somefile.zip"},
+    )
+    first: pd.DataFrame = pipeline.run(df=df.copy())
+    second: pd.DataFrame = pipeline.run(df=df.copy())
+
+    assert first["id"].tolist() == second["id"].tolist()
+    assert first["id"].iloc[0] == str(
+        uuid.uuid5(uuid.NAMESPACE_URL, "https://google.com/somefile.zip#1")
+    )
+
+
+def test_add_deterministic_id_requires_source_cols(df: pd.DataFrame) -> None:
+    """Test the `add_deterministic_id` method requires source columns."""
+    with pytest.raises(ValueError):
+        BronzePipeline.add_deterministic_id(df=df)
 
 
 def test_add_row_number(df: pd.DataFrame) -> None:
@@ -50,6 +81,18 @@ def test_add_row_number(df: pd.DataFrame) -> None:
     assert actual["source_row_number"].iloc[0] == 1
 
 
+def test_add_row_number_chunked(df: pd.DataFrame) -> None:
+    """Test the `add_row_number` method numbers rows across chunks."""
+    chunks = [df.iloc[[0]].copy(), df.iloc[[1]].copy()]
+    actual: pd.DataFrame = pd.concat(
+        BronzePipeline(steps=["add_row_number"], options={"skiprows": 1}).run_chunked(
+            chunks
+        )
+    )
+
+    assert actual["source_row_number"].tolist() == [1, 2]
+
+
 def test_add_source_created_at(df: pd.DataFrame) -> None:
     """Test the `add_source_created_at` method."""
     actual: pd.DataFrame = BronzePipeline(
@@ -99,3 +142,61 @@ def test_serialize_rows(df: pd.DataFrame) -> None:
 
     assert "source_row" in actual.columns
     assert actual["source_row"].iloc[0] == '{"name": "Alice Amore", "age": 5}'
+
+
+def test_defer_serialize_rows(df: pd.DataFrame) -> None:
+    """Test deferred rows materialize into the eagerly serialized output."""
+    steps = ["serialize_rows", "add_source_name", "add_row_number"]
+    options: BronzePipelineOptionsDict = {"skiprows": 1, "source_name": "test"}
+    expected = BronzePipeline(steps=steps, options=options).run(df=df.copy())
+
+    deferred = BronzePipeline(
+        steps=["defer_serialize_rows"] + steps[1:], options=options
+    ).run(df=df.copy())
+
+    assert deferred.columns.tolist() == [
+        "source_row.name",
+        "source_row.age",
+        "source_name",
+        "source_row_number",
+    ]
+    assert source_rows(deferred).tolist() == expected["source_row"].tolist()
+    pd.testing.assert_frame_equal(materialize_source_row(deferred), expected)
+    pd.testing.assert_frame_equal(materialize_source_row(expected), expected)
+
+
+def test_fused_columns(df: pd.DataFrame) -> None:
+    """Test the metadata columns are added in a single fused pass."""
+    steps = BRONZE_STEPS
+    options: BronzePipelineOptionsDict = {
+        "skiprows": 1,
+        "source_name": "somefile.zip",
+        "source_uri": "https://google.com/somefile.zip",
+        "source_updated_at": NOW.strftime("%Y-%m-%d"),
+    }
+    pipeline = BronzePipeline(steps=steps, options=options)
+    expected: pd.DataFrame = BronzePipeline(
+        steps=steps, options={**options, "fuse_steps": False}
+    ).run(df=df.copy())
+
+    actual: pd.DataFrame = pipeline.run(df=df.copy())
+
+    assert pipeline.explain().splitlines()[2] == (
+        "  columns(add_source_name, add_source_uri, add_row_number,"
+        " add_source_updated_at, add_id)"
+    )
+    pd.testing.assert_frame_equal(
+        actual.drop(columns="id"), expected.drop(columns="id")
+    )
+    assert actual.columns.tolist() == expected.columns.tolist()
+    assert actual["id"].dtype == expected["id"].dtype
+
+
+def test_fused_columns_required_opts(df: pd.DataFrame) -> None:
+    """Test fused steps still require their options."""
+    pipeline = BronzePipeline(
+        steps=["add_source_name", "add_source_uri"], options={"source_name": "x"}
+    )
+
+    with pytest.raises(ValueError, match="Missing required options: source_uri"):
+        pipeline.run(df=df)
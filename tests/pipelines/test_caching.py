@@ -0,0 +1,122 @@
+import os
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+import pytest
+
+from nlca_pipelines.pipelines import StepCache, StepProfiler
+from nlca_pipelines.pipelines.caching import fingerprint
+
+
+def test_fingerprint(df: pd.DataFrame) -> None:
+    """Test the fingerprint depends on the content of the data."""
+    changed = df.copy()
+    changed.loc[1, "age"] = 8
+
+    assert fingerprint(df) == fingerprint(df.copy())
+    assert fingerprint(df) != fingerprint(changed)
+    assert fingerprint(df) != fingerprint(df.rename(columns={"age": "years"}))
+    assert fingerprint(df) != fingerprint(df.astype({"age": float}))
+
+
+def test_key(sample_pipeline, df: pd.DataFrame, tmp_path: Path) -> None:
+    """Test the key depends on the steps, options and offset."""
+    cache = StepCache(str(tmp_path))
+    pipeline = sample_pipeline(steps=["step_one"], options={"force_upper": True})
+    key: str = cache.key(pipeline, pipeline.pipeline_steps, df)
+
+    # execution options don't change the results
+    other = sample_pipeline(
+        steps=["step_one"], options={"force_upper": True, "workers": 4}
+    )
+    assert cache.key(other, other.pipeline_steps, df) == key
+
+    other = sample_pipeline(steps=["step_one"], options={"force_upper": False})
+    assert cache.key(other, other.pipeline_steps, df) != key
+
+    other = sample_pipeline(steps=["step_three"], options={"force_upper": True})
+    assert cache.key(other, other.pipeline_steps, df) != key
+
+    pipeline.offset = 10
+    assert cache.key(pipeline, pipeline.pipeline_steps, df) != key
+
+
+def test_get_put(df: pd.DataFrame, tmp_path: Path) -> None:
+    """Test results are stored and loaded, with statistics."""
+    cache = StepCache(str(tmp_path / "cache"))
+
+    assert cache.get("abc", name="step") is None
+    cache.put("abc", df)
+    pd.testing.assert_frame_equal(cache.get("abc", name="step"), df)
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 1, 0)
+    assert stats["steps"] == {"step": {"hits": 1, "misses": 1}}
+    assert stats["size_bytes"] > 0
+    assert os.listdir(tmp_path / "cache") == ["abc.pkl"]
+
+
+def test_evict(df: pd.DataFrame, tmp_path: Path) -> None:
+    """Test the least recently used results are evicted first."""
+    cache = StepCache(str(tmp_path))
+    cache.put("a", df)
+    size: int = cache.size()
+    cache.max_bytes = 2 * size
+
+    cache.put("b", df)
+    os.utime(tmp_path / "a.pkl", (0, 0))
+    os.utime(tmp_path / "b.pkl", (1, 1))
+    assert cache.get("a") is not None  # "a" is now the most recently used
+    cache.put("c", df)
+
+    assert sorted(os.listdir(tmp_path)) == ["a.pkl", "c.pkl"]
+    assert cache.stats()["evictions"] == 1
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+@pytest.mark.parametrize(
+    "steps", [["step_one", "step_two"], ["step_one", "step_total", "step_three"]]
+)
+def test_run_cached(
+    sample_pipeline, df: pd.DataFrame, tmp_path: Path, steps: List[str]
+) -> None:
+    """Test a second run loads the output of each stage from the cache."""
+    options = {"force_upper": True, "cache_dir": str(tmp_path)}
+    expected: pd.DataFrame = sample_pipeline(steps=steps, options=options).run(
+        df=df.copy()
+    )
+
+    pipeline = sample_pipeline(steps=steps, options=options)
+    profiler = StepProfiler()
+    pipeline.add_hook(profiler)
+    actual: pd.DataFrame = pipeline.run(df=df.copy())
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert pipeline.cache.stats()["misses"] == 0
+    assert pipeline.cache.stats()["hits"] == len(pipeline.pipeline_stages)
+    # cached steps aren't called
+    assert not profiler.report()["steps"]
+
+
+def test_run_cached_changed_input(
+    sample_pipeline, df: pd.DataFrame, tmp_path: Path
+) -> None:
+    """Test changed input data misses the cache."""
+    options = {"cache_dir": str(tmp_path)}
+    sample_pipeline(steps=["step_one"], options=options).run(df=df.copy())
+
+    changed = df.copy()
+    changed.loc[0, "name"] = "Carol Cole"
+    pipeline = sample_pipeline(steps=["step_one"], options=options)
+    actual: pd.DataFrame = pipeline.run(df=changed)
+
+    assert actual["first_name"].tolist() == ["Carol", "Bob"]
+    assert pipeline.cache.stats()["misses"] == 1
+
+
+def test_run_without_cache(sample_pipeline) -> None:
+    """Test there is no cache by default."""
+    assert sample_pipeline(steps=["step_one"]).cache is None
@@ -0,0 +1,136 @@
+from pathlib import Path
+from typing import cast
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nlca_pipelines.pipelines import GoldPipeline, GoldPipelineOptionsDict
+from nlca_pipelines.validation.schema import apply_schema
+
+STEPS = ["add_spud_year", "aggregate_production", "rank_wells"]
+OPTIONS: GoldPipelineOptionsDict = {
+    "cols_to_group_by": ["basin", "spud_year"],
+    "cols_to_sum": ["cum12moil", "cum12mgas"],
+    "rank_filter": {"welltype": "OIL"},
+    "top_n": 3,
+}
+
+
+@pytest.fixture(name="silver_df")
+def fixture_silver_df() -> pd.DataFrame:
+    """Silver-tier dataframe, with many ties and missing values."""
+    n = 300
+    rng = np.random.default_rng(seed=0)
+    cum = pd.Series(rng.integers(0, 20, n), dtype=float)
+    cum[rng.random(n) < 0.1] = np.nan
+    df = pd.DataFrame(
+        {
+            "api10": [f"42{i:08d}" for i in range(n)],
+            "welltype": rng.choice(["OIL", "GAS"], n),
+            "basin": rng.choice(["BARNETT", "PERMIAN", "ANADARKO", ""], n),
+            "spuddate": pd.Series(
+                pd.Timestamp("2018-01-01")
+                + pd.to_timedelta(rng.integers(0, 1_000, n), "D")
+            ).where(rng.random(n) > 0.1),
+            "cum12moil": cum,
+            "cum12mgas": rng.random(n),
+        }
+    )
+
+    return apply_schema(df)
+
+
+def test_aggregate_production(silver_df: pd.DataFrame) -> None:
+    """Test production is summed by group, with missing groups last."""
+    pipeline = GoldPipeline(steps=STEPS, options=OPTIONS)
+    actual = pipeline.run(df=silver_df)
+    table = pipeline.tables["production_by_basin"]
+
+    assert actual.columns.tolist() == silver_df.columns.tolist() + ["spud_year"]
+    assert table.columns.tolist() == ["basin", "wells", "cum12moil", "cum12mgas"]
+    assert table["basin"].tolist() == ["ANADARKO", "BARNETT", "PERMIAN", None]
+    assert table["wells"].sum() == len(silver_df)
+    expected = silver_df.groupby("basin", observed=True)["cum12moil"].sum()
+    assert table["cum12moil"].iloc[:3].tolist() == expected.tolist()
+    assert pipeline.tables["production_by_spud_year"]["spud_year"].tolist() == [
+        2018,
+        2019,
+        2020,
+        None,
+    ]
+
+
+def test_aggregate_production_all_missing() -> None:
+    """Test the sum of a group without any value is missing, as in SQL."""
+    df = pd.DataFrame({"basin": ["A", "B"], "cum12moil": [1.0, np.nan]})
+    pipeline = GoldPipeline(
+        steps=["aggregate_production"],
+        options={"cols_to_group_by": ["basin"], "cols_to_sum": ["cum12moil"]},
+    )
+    pipeline.run(df=df)
+
+    assert pipeline.tables["production_by_basin"]["cum12moil"].iloc[0] == 1
+    assert pd.isna(pipeline.tables["production_by_basin"]["cum12moil"].iloc[1])
+
+
+def test_rank_wells(silver_df: pd.DataFrame) -> None:
+    """Test the top wells match `nlargest`, overall and per group."""
+    pipeline = GoldPipeline(steps=STEPS, options=OPTIONS)
+    pipeline.run(df=silver_df)
+    oil = silver_df[silver_df["welltype"] == "OIL"]
+
+    top = pipeline.tables["top_wells"]
+    assert top["rank"].tolist() == [1, 2, 3]
+    assert top["api10"].tolist() == oil.nlargest(3, "cum12moil")["api10"].tolist()
+
+    by_basin = pipeline.tables["top_wells_by_basin"]
+    for basin, group in oil.groupby("basin", observed=True):
+        expected = group.nlargest(3, "cum12moil")["api10"].tolist()
+        assert by_basin[by_basin["basin"] == basin]["api10"].tolist() == expected
+    assert by_basin["basin"].iloc[-1] is None
+
+
+@pytest.mark.parametrize("size", [7, 1_000])
+def test_run_chunked(silver_df: pd.DataFrame, size: int) -> None:
+    """Test a single pass over chunks gives the same tables."""
+    expected = GoldPipeline(steps=STEPS, options=OPTIONS)
+    expected.run(df=silver_df.copy())
+    pipeline = GoldPipeline(steps=STEPS, options=OPTIONS)
+
+    actual = pd.concat(
+        pipeline.run_chunked(
+            silver_df.iloc[i : i + size].copy() for i in range(0, len(silver_df), size)
+        )
+    )
+
+    assert len(actual) == len(silver_df)
+    assert list(pipeline.tables) == list(expected.tables)
+    for name, table in expected.tables.items():
+        pd.testing.assert_frame_equal(pipeline.tables[name], table, check_dtype=False)
+
+
+def test_run_cached(silver_df: pd.DataFrame, tmp_path: Path) -> None:
+    """Test the tables are computed again by a run with the cache enabled."""
+    # not a declared gold option, but read by every pipeline
+    options = cast(GoldPipelineOptionsDict, {**OPTIONS, "cache_dir": str(tmp_path)})
+    first = GoldPipeline(steps=STEPS, options=options)
+    first.run(df=silver_df.copy())
+    second = GoldPipeline(steps=STEPS, options=options)
+
+    second.run(df=silver_df.copy())
+
+    assert second.tables.keys() == first.tables.keys()
+    for name, table in first.tables.items():
+        pd.testing.assert_frame_equal(second.tables[name], table)
+    assert second.cache is None
+
+
+def test_missing_options(silver_df: pd.DataFrame) -> None:
+    """Test the aggregation requires the columns to group by and sum."""
+    pipeline = GoldPipeline(
+        steps=["aggregate_production"], options={"cols_to_group_by": ["basin"]}
+    )
+
+    with pytest.raises(ValueError):
+        pipeline.run(df=silver_df)
@@ -0,0 +1,42 @@
+import uuid
+
+import numpy as np
+import pytest
+
+from nlca_pipelines.pipelines._ids import (
+    format_uuids,
+    name_uuids,
+    random_uuids,
+)
+
+
+@pytest.mark.parametrize("n", [0, 1, 1_000])
+def test_random_uuids(n: int) -> None:
+    """Test random ids are valid, unique version 4 UUIDs."""
+    actual = random_uuids(n)
+
+    assert len(actual) == n
+    assert len(set(actual)) == n
+    for v in actual:
+        parsed = uuid.UUID(v)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == v
+
+
+def test_name_uuids_match_uuid5() -> None:
+    """Test name-based ids match `uuid.uuid5`."""
+    names = ["https://google.com/somefile.zip#1", "ünïcode#2", ""]
+    expected = [str(uuid.uuid5(uuid.NAMESPACE_URL, name)) for name in names]
+
+    assert name_uuids(names, uuid.NAMESPACE_URL).tolist() == expected
+
+
+def test_format_uuids() -> None:
+    """Test raw bytes are formatted like `uuid.UUID`."""
+    raw = np.arange(32, dtype=np.uint8).reshape(2, 16)
+
+    assert format_uuids(raw).tolist() == [
+        str(uuid.UUID(bytes=bytes(range(16)))),
+        str(uuid.UUID(bytes=bytes(range(16, 32)))),
+    ]
@@ -0,0 +1,132 @@
+import json
+
+import pandas as pd
+
+from nlca_pipelines.pipelines import _json
+from nlca_pipelines.pipelines._json import (
+    decode_rows,
+    encode_rows,
+    may_have_values,
+    normalize_rows,
+)
+
+
+def test_decode_rows_matches_normalize() -> None:
+    """Test bulk decoding matches `pd.json_normalize` for flat rows."""
+    rows = pd.Series(
+        ['{"api10": "42", "basin": "Permian", "cum12moil": 7}'] * 3,
+        index=[5, 7, 9],
+    )
+    decoded, _ = decode_rows(rows)
+
+    pd.testing.assert_frame_equal(decoded, normalize_rows(rows))
+    assert decoded.index.tolist() == [5, 7, 9]
+    assert decoded["cum12moil"].dtype == "int64"
+
+
+def test_decode_rows_missing_keys() -> None:
+    """Test keys missing from some rows are filled with NaN."""
+    rows = pd.Series(['{"a": 1}', '{"b": "x", "a": 2}'])
+    decoded, _ = decode_rows(rows)
+
+    assert decoded.columns.tolist() == ["a", "b"]
+    assert decoded["a"].tolist() == [1, 2]
+    assert pd.isna(decoded["b"].iloc[0])
+
+
+def test_decode_rows_keys() -> None:
+    """Test only the requested keys are built, in the order they are seen."""
+    rows = pd.Series(['{"a": 1, "b": "x"}', '{"c": 2.5, "a": 2}'])
+    decoded, _ = decode_rows(rows, keys=["c", "a", "z"])
+
+    assert decoded.columns.tolist() == ["a", "c"]
+    assert decoded["a"].tolist() == [1, 2]
+    assert pd.isna(decoded["c"].iloc[0])
+
+
+def test_may_have_values() -> None:
+    """Test rows are only rejected when certain to miss a value."""
+    rows = pd.Series(
+        [
+            '{"api10": "42", "a": 1}',
+            '{"api10": "", "a": 1}',
+            '{"a": 1, "api10": null}',
+            '{"a": "\\"api10\\": \\"42\\""}',
+            '{"api10":"0"}',
+            '{"b": {"api10": "42"}, "api10": ""}',
+        ]
+    )
+
+    assert may_have_values(rows, ["api10"]).tolist() == [
+        True,
+        False,
+        False,
+        False,
+        True,
+        True,
+    ]
+    assert may_have_values(rows, ["api10", "a"]).tolist()[:2] == [True, False]
+
+
+def test_decode_rows_stats() -> None:
+    """Test bulk decoding reports its throughput."""
+    _, stats = decode_rows(pd.Series(['{"a": 1}', '{"a": 2}']))
+
+    assert stats["rows"] == 2
+    assert stats["decoder"] in ("orjson", "json")
+    assert stats["rows_per_second"] > 0
+
+
+def test_decode_rows_empty() -> None:
+    """Test decoding an empty column."""
+    decoded, stats = decode_rows(pd.Series([], dtype=object))
+
+    assert decoded.shape == (0, 0)
+    assert stats["rows"] == 0
+
+
+def test_decode_rows_stdlib_fallback(monkeypatch) -> None:
+    """Test decoding with the standard library `json` module."""
+    monkeypatch.setattr(_json, "_loads", json.loads)
+    decoded, _ = decode_rows(pd.Series(['{"a": null}', '{"a": true}']))
+
+    assert decoded["a"].tolist() == [None, True]
+
+
+def test_encode_rows_matches_json_dumps() -> None:
+    """Test bulk encoding is identical to `json.dumps` per row."""
+    df = pd.DataFrame(
+        {
+            "text": ['quote " here', "ünïcode\n", "%s", ""],
+            "int": [1, 2, 3, -4],
+            "float": [1.5, float("nan"), float("inf"), 1e16],
+            "bool": [True, False, True, False],
+            "mixed": ["x", None, 3, "y"],
+            5: ["a", "b", "c", "d"],
+        },
+        index=[3, 2, 1, 0],
+    )
+    expected = df.apply(lambda row: json.dumps(row.to_dict()), axis=1)
+
+    pd.testing.assert_series_equal(encode_rows(df), expected)
+
+
+def test_encode_rows_mixed_numbers() -> None:
+    """Test integers are encoded as floats when the rows are floats."""
+    dfs = [
+        pd.DataFrame({"int": [1, -2], "float": [1.5, float("nan")]}),
+        pd.DataFrame({"int": [1, -2], "uint": pd.Series([3, 4], dtype="uint8")}),
+        pd.DataFrame({"int": [1, -2], "float": [1.5, 2.0], "bool": [True, False]}),
+    ]
+
+    for df in dfs:
+        expected = df.apply(lambda row: json.dumps(row.to_dict()), axis=1)
+        pd.testing.assert_series_equal(encode_rows(df), expected)
+    assert encode_rows(dfs[0]).tolist()[0] == '{"int": 1.0, "float": 1.5}'
+
+
+def test_encode_rows_no_columns() -> None:
+    """Test encoding rows without any columns."""
+    actual = encode_rows(pd.DataFrame(index=[0, 1]))
+
+    assert actual.tolist() == ["{}", "{}"]
@@ -0,0 +1,157 @@
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from nlca_pipelines.pipelines import (
+    SilverPipeline,
+    StepHook,
+    StepProfiler,
+)
+
+
+class RecordingHook(StepHook):
+    """Hook recording the calls it receives."""
+
+    def __init__(self) -> None:
+        self.calls: List[tuple] = []
+
+    def before_step(self, name: str, df: Optional[pd.DataFrame]) -> None:
+        self.calls.append(("before", name, None if df is None else len(df)))
+
+    def after_step(self, name: str, df: Optional[pd.DataFrame]) -> None:
+        self.calls.append(("after", name, None if df is None else len(df)))
+
+
+def test_hooks(df: pd.DataFrame, sample_pipeline) -> None:
+    """Test hooks are called around every step."""
+    hook = RecordingHook()
+    pipeline = sample_pipeline(steps=["step_one", "step_three"])
+    pipeline.add_hook(hook)
+
+    pipeline.run(df=df)
+
+    assert hook.calls == [
+        ("before", "step_one", 2),
+        ("after", "step_one", 2),
+        ("before", "step_three", 2),
+        ("after", "step_three", 2),
+    ]
+
+
+def test_hooks_chunked(sample_pipeline) -> None:
+    """Test hooks are called around every chunk when running in chunks."""
+    hook = RecordingHook()
+    pipeline = sample_pipeline(steps=["step_three", "step_total"])
+    pipeline.add_hook(hook)
+    chunks = [pd.DataFrame({"age": [1, 2]}), pd.DataFrame({"age": [3]})]
+
+    list(pipeline.run_chunked(chunks))
+
+    assert [call for call in hook.calls if call[1] == "step_three"] == [
+        ("before", "step_three", 2),
+        ("after", "step_three", 2),
+        ("before", "step_three", 1),
+        ("after", "step_three", 1),
+    ]
+    assert [call for call in hook.calls if call[1] == "step_total"] == [
+        ("before", "step_total", 3),
+        ("after", "step_total", 3),
+    ]
+
+
+def test_profiler_report(df: pd.DataFrame, sample_pipeline, tmp_path: Path) -> None:
+    """Test the profiler reports each step."""
+    profiler = StepProfiler(trace_memory=True)
+    pipeline = sample_pipeline(
+        steps=["step_one", "step_two", "step_three"],
+        options={"force_upper": True},
+    )
+    pipeline.add_hook(profiler)
+
+    pipeline.run(df=df)
+    report = profiler.report()
+
+    assert [step["name"] for step in report["steps"]] == [
+        "step_one",
+        "step_two",
+        "step_three",
+    ]
+    for step in report["steps"]:
+        assert step["calls"] == 1
+        assert step["rows_in"] == step["rows_out"] == 2
+        assert step["wall_seconds"] >= 0
+        assert step["df_memory_bytes"] > 0
+        assert step["memory_peak_bytes"] is not None
+    assert report["wall_seconds"] >= sum(s["wall_seconds"] for s in report["steps"])
+
+    path = tmp_path / "report.json"
+    profiler.to_json(str(path))
+    assert json.loads(path.read_text())["steps"][0]["name"] == "step_one"
+
+
+def test_profiler_streamed_sort() -> None:
+    """Test a streamed sort is reported without the nested steps."""
+    profiler = StepProfiler()
+    pipeline = SilverPipeline(
+        steps=["filter_missing", "sort"],
+        options={"cols_to_filter_missing": ["A"], "cols_to_sort_by": ["A"]},
+    )
+    pipeline.add_hook(profiler)
+    df = pd.DataFrame({"A": ["c", None, "a", "b"]})
+    chunks = [df.iloc[i : i + 2].copy() for i in range(0, 4, 2)]
+
+    actual = pd.concat(pipeline.run_chunked(chunks))
+    steps = {step["name"]: step for step in profiler.report()["steps"]}
+
+    assert actual["A"].tolist() == ["a", "b", "c"]
+    assert steps["filter_missing"]["calls"] == 2
+    assert steps["filter_missing"]["rows_in"] == 4
+    assert steps["filter_missing"]["rows_out"] == 3
+    assert steps["sort"]["calls"] == 2
+    assert steps["sort"]["rows_out"] == 3
+
+
+def test_profiler_two_pass() -> None:
+    """Test the statistics pass of a chunked aggregate step is reported."""
+    profiler = StepProfiler()
+    pipeline = SilverPipeline(
+        steps=["impute_with_mean"], options={"cols_to_impute_with_mean": ["A"]}
+    )
+    pipeline.add_hook(profiler)
+    chunks = [pd.DataFrame({"A": [1.0, None]}), pd.DataFrame({"A": [3.0]})]
+
+    actual = pd.concat(pipeline.run_chunked(chunks))
+    steps = {step["name"]: step for step in profiler.report()["steps"]}
+
+    assert actual["A"].tolist() == [1.0, 2.0, 3.0]
+    assert steps["fit_impute_with_mean"]["calls"] == 2
+    assert steps["fit_impute_with_mean"]["rows_in"] == 3
+    assert steps["fit_impute_with_mean"]["rows_out"] == 0
+    assert steps["apply_impute_with_mean"]["rows_out"] == 3
+
+
+def test_profiler_parallel() -> None:
+    """Test a stage run on worker processes is reported with its rows in."""
+    profiler = StepProfiler()
+    pipeline = SilverPipeline(
+        steps=["filter_missing", "eliminate_invalid_values"],
+        options={
+            "cols_to_filter_missing": ["A"],
+            "cols_to_elim_invalid_values": [],
+            "workers": 2,
+            "min_rows_per_worker": 2,
+        },
+    )
+    pipeline.add_hook(profiler)
+    df = pd.DataFrame({"A": ["a", None, "b", "c", None, "d"]})
+
+    actual = pipeline.run(df=df)
+    (step,) = profiler.report()["steps"]
+
+    assert actual["A"].tolist() == ["a", "b", "c", "d"]
+    assert step["name"] == "filter_missing+eliminate_invalid_values"
+    assert step["calls"] == 2
+    assert step["rows_in"] == 6
+    assert step["rows_out"] == 4
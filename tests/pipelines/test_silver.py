@@ -1,18 +1,151 @@
 from datetime import datetime
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from nlca_pipelines.pipelines import SilverPipeline
+from nlca_pipelines.pipelines import (
+    BronzePipeline,
+    BronzePipelineOptionsDict,
+    SilverPipeline,
+    SilverPipelineOptionsDict,
+)
+from nlca_pipelines.validation import SILVER_DTYPES
 
 
+@pytest.mark.parametrize("mode", ["bulk", "normalize"])
 @pytest.mark.parametrize("expected_col", ["id", "name", "age"])
-def test_parse_json(bronze_df: pd.DataFrame, expected_col: str) -> None:
+def test_parse_json(bronze_df: pd.DataFrame, expected_col: str, mode: str) -> None:
     """Testing the `parse_json` method."""
-    pipeline = SilverPipeline(steps=["parse_json"])
+    pipeline = SilverPipeline(steps=["parse_json"], options={"json_mode": mode})
     actual: pd.DataFrame = pipeline.run(df=bronze_df)
 
     assert expected_col in actual.columns
+    assert "source_row" not in actual.columns
+
+
+def test_parse_json_modes_agree(bronze_df: pd.DataFrame) -> None:
+    """Testing the bulk and normalize JSON modes agree."""
+    results = [
+        SilverPipeline(steps=["parse_json"], options={"json_mode": mode}).run(
+            df=bronze_df.copy()
+        )
+        for mode in ["bulk", "normalize"]
+    ]
+
+    pd.testing.assert_frame_equal(results[0], results[1])
+
+
+def test_parse_json_decode_stats(bronze_df: pd.DataFrame) -> None:
+    """Testing the bulk `parse_json` records its throughput."""
+    pipeline = SilverPipeline(steps=["parse_json"])
+    pipeline.run(df=bronze_df)
+
+    assert pipeline.decode_stats["rows"] == bronze_df.shape[0]
+    assert pipeline.decode_stats["seconds"] >= 0
+
+
+@pytest.mark.parametrize("chunksize", [None, 1])
+def test_parse_json_deferred(df: pd.DataFrame, chunksize: Optional[int]) -> None:
+    """Testing deferred input columns give the same result as JSON rows."""
+    steps = ["add_source_name", "add_id"]
+    options: BronzePipelineOptionsDict = {"source_name": "somefile.zip"}
+    bronze_df = BronzePipeline(steps=["serialize_rows"] + steps, options=options).run(
+        df=df.copy()
+    )
+    deferred = BronzePipeline(
+        steps=["defer_serialize_rows"] + steps, options=options
+    ).run(df=df.copy())
+    deferred["id"] = bronze_df["id"]
+    pipeline = SilverPipeline(steps=["parse_json"])
+
+    expected: pd.DataFrame = pipeline.run(df=bronze_df)
+    actual: pd.DataFrame = (
+        pd.concat(
+            pipeline.run_chunked(
+                deferred.iloc[i : i + chunksize].copy()
+                for i in range(0, len(deferred), chunksize)
+            )
+        )
+        if chunksize
+        else pipeline.run(df=deferred)
+    )
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert not pipeline.decode_stats
+
+
+@pytest.fixture(name="sparse_bronze_df")
+def fixture_sparse_bronze_df() -> pd.DataFrame:
+    """Bronze-tier dataframe with missing required values and unused columns."""
+    df = pd.DataFrame(
+        {
+            "api10": ["3", "", "1", None, "2"],
+            "basin": ["b", "a", "", "c", "a"],
+            "comment": ["x", "y", "z", "", "w"],
+        }
+    )
+
+    return BronzePipeline(steps=["serialize_rows", "add_id"]).run(df=df)
+
+
+@pytest.mark.parametrize("mode", ["bulk", "normalize"])
+def test_parse_json_pushdown(sparse_bronze_df: pd.DataFrame, mode: str) -> None:
+    """Testing pushing the projection and predicate into `parse_json`."""
+    steps = ["parse_json", "filter_missing", "sort"]
+    options: SilverPipelineOptionsDict = {
+        "cols_to_filter_missing": ["id", "api10"],
+        "cols_to_sort_by": ["api10"],
+        "cols_to_keep": ["basin"],
+        "json_mode": mode,
+    }
+    pipeline = SilverPipeline(steps=steps, options=options)
+    unpushed = SilverPipeline(steps=steps, options={**options, "pushdown": False})
+
+    actual: pd.DataFrame = pipeline.run(df=sparse_bronze_df.copy())
+    expected: pd.DataFrame = unpushed.run(df=sparse_bronze_df.copy())
+
+    assert pipeline.pushdown_plan == (["basin", "id", "api10"], ["api10"])
+    assert unpushed.pushdown_plan == (None, [])
+    assert actual["api10"].tolist() == ["1", "2", "3"]
+    pd.testing.assert_frame_equal(actual, expected.drop(columns=["comment"]))
+    assert pipeline.decode_stats["skipped_rows"] == 2
+
+
+def test_parse_json_pushdown_not_adjacent() -> None:
+    """Testing rows aren't rejected unless `filter_missing` follows `parse_json`."""
+    pipeline = SilverPipeline(
+        steps=["parse_json", "impute_with_mode", "filter_missing"],
+        options={
+            "cols_to_filter_missing": ["api10"],
+            "cols_to_impute_with_mode": ["api10"],
+        },
+    )
+
+    assert pipeline.pushdown_plan == (None, [])
+    assert "requires" not in pipeline.explain()
+
+
+def test_parse_json_explain_pushdown() -> None:
+    """Testing the plan describes what is pushed into `parse_json`."""
+    pipeline = SilverPipeline(
+        steps=["parse_json", "filter_missing"],
+        options={"cols_to_filter_missing": ["api10"], "cols_to_keep": ["basin"]},
+    )
+
+    assert pipeline.explain().splitlines()[-2:] == [
+        "parse_json columns: basin, api10",
+        "parse_json requires: api10",
+    ]
+
+
+def test_parse_json_unknown_mode(bronze_df: pd.DataFrame) -> None:
+    """Testing an unknown JSON mode raises."""
+    pipeline = SilverPipeline(steps=["parse_json"], options={"json_mode": "eval"})
+
+    with pytest.raises(ValueError):
+        pipeline.run(df=bronze_df)
 
 
 def test_filter_missing(bronze_df: pd.DataFrame) -> None:
@@ -62,16 +195,95 @@ def test_filter_missing(bronze_df: pd.DataFrame) -> None:
         pytest.param("cum12mwater", "", None),
     ],
 )
-def test_eliminate_invalid_values(col: str, value: str, expected: str) -> None:
+@pytest.mark.parametrize("mode", ["vectorized", "scalar"])
+def test_eliminate_invalid_values(
+    col: str, value: str, expected: str, mode: str
+) -> None:
     """Testing the `eliminate_invalid_values` method."""
     df: pd.DataFrame = pd.DataFrame({col: [value]})
     pipeline = SilverPipeline(
         steps=["eliminate_invalid_values"],
-        options={"cols_to_elim_invalid_values": [col]},
+        options={"cols_to_elim_invalid_values": [col], "validation_mode": mode},
     )
     actual: pd.DataFrame = pipeline.run(df=df)
 
-    assert actual[col].iloc[0] == expected
+    if expected is None:
+        assert pd.isna(actual[col].iloc[0])
+    else:
+        assert actual[col].iloc[0] == expected
+    assert actual[col].dtype == SILVER_DTYPES[col]
+
+
+def test_eliminate_invalid_values_modes_agree() -> None:
+    """Testing the vectorized and scalar validation modes agree."""
+    df: pd.DataFrame = pd.DataFrame(
+        {
+            "basin": ["Permian", "invalid", "", " eagle ford"],
+            "spuddate": ["2023-07-01", "2033-07-01", "", "2020-1-5"],
+            "cum12moil": ["44697", "", "-1", "0"],
+        }
+    )
+    results = [
+        SilverPipeline(
+            steps=["eliminate_invalid_values"],
+            options={
+                "cols_to_elim_invalid_values": df.columns.tolist(),
+                "validation_mode": mode,
+            },
+        ).run(df=df.copy())
+        for mode in ["vectorized", "scalar"]
+    ]
+
+    pd.testing.assert_frame_equal(results[0], results[1])
+
+
+def test_eliminate_invalid_values_memoized() -> None:
+    """Testing memoized columns match the vectorized path."""
+    df: pd.DataFrame = pd.DataFrame(
+        {
+            "basin": ["Permian", "invalid", "", "Permian"],
+            "spuddate": ["2023-07-01", "2033-07-01", "", "2023-07-01"],
+        }
+    )
+    cols = df.columns.tolist()
+    expected: pd.DataFrame = SilverPipeline(
+        steps=["eliminate_invalid_values"],
+        options={"cols_to_elim_invalid_values": cols},
+    ).run(df=df.copy())
+    actual: pd.DataFrame = SilverPipeline(
+        steps=["eliminate_invalid_values"],
+        options={"cols_to_elim_invalid_values": cols, "cols_to_memoize": cols},
+    ).run(df=df.copy())
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_eliminate_invalid_values_not_compact() -> None:
+    """Testing validated columns can be left as Python objects."""
+    df: pd.DataFrame = pd.DataFrame({"basin": ["Permian", "invalid"]})
+    pipeline = SilverPipeline(
+        steps=["eliminate_invalid_values"],
+        options={"cols_to_elim_invalid_values": ["basin"], "compact_dtypes": False},
+    )
+
+    actual: pd.DataFrame = pipeline.run(df=df)
+
+    assert actual["basin"].dtype == object
+    assert actual["basin"].tolist() == ["PERMIAN", None]
+
+
+def test_eliminate_invalid_values_unknown_mode() -> None:
+    """Testing an unknown validation mode raises."""
+    pipeline = SilverPipeline(
+        steps=["eliminate_invalid_values"],
+        options={
+            "cols_to_elim_invalid_values": ["basin"],
+            "validation_mode": "invalid",
+        },
+    )
+
+    with pytest.raises(ValueError):
+        pipeline.run(df=pd.DataFrame({"basin": ["Permian"]}))
 
 
 @pytest.mark.parametrize("col, expected", [("A", 3), ("B", 7)])
@@ -88,6 +300,58 @@ def test_impute_with_mean(col: str, expected: int) -> None:
     assert actual[col].iloc[2] == expected
 
 
+def test_impute_with_mean_chunked() -> None:
+    """Testing the `impute_with_mean` method accumulates over chunks."""
+    df: pd.DataFrame = pd.DataFrame(
+        {
+            "A": [1, 2, None, 6],
+            "D": pd.to_datetime(["2023-07-01", None, "2020-01-15", "2021-03-01"]),
+        }
+    )
+    pipeline = SilverPipeline(
+        steps=["impute_with_mean"],
+        options={"cols_to_impute_with_mean": ["A", "D"]},
+    )
+
+    chunks = [df.iloc[[i]].copy() for i in range(4)]
+    actual: pd.DataFrame = pd.concat(pipeline.run_chunked(chunks))
+
+    assert actual["A"].iloc[2] == 3
+    assert actual["D"].iloc[1] == df["D"].mean()
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 50])
+def test_impute_with_mean_chunksize(chunksize: int) -> None:
+    """Testing the `impute_with_mean` fill values don't depend on chunking.
+
+    The values are summed exactly in float64 (whole numbers, and days),
+    so the sums don't depend on the chunking either.
+    """
+    rng = np.random.default_rng(seed=0)
+    values = pd.Series(rng.integers(0, 10**6, 200).astype(float))
+    values[::9] = np.nan
+    df: pd.DataFrame = pd.DataFrame(
+        {
+            "A": values,
+            "D": pd.Series(
+                pd.to_datetime(rng.integers(-2_000, 2_000, 200), unit="D")
+            ).where(values.notna()),
+        }
+    )
+    options: SilverPipelineOptionsDict = {"cols_to_impute_with_mean": ["A", "D"]}
+    expected = SilverPipeline(steps=["impute_with_mean"], options=options).run(
+        df=df.copy()
+    )
+    pipeline = SilverPipeline(steps=["impute_with_mean"], options=options)
+
+    chunks = [df.iloc[i : i + chunksize].copy() for i in range(0, 200, chunksize)]
+    actual: pd.DataFrame = pd.concat(pipeline.run_chunked(chunks))
+
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+    assert actual["A"].iloc[0] == df["A"].mean()
+    assert actual["D"].iloc[0] == df["D"].mean()
+
+
 def test_impute_with_mode() -> None:
     """Testing the `impute_with_mode` method."""
     df: pd.DataFrame = pd.DataFrame({"A": [1, 2, 1, 2, 1, 2, 3, None]})
@@ -115,3 +379,81 @@ def test_sort() -> None:
     assert actual["A"].iloc[1] == 1
     assert actual["A"].iloc[2] == 2
     assert actual["A"].iloc[3] == 3
+
+
+def test_run_chunked() -> None:
+    """Testing the silver pipeline gives the same result in chunks."""
+    bronze_df: pd.DataFrame = pd.DataFrame(
+        {
+            "id": ["a", "b", "c", "d", "e"],
+            "source_row": [
+                '{"api10": "3", "basin": "Permian", "cum12moil": "10"}',
+                '{"api10": "", "basin": "Permian", "cum12moil": "20"}',
+                '{"api10": "1", "basin": "invalid", "cum12moil": ""}',
+                '{"api10": "2", "basin": "Barnett", "cum12moil": "30"}',
+                '{"api10": "4", "basin": "Barnett", "cum12moil": "x"}',
+            ],
+        }
+    )
+    pipeline = SilverPipeline(
+        steps=[
+            "parse_json",
+            "filter_missing",
+            "eliminate_invalid_values",
+            "impute_with_mean",
+            "impute_with_mode",
+            "sort",
+        ],
+        options={
+            "cols_to_filter_missing": ["api10"],
+            "cols_to_elim_invalid_values": ["basin", "cum12moil"],
+            "cols_to_impute_with_mean": ["cum12moil"],
+            "cols_to_impute_with_mode": ["basin"],
+            "cols_to_sort_by": ["api10"],
+        },
+    )
+    expected: pd.DataFrame = pipeline.run(df=bronze_df.copy())
+
+    chunks = [bronze_df.iloc[i : i + 2].copy() for i in range(0, 5, 2)]
+    actual: pd.DataFrame = pd.concat(pipeline.run_chunked(chunks))
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_sort_chunked() -> None:
+    """Testing the `sort` method spills to disk when running in chunks."""
+    df: pd.DataFrame = pd.DataFrame({"A": [3, 1, 2, 1, 3, 2], "B": range(6)})
+    pipeline = SilverPipeline(
+        steps=["sort"],
+        options={"cols_to_sort_by": ["A"], "sort_memory_budget": 0},
+    )
+    expected: pd.DataFrame = pipeline.run(df=df.copy())
+
+    chunks = [df.iloc[i : i + 2].copy() for i in range(0, 6, 2)]
+    actual: pd.DataFrame = pd.concat(pipeline.run_chunked(chunks))
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert actual["B"].tolist() == [1, 3, 2, 5, 0, 4]
+
+
+def test_run_parallel(bronze_df: pd.DataFrame) -> None:
+    """Testing the row-local steps give the same result on worker processes."""
+    bronze_df = pd.concat([bronze_df] * 5, ignore_index=True)
+    steps = ["parse_json", "filter_missing", "eliminate_invalid_values"]
+    options: SilverPipelineOptionsDict = {
+        "cols_to_filter_missing": ["name"],
+        "cols_to_elim_invalid_values": [],
+    }
+    expected: pd.DataFrame = SilverPipeline(steps=steps, options=options).run(
+        df=bronze_df.copy()
+    )
+
+    parallel_options: SilverPipelineOptionsDict = {
+        **options,
+        "workers": 2,
+        "min_rows_per_worker": 2,
+    }
+    pipeline = SilverPipeline(steps=steps, options=parallel_options)
+    actual: pd.DataFrame = pipeline.run(df=bronze_df.copy())
+
+    pd.testing.assert_frame_equal(actual, expected)
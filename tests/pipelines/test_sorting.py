@@ -0,0 +1,75 @@
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nlca_pipelines.pipelines.sorting import external_sort
+
+
+def _chunks(df: pd.DataFrame, size: int) -> List[pd.DataFrame]:
+    """Split a dataframe into chunks."""
+    return [df.iloc[i : i + size].copy() for i in range(0, len(df), size)]
+
+
+def _wells(n: int) -> pd.DataFrame:
+    """Random data with many ties and missing values."""
+    rng = np.random.default_rng(seed=0)
+    basin = pd.Series(rng.choice(["BARNETT", "PERMIAN", "BAKKEN"], n), dtype=object)
+    basin[rng.random(n) < 0.1] = None
+    cum = pd.Series(rng.integers(0, 5, n), dtype=float)
+    cum[rng.random(n) < 0.1] = np.nan
+
+    return pd.DataFrame({"basin": basin, "cum12moil": cum, "row": range(n)})
+
+
+@pytest.mark.parametrize("by", [["cum12moil"], ["basin", "cum12moil"], ["row"]])
+@pytest.mark.parametrize("budget", [0, 2_000, 10**9])
+@pytest.mark.parametrize("size", [1, 7, 50])
+def test_external_sort(by: List[str], budget: int, size: int) -> None:
+    """Test the external sort matches a stable in-memory sort."""
+    df: pd.DataFrame = _wells(200)
+    expected: pd.DataFrame = df.sort_values(by=by, kind="stable")
+
+    chunks = list(external_sort(_chunks(df, size), by=by, memory_budget=budget))
+
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+    assert all(len(chunk) <= size for chunk in chunks)
+
+
+def test_external_sort_categorical() -> None:
+    """Test categorical columns are merged in category order."""
+    df: pd.DataFrame = _wells(200)
+    df["basin"] = df["basin"].astype(
+        pd.CategoricalDtype(["BAKKEN", "BARNETT", "PERMIAN"])
+    )
+    expected: pd.DataFrame = df.sort_values(by=["basin", "cum12moil"], kind="stable")
+
+    chunks = list(
+        external_sort(_chunks(df, 7), by=["basin", "cum12moil"], memory_budget=2_000)
+    )
+
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+
+
+def test_external_sort_spills(tmp_path: Path) -> None:
+    """Test sorted runs are spilled under the spill directory."""
+    df: pd.DataFrame = _wells(20)
+    stream = external_sort(
+        _chunks(df, 5), by=["row"], memory_budget=0, spill_dir=str(tmp_path)
+    )
+
+    first: pd.DataFrame = next(stream)
+    spilled = list(tmp_path.rglob("*.pkl"))
+    rest: List[pd.DataFrame] = list(stream)
+
+    assert spilled
+    assert first["row"].tolist() == list(range(5))
+    assert len(rest) == 3
+    assert not list(tmp_path.rglob("*.pkl"))
+
+
+def test_external_sort_empty() -> None:
+    """Test sorting no chunks yields nothing."""
+    assert not list(external_sort([], by=["row"]))
@@ -0,0 +1,79 @@
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+import pytest
+
+from nlca_pipelines.incremental import Manifest, run_silver_incremental
+from nlca_pipelines.ingestion import WELLS_SCHEMA
+from nlca_pipelines.pipelines import BronzePipeline
+
+# the helpers depend on the Google Drive client
+helper = pytest.importorskip("nlca_pipelines.helper")
+
+URI = "https://drive.google.com/wells.csv"
+
+
+def _wells(rows: List[List[str]]) -> pd.DataFrame:
+    """Raw well data, of the given api10, cum12moil and basin."""
+    return pd.DataFrame(
+        {
+            col: [row[i] for row in rows] if i < 3 else ""
+            for i, col in enumerate(
+                ["api10", "cum12moil", "basin"]
+                + [
+                    col
+                    for col in WELLS_SCHEMA
+                    if col not in ("api10", "cum12moil", "basin")
+                ]
+            )
+        }
+    )
+
+
+def _bronze(raw_df: pd.DataFrame, updated_at: str) -> pd.DataFrame:
+    """Bronze data of a source."""
+    return BronzePipeline(
+        steps=["serialize_rows", "add_source_uri", "add_row_number", "add_id"],
+        options={"skiprows": 1, "source_uri": URI, "source_updated_at": updated_at},
+    ).run(df=raw_df)
+
+
+def test_run_silver_incremental(tmp_path: Path) -> None:
+    """Test incremental runs impute the same values as full runs."""
+    filename = str(tmp_path / "wells.csv")
+    sources = [
+        _wells([["1", "10", "PERMIAN"], ["2", "", "BARNETT"], ["3", "40", ""]]),
+        # a modified row, and a new row with a missing value
+        _wells(
+            [
+                ["1", "16", "PERMIAN"],
+                ["2", "", "BARNETT"],
+                ["3", "40", ""],
+                ["4", "", "PERMIAN"],
+            ]
+        ),
+        # a removed row only
+        _wells([["2", "", "BARNETT"], ["3", "40", ""], ["4", "", "PERMIAN"]]),
+    ]
+
+    with Manifest(str(tmp_path / "manifest.sqlite")) as manifest:
+        for i, raw_df in enumerate(sources):
+            bronze_df = _bronze(raw_df, f"2024-0{i + 1}-01")
+            silver_df, missing = run_silver_incremental(
+                helper.create_silver_pipeline(),
+                bronze_df,
+                manifest,
+                URI,
+                helper.read_silver(filename, "csv", True),
+            )
+            manifest.commit(URI, f"2024-0{i + 1}-01", bronze_df, missing)
+            silver_df.to_csv(filename, sep="|", date_format="%Y-%m-%d", index=False)
+
+            expected = helper.run_silver(helper.create_silver_pipeline(), bronze_df)
+            pd.testing.assert_frame_equal(
+                silver_df.drop(columns="id").reset_index(drop=True),
+                expected.drop(columns="id").reset_index(drop=True),
+            )
+    assert silver_df["cum12moil"].tolist() == [40.0, 40.0, 40.0]
+    assert silver_df["basin"].tolist() == ["BARNETT", "BARNETT", "PERMIAN"]
@@ -0,0 +1,273 @@
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nlca_pipelines.incremental import (
+    Manifest,
+    merge_silver,
+    missing_values,
+    row_hashes,
+    split_steps,
+)
+from nlca_pipelines.pipelines import BronzePipeline, SilverPipeline
+
+from .pipelines.conftest import BRONZE_STEPS
+
+URI = "https://drive.google.com/wells.csv"
+
+
+def _bronze(raw: pd.DataFrame, updated_at: str = "2024-01-01") -> pd.DataFrame:
+    """Bronze data of a source."""
+    return BronzePipeline(
+        steps=BRONZE_STEPS,
+        options={
+            "skiprows": 1,
+            "source_name": "wells.csv",
+            "source_uri": URI,
+            "source_updated_at": updated_at,
+        },
+    ).run(df=raw)
+
+
+def _silver(bronze_df: pd.DataFrame) -> pd.DataFrame:
+    """Silver data of bronze data."""
+    return SilverPipeline(
+        steps=["parse_json", "sort"], options={"cols_to_sort_by": ["api10"]}
+    ).run(df=bronze_df.copy())
+
+
+@pytest.fixture(name="raw_df")
+def fixture_raw_df() -> pd.DataFrame:
+    """Raw well data, with two identical rows."""
+    return pd.DataFrame(
+        {
+            "api10": ["3", "1", "2", "2"],
+            "cum12moil": ["30", "10", "20", "20"],
+        }
+    )
+
+
+@pytest.fixture(name="manifest")
+def fixture_manifest(tmp_path: Path) -> Iterator[Manifest]:
+    """Empty manifest."""
+    with Manifest(str(tmp_path / "manifest" / "manifest.sqlite")) as manifest:
+        yield manifest
+
+
+def test_row_hashes() -> None:
+    """Test rows are hashed by content."""
+    hashes = row_hashes(pd.Series(['{"a": 1}', '{"a": 2}', '{"a": 1}']))
+
+    assert hashes[0] == hashes[2]
+    assert hashes[0] != hashes[1]
+    assert len(hashes[0]) == 32
+
+
+def test_unchanged(manifest: Manifest, raw_df: pd.DataFrame) -> None:
+    """Test a source is unchanged once committed with its fingerprint."""
+    assert manifest.fingerprint(URI) is None
+    assert not manifest.unchanged(URI, "2024-01-01")
+
+    manifest.commit(URI, "2024-01-01", _bronze(raw_df))
+
+    assert manifest.unchanged(URI, "2024-01-01")
+    assert not manifest.unchanged(URI, "2024-02-01")
+    assert not manifest.unchanged("https://drive.google.com/other.csv", "2024-01-01")
+
+
+def test_unchanged_persists(tmp_path: Path, raw_df: pd.DataFrame) -> None:
+    """Test the manifest persists across runs."""
+    path = str(tmp_path / "manifest.sqlite")
+    with Manifest(path) as manifest:
+        manifest.commit(URI, "2024-01-01", _bronze(raw_df))
+
+    with Manifest(path) as manifest:
+        assert manifest.unchanged(URI, "2024-01-01")
+
+
+def test_diff_first_run(manifest: Manifest, raw_df: pd.DataFrame) -> None:
+    """Test all the rows of a new source are new."""
+    bronze_df = _bronze(raw_df)
+
+    diff = manifest.diff(URI, bronze_df)
+
+    assert diff["new"].all()
+    assert diff["ids"].tolist() == bronze_df["id"].tolist()
+    assert not diff["removed_ids"]
+
+
+def test_diff(manifest: Manifest, raw_df: pd.DataFrame) -> None:
+    """Test new, modified, moved, duplicate and removed rows."""
+    previous = _bronze(raw_df)
+    manifest.commit(URI, "2024-01-01", previous)
+
+    # row "3" is modified, a copy of row "2" removed, and row "4" added
+    # before row "1"
+    changed = pd.DataFrame(
+        {"api10": ["3", "4", "1", "2"], "cum12moil": ["31", "40", "10", "20"]}
+    )
+    bronze_df = _bronze(changed, updated_at="2024-02-01")
+    diff = manifest.diff(URI, bronze_df)
+
+    assert diff["new"].tolist() == [True, True, False, False]
+    assert diff["ids"].tolist() == bronze_df["id"].tolist()[:2] + [
+        previous["id"].iloc[1],
+        previous["id"].iloc[2],
+    ]
+    assert sorted(diff["removed_ids"]) == sorted(
+        [previous["id"].iloc[0], previous["id"].iloc[3]]
+    )
+
+
+def test_diff_deferred(manifest: Manifest, raw_df: pd.DataFrame) -> None:
+    """Test rows kept as columns are hashed as their serialized form."""
+    deferred = BronzePipeline(
+        steps=["defer_serialize_rows", "add_id"], options={"skiprows": 1}
+    ).run(df=raw_df.copy())
+    bronze_df = _bronze(raw_df)
+    manifest.commit(URI, "2024-01-01", bronze_df)
+
+    diff = manifest.diff(URI, deferred)
+
+    assert not diff["new"].any()
+    assert diff["ids"].tolist() == bronze_df["id"].tolist()
+
+
+def test_incremental_run(manifest: Manifest, raw_df: pd.DataFrame) -> None:
+    """Test merging the changed rows matches a full run."""
+    bronze_df = _bronze(raw_df)
+    silver_df = _silver(bronze_df)
+    manifest.commit(URI, "2024-01-01", bronze_df)
+
+    changed = pd.DataFrame(
+        {"api10": ["3", "4", "1", "2"], "cum12moil": ["31", "40", "10", "20"]}
+    )
+    bronze_df = _bronze(changed, updated_at="2024-02-01")
+    diff = manifest.diff(URI, bronze_df)
+    bronze_df["id"] = diff["ids"]
+    pipeline = SilverPipeline(
+        steps=["parse_json", "sort"], options={"cols_to_sort_by": ["api10"]}
+    )
+
+    merged = merge_silver(
+        silver_df,
+        pipeline.run(df=bronze_df[diff["new"]].copy()),
+        diff["removed_ids"],
+        pipeline,
+    )
+
+    pd.testing.assert_frame_equal(
+        merged.reset_index(drop=True), _silver(bronze_df).reset_index(drop=True)
+    )
+
+
+def test_missing(manifest: Manifest, raw_df: pd.DataFrame) -> None:
+    """Test the missing values are recorded, and replaced, with the rows."""
+    bronze_df = _bronze(raw_df)
+    silver_df = pd.DataFrame(
+        {"id": ["a", "b"], "cum12moil": [np.nan, 1.0], "basin": ["PERMIAN", None]}
+    )
+    pipeline = SilverPipeline(
+        steps=["impute_with_mean", "impute_with_mode"],
+        options={
+            "cols_to_impute_with_mean": ["cum12moil"],
+            "cols_to_impute_with_mode": ["basin"],
+        },
+    )
+
+    manifest.commit(URI, "2024-01-01", bronze_df, missing_values(silver_df, pipeline))
+    recorded = manifest.missing(URI)
+    manifest.commit(URI, "2024-02-01", bronze_df)
+
+    assert recorded.values.tolist() == [["a", "cum12moil"], ["b", "basin"]]
+    assert manifest.missing(URI).empty
+
+
+def test_split_steps() -> None:
+    """Test only the leading row-local steps run on the new rows."""
+    pipeline = SilverPipeline(
+        steps=["parse_json", "impute_with_mean", "filter_missing", "sort"],
+        options={},
+    )
+
+    assert split_steps(pipeline) == (
+        ["parse_json"],
+        ["impute_with_mean", "filter_missing", "sort"],
+    )
+
+
+def test_merge_silver_imputes() -> None:
+    """Test the previously imputed values are imputed again, with the new rows."""
+    previous = pd.DataFrame({"id": ["a", "b"], "cum12moil": ["1.0", "2.0"]})
+    new = pd.DataFrame({"id": ["c"], "cum12moil": [np.nan]})
+    pipeline = SilverPipeline(
+        steps=["impute_with_mean"], options={"cols_to_impute_with_mean": ["cum12moil"]}
+    )
+    missing = pd.DataFrame({"id": ["b"], "column": ["cum12moil"]})
+
+    merged = merge_silver(previous, new, [], pipeline, missing)
+
+    assert merged["cum12moil"].tolist() == [1.0, 1.0, 1.0]
+
+
+def test_merge_silver_types() -> None:
+    """Test the previous output (read back from CSV) is converted."""
+    previous = pd.DataFrame(
+        {
+            "id": ["a", "b"],
+            "api10": ["2", "1"],
+            "spuddate": ["2020-01-01", ""],
+            "cum12moil": ["1.5", ""],
+        }
+    )
+    new = pd.DataFrame(
+        {
+            "id": ["c"],
+            "api10": ["3"],
+            "spuddate": pd.to_datetime(["2021-01-01"]),
+            "cum12moil": [2.0],
+        }
+    )
+    pipeline = SilverPipeline(steps=["sort"], options={"cols_to_sort_by": ["api10"]})
+
+    merged = merge_silver(previous, new, ["a"], pipeline)
+
+    assert merged["id"].tolist() == ["b", "c"]
+    assert merged["spuddate"].dtype == "datetime64[ns]"
+    assert merged["cum12moil"].dtype == "float64"
+
+
+def test_merge_silver_categorical() -> None:
+    """Test the previous output is converted to the new categories."""
+    dtype = pd.CategoricalDtype(["BARNETT", "PERMIAN"])
+    previous = pd.DataFrame({"id": ["a", "b"], "basin": ["PERMIAN", ""]})
+    new = pd.DataFrame({"id": ["c"], "basin": pd.Series(["BARNETT"], dtype=dtype)})
+    pipeline = SilverPipeline(steps=["sort"], options={"cols_to_sort_by": ["id"]})
+
+    merged = merge_silver(previous, new, [], pipeline)
+
+    assert merged["basin"].dtype == dtype
+    assert merged["basin"].tolist() == ["PERMIAN", np.nan, "BARNETT"]
+
+
+def test_merge_silver_first_run() -> None:
+    """Test merging into an empty previous output."""
+    new = pd.DataFrame({"id": ["b", "a"], "api10": ["2", "1"]})
+    pipeline = SilverPipeline(steps=["sort"], options={"cols_to_sort_by": ["api10"]})
+
+    merged = merge_silver(pd.DataFrame(), new, [], pipeline)
+
+    assert merged["id"].tolist() == ["a", "b"]
+
+
+def test_merge_silver_all_removed() -> None:
+    """Test removing every previous row, with no new ones."""
+    previous = pd.DataFrame({"id": ["a"], "api10": ["1"]})
+    pipeline = SilverPipeline(steps=["sort"], options={"cols_to_sort_by": ["api10"]})
+
+    merged = merge_silver(previous, pd.DataFrame(), ["a"], pipeline)
+
+    assert merged.empty
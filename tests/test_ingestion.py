@@ -0,0 +1,103 @@
+import io
+
+import pandas as pd
+import pytest
+
+from nlca_pipelines.ingestion import (
+    WELLS_SCHEMA,
+    columns_of,
+    read_dtypes,
+    read_options,
+    required_columns,
+)
+from nlca_pipelines.pipelines import BronzePipeline
+
+HEADER = ",".join(WELLS_SCHEMA) + ",comment"
+ROWS = [
+    "4200000001,Horizontal,W1,oil,Acme,Permian,Delaware,Texas,Pecos,"
+    "2020-01-31,100,2000,300,NA",
+    "4200000002,,W2,invalid,,permian ,,,,not a date,n/a,,1,",
+]
+
+
+@pytest.fixture(name="source")
+def fixture_source() -> io.StringIO:
+    """Input well file, with an extra column and missing and invalid values."""
+    return io.StringIO("\n".join([HEADER] + ROWS) + "\n")
+
+
+def test_schema_columns() -> None:
+    """Test the columns of the silver steps are derived from the schema."""
+    assert required_columns(WELLS_SCHEMA) == ["api10"]
+    assert columns_of(WELLS_SCHEMA, "categorical") == [
+        "direction",
+        "welltype",
+        "basin",
+        "subbasin",
+        "state",
+        "county",
+    ]
+    assert columns_of(WELLS_SCHEMA, "date", "number") == [
+        "spuddate",
+        "cum12moil",
+        "cum12mgas",
+        "cum12mwater",
+    ]
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_read_options_raw(source: io.StringIO, engine: str) -> None:
+    """Test every column is read as raw text, keeping empty cells."""
+    df = pd.read_csv(source, **read_options(engine=engine))
+
+    assert df.columns.tolist() == list(WELLS_SCHEMA) + ["comment"]
+    assert df.iloc[1].tolist() == ROWS[1].split(",")
+    assert df["comment"].tolist() == ["NA", ""]
+
+
+def test_read_options_source_row(source: io.StringIO) -> None:
+    """Test the bronze audit trail keeps the raw text of each row."""
+    bronze_df = BronzePipeline(steps=["serialize_rows"]).run(
+        df=pd.read_csv(source, **read_options(engine="c"))
+    )
+
+    row: str = bronze_df["source_row"].iloc[1]
+
+    assert row.startswith('{"api10": "4200000002", "direction": "", "wellname": "W2"')
+    assert row.endswith('"cum12mwater": "1", "comment": ""}')
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_read_options_typed(source: io.StringIO, engine: str) -> None:
+    """Test only the columns of the schema are read, with their dtypes."""
+    df = pd.read_csv(source, **read_options(engine=engine, schema=WELLS_SCHEMA))
+
+    assert df.columns.tolist() == list(WELLS_SCHEMA)
+    # the dtypes of the schema, but for the categories of the values read
+    schema_dtypes = pd.DataFrame(columns=list(WELLS_SCHEMA)).astype(
+        read_dtypes(WELLS_SCHEMA, engine)
+    )
+    assert df.dtypes.astype(str).equals(schema_dtypes.dtypes.astype(str))
+    assert [
+        col for col in WELLS_SCHEMA if isinstance(df[col].dtype, pd.CategoricalDtype)
+    ] == columns_of(WELLS_SCHEMA, "categorical")
+    assert df.iloc[1].tolist() == ROWS[1].split(",")[: len(WELLS_SCHEMA)]
+
+
+def test_read_options_typed_source_row(source: io.StringIO) -> None:
+    """Test the audit trail of a typed read keeps the raw text of the schema."""
+    bronze_df = BronzePipeline(steps=["serialize_rows"]).run(
+        df=pd.read_csv(source, **read_options(engine="c", schema=WELLS_SCHEMA))
+    )
+
+    row: str = bronze_df["source_row"].iloc[1]
+
+    assert row.startswith('{"api10": "4200000002", "direction": "", "wellname": "W2"')
+    assert '"welltype": "invalid"' in row
+    assert row.endswith('"cum12mwater": "1"}')
+
+
+def test_read_options_unknown_engine() -> None:
+    """Test an unknown read engine raises."""
+    with pytest.raises(ValueError):
+        read_options(engine="python")
@@ -0,0 +1,141 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq  # type: ignore
+import pytest
+
+from nlca_pipelines.parquet import (
+    BRONZE_COLUMNS,
+    SILVER_COLUMNS,
+    to_athena_types,
+    write_parquet,
+)
+from nlca_pipelines.warehouse import QUERIES_DIR
+
+
+@pytest.fixture(name="silver_df")
+def fixture_silver_df() -> pd.DataFrame:
+    """Silver data, before conversion to the Athena types."""
+    return pd.DataFrame(
+        {
+            "id": ["a", "b", "c"],
+            "api10": ["4200000001", "4200000002", "4200000003"],
+            "direction": ["HORIZONTAL", "VERTICAL", ""],
+            "wellname": ["W1", "W2", "W3"],
+            "welltype": ["OIL", "GAS", "OIL"],
+            "operator": ["OP", "OP", "OP"],
+            "basin": ["PERMIAN", "PERMIAN", "GULF COAST"],
+            "subbasin": ["DELAWARE", "MIDLAND", "WESTERN GULF"],
+            "state": ["TX", "TX", "TX"],
+            "county": ["REEVES", "MIDLAND", "KARNES"],
+            "spuddate": ["2020-01-31", "2019-06-01", ""],
+            "cum12moil": ["100.5", "", "7"],
+            "cum12mgas": [1.0, 2.0, np.nan],
+            "cum12mwater": ["1", "2", "3"],
+        }
+    )
+
+
+def test_to_athena_types(silver_df: pd.DataFrame) -> None:
+    """Test the conversion of silver data to the Athena types."""
+    df = to_athena_types(silver_df, SILVER_COLUMNS)
+
+    assert df["api10"].dtype == "string"
+    assert df["spuddate"].tolist()[:2] == [
+        pd.Timestamp("2020-01-31").date(),
+        pd.Timestamp("2019-06-01").date(),
+    ]
+    assert pd.isna(df["spuddate"].iloc[2])
+    assert df["cum12moil"].dtype == "float64"
+    assert np.isnan(df["cum12moil"].iloc[1])
+    assert df["cum12mwater"].tolist() == [1.0, 2.0, 3.0]
+    # the input is left untouched
+    assert silver_df["cum12mwater"].tolist() == ["1", "2", "3"]
+
+
+def test_to_athena_types_bigint() -> None:
+    """Test integers are converted to a nullable type."""
+    df = to_athena_types(pd.DataFrame({"n": ["1", "", "3"]}), {"n": "bigint"})
+
+    assert df["n"].dtype == "Int64"
+    assert df["n"].isna().tolist() == [False, True, False]
+
+
+def test_to_athena_types_unknown() -> None:
+    """Test an unsupported Athena type raises an error."""
+    with pytest.raises(ValueError, match="Unsupported Athena type"):
+        to_athena_types(pd.DataFrame({"n": [1]}), {"n": "decimal"})
+
+
+def test_parquet_ddl_matches_csv_ddl() -> None:
+    """Test the Parquet table has the columns of the CSV table."""
+    with open(os.path.join(QUERIES_DIR, "create-table.sql"), encoding="utf-8") as f:
+        ddl = f.read()
+
+    assert all(f"`{col}`" in ddl for col in SILVER_COLUMNS)
+
+
+@pytest.mark.parametrize("compression", ["snappy", "zstd", "none"])
+def test_write_parquet(silver_df: pd.DataFrame, compression: str) -> None:
+    """Test writing silver data, and reading back only some columns."""
+    buffer = io.BytesIO()
+
+    write_parquet(
+        silver_df,
+        buffer,
+        SILVER_COLUMNS,
+        compression=compression,
+        row_group_size=2,
+    )
+
+    buffer.seek(0)
+    parquet_file = pq.ParquetFile(buffer)
+    assert parquet_file.metadata.num_row_groups == 2
+    assert str(parquet_file.schema_arrow.field("spuddate").type) == "date32[day]"
+    assert str(parquet_file.schema_arrow.field("cum12moil").type) == "double"
+    stats = parquet_file.metadata.row_group(0).column(0).statistics
+    assert (stats.min, stats.max) == ("a", "b")
+
+    df = pq.read_table(buffer, columns=["api10", "cum12moil"]).to_pandas()
+    assert df.columns.tolist() == ["api10", "cum12moil"]
+    assert df["api10"].tolist() == silver_df["api10"].tolist()
+
+
+def test_write_parquet_bronze() -> None:
+    """Test writing bronze data."""
+    buffer = io.BytesIO()
+    df = pd.DataFrame(
+        {
+            "source_row": ['{"a": 1}'],
+            "source_name": ["wells.csv"],
+            "source_uri": ["https://example.com/wells.csv"],
+            "source_row_number": [1],
+            "source_updated_at": ["2024-01-01"],
+            "id": ["a"],
+        }
+    )
+
+    write_parquet(df, buffer, BRONZE_COLUMNS)
+
+    buffer.seek(0)
+    table = pq.read_table(buffer)
+    assert table.column_names == df.columns.tolist()
+    assert str(table.schema.field("source_row_number").type) == "int64"
+
+
+def test_write_parquet_no_statistics(silver_df: pd.DataFrame) -> None:
+    """Test column statistics can be left out."""
+    buffer = io.BytesIO()
+
+    write_parquet(silver_df, buffer, statistics=False)
+
+    buffer.seek(0)
+    assert not pq.ParquetFile(buffer).metadata.row_group(0).column(0).is_stats_set
+
+
+def test_write_parquet_unknown_compression(silver_df: pd.DataFrame) -> None:
+    """Test an unknown compression codec raises an error."""
+    with pytest.raises(ValueError, match="Unknown Parquet compression"):
+        write_parquet(silver_df, io.BytesIO(), compression="lz4hc")
@@ -0,0 +1,268 @@
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+import pytest
+
+from nlca_pipelines.partitioning import (
+    DEFAULT_PARTITION,
+    PARTITION_COLUMNS,
+    add_partitions_ddl,
+    add_spud_year,
+    create_table_queries,
+    escape,
+    partition,
+    stale_files,
+    write_partitions,
+    write_silver_partitions,
+)
+from nlca_pipelines.uploads import LocalS3Client
+from nlca_pipelines.warehouse import QUERIES_DIR
+
+
+@pytest.fixture(name="silver_df")
+def fixture_silver_df() -> pd.DataFrame:
+    """Silver data, with a missing basin and an invalid spud date."""
+    return pd.DataFrame(
+        {
+            "api10": ["1", "2", "3", "4", "5", "6"],
+            "basin": ["PERMIAN", "GULF COAST", "PERMIAN", None, "PERMIAN", "A/B"],
+            "spuddate": [
+                "2020-01-31",
+                "2019-06-01",
+                "2020-12-01",
+                "2020-01-01",
+                "not a date",
+                "2018-03-03",
+            ],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("PERMIAN", "PERMIAN"),
+        ("GULF COAST", "GULF COAST"),
+        ("A/B=C", "A%2FB%3DC"),
+        ("50%", "50%25"),
+        (2020, "2020"),
+        (None, DEFAULT_PARTITION),
+        (pd.NA, DEFAULT_PARTITION),
+        ("", DEFAULT_PARTITION),
+    ],
+)
+def test_escape(value: object, expected: str) -> None:
+    """Test partition values are escaped as by Hive."""
+    assert escape(value) == expected
+
+
+def test_add_spud_year(silver_df: pd.DataFrame) -> None:
+    """Test the spud year is taken from the spud date."""
+    df = add_spud_year(silver_df)
+
+    assert df["spud_year"].dtype == "Int64"
+    assert df["spud_year"].tolist() == [2020, 2019, 2020, 2020, pd.NA, 2018]
+    assert "spud_year" not in silver_df.columns
+
+
+def test_partition(silver_df: pd.DataFrame) -> None:
+    """Test data is split by partition values, and into files."""
+    partitions = list(
+        partition(add_spud_year(silver_df), by=list(PARTITION_COLUMNS), rows_per_file=1)
+    )
+
+    assert [values for values, _ in partitions] == [
+        {"basin": "A/B", "spud_year": "2018"},
+        {"basin": "GULF COAST", "spud_year": "2019"},
+        {"basin": "PERMIAN", "spud_year": "2020"},
+        {"basin": "PERMIAN", "spud_year": DEFAULT_PARTITION},
+        {"basin": DEFAULT_PARTITION, "spud_year": "2020"},
+    ]
+    files = partitions[2][1]
+    assert [f["api10"].tolist() for f in files] == [["1"], ["3"]]
+    assert files[0].columns.tolist() == ["api10", "spuddate"]
+
+
+def test_partition_categorical(silver_df: pd.DataFrame) -> None:
+    """Test categories without rows make no partitions."""
+    silver_df["basin"] = silver_df["basin"].astype(
+        pd.CategoricalDtype(["ANADARKO", "GULF COAST", "PERMIAN"])
+    )
+
+    partitions = list(partition(add_spud_year(silver_df), by=["basin"]))
+
+    assert [values for values, _ in partitions] == [
+        {"basin": "GULF COAST"},
+        {"basin": "PERMIAN"},
+        {"basin": DEFAULT_PARTITION},
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_write_partitions(silver_df: pd.DataFrame, workers: int) -> None:
+    """Test partitions are written with a Hive layout."""
+    written: Dict[str, pd.DataFrame] = {}
+    lock = threading.Lock()
+
+    def write(path: str, df: pd.DataFrame) -> None:
+        with lock:
+            written[path] = df
+
+    partitions = write_partitions(
+        add_spud_year(silver_df),
+        write,
+        extension="parquet",
+        by=list(PARTITION_COLUMNS),
+        rows_per_file=1,
+        workers=workers,
+    )
+
+    assert sorted(written) == [
+        "basin=A%2FB/spud_year=2018/part-00000.parquet",
+        "basin=GULF COAST/spud_year=2019/part-00000.parquet",
+        "basin=PERMIAN/spud_year=2020/part-00000.parquet",
+        "basin=PERMIAN/spud_year=2020/part-00001.parquet",
+        f"basin=PERMIAN/spud_year={DEFAULT_PARTITION}/part-00000.parquet",
+        f"basin={DEFAULT_PARTITION}/spud_year=2020/part-00000.parquet",
+    ]
+    assert sum(p["rows"] for p in partitions) == len(silver_df)
+    assert partitions[2] == {
+        "files": [
+            "basin=PERMIAN/spud_year=2020/part-00000.parquet",
+            "basin=PERMIAN/spud_year=2020/part-00001.parquet",
+        ],
+        "path": "basin=PERMIAN/spud_year=2020",
+        "rows": 2,
+        "values": {"basin": "PERMIAN", "spud_year": "2020"},
+    }
+
+
+def test_write_partitions_error(silver_df: pd.DataFrame) -> None:
+    """Test errors writing a partition are raised."""
+
+    def write(path: str, df: pd.DataFrame) -> None:
+        raise OSError(f"can't write {path} ({len(df)} rows)")
+
+    with pytest.raises(OSError, match="can't write"):
+        write_partitions(
+            add_spud_year(silver_df),
+            write,
+            extension="parquet",
+            by=list(PARTITION_COLUMNS),
+            workers=2,
+        )
+
+
+def test_stale_files(silver_df: pd.DataFrame) -> None:
+    """Test the files of a previous write with more rows are stale."""
+    previous = write_partitions(
+        add_spud_year(silver_df),
+        lambda path, df: None,
+        extension="parquet",
+        by=list(PARTITION_COLUMNS),
+        rows_per_file=1,
+    )
+    partitions = write_partitions(
+        add_spud_year(silver_df.head(3)),
+        lambda path, df: None,
+        extension="parquet",
+        by=list(PARTITION_COLUMNS),
+    )
+    files = [path for p in previous for path in p["files"]] + ["_partitions.sql"]
+
+    assert stale_files(partitions, files) == [
+        "basin=A%2FB/spud_year=2018/part-00000.parquet",
+        "basin=PERMIAN/spud_year=2020/part-00001.parquet",
+        f"basin=PERMIAN/spud_year={DEFAULT_PARTITION}/part-00000.parquet",
+        f"basin={DEFAULT_PARTITION}/spud_year=2020/part-00000.parquet",
+    ]
+    assert not stale_files(partitions, [p["files"][0] for p in partitions])
+
+
+def test_add_partitions_ddl() -> None:
+    """Test the DDL registering partitions."""
+    ddl = add_partitions_ddl(
+        "silver.wells_partitioned",
+        [
+            {
+                "files": [],
+                "path": "basin=O%27NEIL/spud_year=2020",
+                "rows": 1,
+                "values": {"basin": "O'NEIL", "spud_year": "2020"},
+            },
+            {
+                "files": [],
+                "path": f"basin=PERMIAN/spud_year={DEFAULT_PARTITION}",
+                "rows": 1,
+                "values": {"basin": "PERMIAN", "spud_year": DEFAULT_PARTITION},
+            },
+            {
+                "files": [],
+                "path": f"basin={DEFAULT_PARTITION}/spud_year=2021",
+                "rows": 1,
+                "values": {"basin": DEFAULT_PARTITION, "spud_year": "2021"},
+            },
+        ],
+        "s3://nlca-silver/partitioned/",
+    )
+
+    assert ddl == (
+        "ALTER TABLE `silver`.`wells_partitioned` ADD IF NOT EXISTS\n"
+        "    PARTITION (`basin` = 'O''NEIL', `spud_year` = 2020) "
+        "LOCATION 's3://nlca-silver/partitioned/basin=O%27NEIL/spud_year=2020/'\n"
+        f"    PARTITION (`basin` = '{DEFAULT_PARTITION}', `spud_year` = 2021) "
+        f"LOCATION 's3://nlca-silver/partitioned/basin={DEFAULT_PARTITION}"
+        "/spud_year=2021/';\n"
+    )
+    assert add_partitions_ddl("silver.wells_partitioned", [], "s3://x/") == ""
+
+
+def _files(root: Path) -> List[str]:
+    """Paths of the files under a directory, relative to it."""
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("*.*"))
+
+
+@pytest.mark.parametrize("output_local", [True, False])
+def test_write_silver_partitions_rerun(
+    silver_df: pd.DataFrame,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    output_local: bool,
+) -> None:
+    """Test a rerun with fewer rows leaves no files of the previous run."""
+    monkeypatch.chdir(tmp_path)
+    client = LocalS3Client(str(tmp_path / "s3"))
+    root: Path = (
+        tmp_path / "partitioned"
+        if output_local
+        else tmp_path / "s3" / "nlca-silver" / "partitioned"
+    )
+
+    write_silver_partitions(silver_df, output_local, client=client)
+    partitions = write_silver_partitions(silver_df.head(2), output_local, client=client)
+
+    expected = sorted(["_partitions.sql"] + [f for p in partitions for f in p["files"]])
+    assert _files(root) == expected
+    assert [p["path"] for p in partitions] == [
+        "basin=GULF COAST/spud_year=2019",
+        "basin=PERMIAN/spud_year=2020",
+    ]
+    assert not (root / f"basin={DEFAULT_PARTITION}").exists()
+
+
+@pytest.mark.parametrize("name", ["create-table-parquet", "create-table-partitioned"])
+def test_create_table_queries(name: str) -> None:
+    """Test the committed DDL is generated from the declared silver types."""
+    with open(os.path.join(QUERIES_DIR, f"{name}.sql"), encoding="utf-8") as f:
+        assert f.read() == create_table_queries()[name]
+
+
+def test_create_table_partitioned_ddl() -> None:
+    """Test the partition columns are only declared as partitions."""
+    ddl = create_table_queries()["create-table-partitioned"]
+
+    assert ddl.count("`basin`") == 1
+    assert "PARTITIONED BY (\n    `basin` string,\n    `spud_year` int\n)" in ddl
@@ -0,0 +1,139 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from nlca_pipelines.ingestion import (
+    WELLS_SCHEMA,
+    read_dtypes,
+    read_options,
+)
+from nlca_pipelines.pipelines import BronzePipeline
+from nlca_pipelines.sources import LocalFileClient, byte_ranges
+
+from .benchmarks.synthetic import write_wells_csv
+
+
+@pytest.fixture(name="wells_csv")
+def fixture_wells_csv(tmp_path: Path) -> str:
+    """Synthetic input file."""
+    path = str(tmp_path / "wells.csv")
+    write_wells_csv(path, rows=500, seed=1)
+
+    return path
+
+
+@pytest.fixture(name="expected")
+def fixture_expected(wells_csv: str) -> pd.DataFrame:
+    """The input file, read in one go."""
+    return pd.read_csv(wells_csv, **read_options(engine="c"))
+
+
+@pytest.mark.parametrize("parts", [1, 2, 7, 1_000])
+def test_byte_ranges(wells_csv: str, parts: int) -> None:
+    """Test the ranges cover every row, and end at line boundaries."""
+    with open(wells_csv, "rb") as f:
+        data = f.read()
+
+    ranges = byte_ranges(wells_csv, parts)
+
+    assert len(ranges) == min(parts, 500)
+    assert ranges[0][0] == data.index(b"\n") + 1
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[end - 1 : end] == b"\n"
+
+
+def test_byte_ranges_header_only(tmp_path: Path) -> None:
+    """Test a file without rows has no ranges."""
+    path = tmp_path / "empty.csv"
+    path.write_text("api10,basin\n")
+
+    assert not byte_ranges(str(path), 4)
+    with pytest.raises(ValueError):
+        byte_ranges(str(path), 0)
+
+
+@pytest.mark.parametrize("parts, workers", [(1, 1), (4, 1), (4, 4)])
+def test_read(wells_csv: str, expected: pd.DataFrame, parts: int, workers: int) -> None:
+    """Test reading byte ranges (concurrently) matches reading in one go."""
+    client = LocalFileClient(wells_csv, io_options=read_options(engine="c"))
+
+    actual = client.read(parts=parts, workers=workers)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_read_pyarrow(wells_csv: str, expected: pd.DataFrame) -> None:
+    """Test the pyarrow engine reads the same raw text."""
+    client = LocalFileClient(wells_csv, io_options=read_options(engine="pyarrow"))
+
+    actual = client.read(parts=3, workers=2)
+
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_read_typed(wells_csv: str, expected: pd.DataFrame, engine: str) -> None:
+    """Test the byte ranges of a typed read have the dtypes of the schema."""
+    client = LocalFileClient(
+        wells_csv, io_options=read_options(engine=engine, schema=WELLS_SCHEMA)
+    )
+
+    actual = client.read(parts=3, workers=2)
+
+    # the dtypes of the schema, but for the categories of the values read
+    schema_dtypes = pd.DataFrame(columns=list(WELLS_SCHEMA)).astype(
+        read_dtypes(WELLS_SCHEMA, engine)
+    )
+    assert actual.dtypes.astype(str).equals(schema_dtypes.dtypes.astype(str))
+    pd.testing.assert_frame_equal(
+        actual.astype(object), expected[list(WELLS_SCHEMA)].astype(object)
+    )
+
+
+def test_iter_read(wells_csv: str, expected: pd.DataFrame) -> None:
+    """Test streaming chunks matches reading in one go."""
+    client = LocalFileClient(wells_csv, io_options=read_options(engine="c"))
+
+    chunks = list(client.iter_read(chunksize=200))
+
+    assert [len(chunk) for chunk in chunks] == [200, 200, 100]
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+
+
+def test_iter_read_bronze(wells_csv: str, expected: pd.DataFrame) -> None:
+    """Test streamed chunks are numbered as rows of the whole file."""
+    client = LocalFileClient(wells_csv, io_options=read_options(engine="c"))
+    pipeline = BronzePipeline(
+        steps=["serialize_rows", "add_row_number"], options={"skiprows": 1}
+    )
+
+    actual = pd.concat(pipeline.run_chunked(client.iter_read(chunksize=128)))
+
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True), pipeline.run(df=expected.copy())
+    )
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    """Test a file without rows reads as an empty dataframe."""
+    path = tmp_path / "empty.csv"
+    path.write_text("api10,basin\n")
+    client = LocalFileClient(str(path), io_options=read_options(engine="c"))
+
+    assert client.read(parts=2).columns.tolist() == ["api10", "basin"]
+    chunks = list(client.iter_read(chunksize=10))
+    assert len(chunks) == 1
+    assert chunks[0].empty
+
+
+def test_metadata(wells_csv: str) -> None:
+    """Test the source metadata of a local file."""
+    client = LocalFileClient(wells_csv)
+
+    assert client.source_filename == "wells.csv"
+    assert client.source_uri.startswith("file:///")
+    assert client.source_uri.endswith("/wells.csv")
+    assert client.source_updated_at.endswith("+00:00")
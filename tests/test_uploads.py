@@ -0,0 +1,216 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nlca_pipelines.uploads import (
+    LocalS3Client,
+    MultipartWriter,
+    NoSuchKey,
+    UploadDict,
+    upload_frame,
+    upload_frames,
+)
+
+IO_OPTIONS: Dict[str, Any] = {"date_format": "%Y-%m-%d", "index": False, "sep": "|"}
+
+
+@pytest.fixture(name="client")
+def fixture_client(tmp_path: Path) -> LocalS3Client:
+    """Local stand-in for S3, with tiny parts allowed."""
+    return LocalS3Client(str(tmp_path / "s3"), min_part_size=1)
+
+
+@pytest.fixture(name="wells_df")
+def fixture_wells_df() -> pd.DataFrame:
+    """Dataframe serializing to a few hundred kilobytes of CSV."""
+    n = 5_000
+    rng = np.random.default_rng(seed=0)
+
+    return pd.DataFrame(
+        {
+            "api10": [f"42{i:08d}" for i in range(n)],
+            "basin": rng.choice(
+                np.array(["PERMIAN", "DJ", "ANADARKO ÉTÉ", None], dtype=object), n
+            ),
+            "spuddate": pd.Timestamp("2018-01-01")
+            + pd.to_timedelta(rng.integers(0, 1_000, n), "D"),
+            "cum12moil": rng.random(n) * 1_000,
+        }
+    )
+
+
+def _read(client: LocalS3Client, bucket: str, key: str) -> bytes:
+    """Content of an object."""
+    body: bytes = client.get_object(Bucket=bucket, Key=key)["Body"].read()
+
+    return body
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_multipart_writer(client: LocalS3Client, threaded: bool) -> None:
+    """Test written bytes are uploaded in parts of the given size."""
+    data = bytes(range(256)) * 40
+    executor = ThreadPoolExecutor(max_workers=2) if threaded else None
+
+    with MultipartWriter(client, "bronze", "data/wells.csv", 1_000, executor) as f:
+        for start in range(0, len(data), 300):
+            f.write(data[start : start + 300])
+    if executor is not None:
+        executor.shutdown()
+
+    assert _read(client, "bronze", "data/wells.csv") == data
+    assert client.requests["upload_part"] == 11
+    assert client.requests["complete_multipart_upload"] == 1
+    assert "put_object" not in client.requests
+    assert not list(Path(client.root, ".multipart").iterdir())
+
+
+def test_multipart_writer_small_object(client: LocalS3Client) -> None:
+    """Test an object smaller than a part is put in a single request."""
+    with MultipartWriter(client, "bronze", "wells.csv", 1_000) as f:
+        f.write(b"id|api10\n")
+
+    assert _read(client, "bronze", "wells.csv") == b"id|api10\n"
+    assert client.requests == {"put_object": 1, "get_object": 1}
+
+
+def test_multipart_writer_aborts(client: LocalS3Client) -> None:
+    """Test an error while writing aborts the upload, leaving no object."""
+    with pytest.raises(RuntimeError):
+        with MultipartWriter(client, "bronze", "wells.csv", 10) as f:
+            f.write(b"x" * 25)
+            raise RuntimeError("serialization failed")
+
+    assert client.requests["abort_multipart_upload"] == 1
+    assert "complete_multipart_upload" not in client.requests
+    assert not list(Path(client.root, ".multipart").iterdir())
+    with pytest.raises(NoSuchKey):
+        client.get_object(Bucket="bronze", Key="wells.csv")
+
+
+def test_multipart_writer_invalid_part_size(client: LocalS3Client) -> None:
+    """Test the part size must be positive."""
+    with pytest.raises(ValueError):
+        MultipartWriter(client, "bronze", "wells.csv", 0)
+
+
+def test_local_client_min_part_size(tmp_path: Path) -> None:
+    """Test the stand-in rejects parts smaller than S3 allows."""
+    client = LocalS3Client(str(tmp_path), min_part_size=100)
+
+    with pytest.raises(ValueError):
+        with MultipartWriter(client, "bronze", "wells.csv", 10) as f:
+            f.write(b"x" * 25)
+
+    assert client.requests["abort_multipart_upload"] == 1
+
+
+def test_upload_frame_csv(client: LocalS3Client, wells_df: pd.DataFrame) -> None:
+    """Test a streamed CSV object is the same as `to_csv` output."""
+    upload: UploadDict = {"df": wells_df, "bucket": "silver", "key": "data/wells.csv"}
+
+    size = upload_frame(
+        upload, client, "csv", part_size=64 * 1024, io_options=IO_OPTIONS
+    )
+
+    expected = wells_df.to_csv(**IO_OPTIONS).encode("utf-8")
+    assert _read(client, "silver", "data/wells.csv") == expected
+    assert size == len(expected)
+    assert client.requests["upload_part"] == -(-len(expected) // (64 * 1024))
+
+
+def test_upload_frame_parquet(client: LocalS3Client, wells_df: pd.DataFrame) -> None:
+    """Test a streamed Parquet object reads back as the data."""
+    upload: UploadDict = {"df": wells_df, "bucket": "silver", "key": "wells.parquet"}
+
+    upload_frame(upload, client, "parquet", part_size=16 * 1024)
+
+    actual = pd.read_parquet(io.BytesIO(_read(client, "silver", "wells.parquet")))
+    pd.testing.assert_frame_equal(actual, wells_df, check_dtype=False)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_upload_frames(
+    client: LocalS3Client,
+    wells_df: pd.DataFrame,
+    workers: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the tiers are serialized concurrently, each into its object."""
+    threads = set()
+    upload_part = client.upload_part
+
+    def record_thread(**kwargs: Any) -> Dict[str, Any]:
+        threads.add(threading.get_ident())
+        return upload_part(**kwargs)
+
+    monkeypatch.setattr(client, "upload_part", record_thread)
+    uploads: List[UploadDict] = [
+        {"df": wells_df, "bucket": "bronze", "key": "data/wells.csv"},
+        {"df": wells_df.head(10), "bucket": "silver", "key": "data/wells.csv"},
+    ]
+
+    sizes = upload_frames(
+        uploads,
+        client,
+        "csv",
+        workers=workers,
+        part_size=32 * 1024,
+        io_options=IO_OPTIONS,
+    )
+
+    for upload, size in zip(uploads, sizes):
+        expected = upload["df"].to_csv(**IO_OPTIONS).encode("utf-8")
+        assert _read(client, upload["bucket"], upload["key"]) == expected
+        assert size == len(expected)
+    assert client.requests["put_object"] == 1
+    assert (threading.get_ident() in threads) == (workers == 1)
+
+
+def test_local_client_objects(client: LocalS3Client) -> None:
+    """Test the stand-in reads back objects, and raises for missing ones."""
+    client.put_object(Bucket="gold", Key="gold/top_wells.csv", Body=b"rank|api10\n")
+
+    assert _read(client, "gold", "gold/top_wells.csv") == b"rank|api10\n"
+    with pytest.raises(client.exceptions.NoSuchKey):
+        client.get_object(Bucket="gold", Key="gold/missing.csv")
+
+
+def test_local_client_list_delete(client: LocalS3Client) -> None:
+    """Test the stand-in lists objects in pages, and deletes them."""
+    keys = ["data/a.csv", "data/b/c.csv", "data/b/d.csv", "gold/e.csv"]
+    for key in keys:
+        client.put_object(Bucket="silver", Key=key, Body=b"x")
+
+    first = client.list_objects_v2(Bucket="silver", Prefix="data/", MaxKeys=2)
+    rest = client.list_objects_v2(
+        Bucket="silver",
+        Prefix="data/",
+        ContinuationToken=first["NextContinuationToken"],
+        MaxKeys=2,
+    )
+    client.delete_objects(
+        Bucket="silver",
+        Delete={"Objects": [{"Key": "data/b/c.csv"}, {"Key": "data/b/d.csv"}]},
+    )
+
+    assert [obj["Key"] for obj in first["Contents"] + rest["Contents"]] == keys[:3]
+    assert first["IsTruncated"] and not rest["IsTruncated"]
+    assert [
+        obj["Key"] for obj in client.list_objects_v2(Bucket="silver")["Contents"]
+    ] == [
+        "data/a.csv",
+        "gold/e.csv",
+    ]
+    assert not Path(client.root, "silver", "data", "b").exists()
+    assert "Contents" not in client.list_objects_v2(Bucket="silver", Prefix="x/")
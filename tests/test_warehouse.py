@@ -0,0 +1,175 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from nlca_pipelines import warehouse
+from nlca_pipelines.validation.schema import apply_schema
+from nlca_pipelines.warehouse import (
+    PART_2_QUERIES,
+    Warehouse,
+    bundled_queries,
+    read_query,
+)
+
+
+@pytest.fixture(name="silver_df")
+def fixture_silver_df() -> pd.DataFrame:
+    """Silver-tier dataframe, with compact dtypes and an extra column."""
+    df = pd.DataFrame(
+        {
+            "id": [f"id{i}" for i in range(7)],
+            "api10": [f"42000000{i:02d}" for i in range(7)],
+            "welltype": ["OIL", "OIL", "GAS", "OIL", "OIL", "OIL", "OIL"],
+            "basin": ["PERMIAN", "PERMIAN", "DJ", "BARNETT", "DJ", "DJ", "PERMIAN"],
+            "spuddate": ["2020-01-31", "2021-06-01", None, "2019-02-03"] + [None] * 3,
+            "cum12moil": [100.0, 700.0, 900.0, None, 300.0, 500.0, 200.0],
+            "cum12mgas": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+            "cum12mwater": [0.5] * 7,
+            "comment": ["x"] * 7,
+        }
+    )
+
+    return apply_schema(df)
+
+
+@pytest.fixture(name="engine", params=["sqlite", "duckdb"])
+def fixture_engine(request: pytest.FixtureRequest) -> str:
+    """Database engine."""
+    engine: str = request.param
+    if engine == "duckdb":
+        pytest.importorskip("duckdb")
+
+    return engine
+
+
+def test_bundled_queries() -> None:
+    """Test the Athena queries are bundled, without the DDL."""
+    queries = bundled_queries()
+
+    assert set(PART_2_QUERIES) <= set(queries)
+    assert not [name for name in queries if name.startswith("create-")]
+    assert read_query("top-5-oil-wells").lstrip().startswith("SELECT")
+    with pytest.raises(ValueError):
+        read_query("create-table")
+
+
+def test_bundled_queries_in_package() -> None:
+    """Test the queries are package data, not read from the source checkout."""
+    package = Path(warehouse.__file__).resolve().parent
+
+    assert all(
+        Path(path).parent == package / "queries" for path in bundled_queries().values()
+    )
+
+
+def test_load(tmp_path: Path, silver_df: pd.DataFrame, engine: str) -> None:
+    """Test the silver columns are loaded into an indexed table."""
+    path = str(tmp_path / "data" / "silver.db")
+
+    with Warehouse(path, engine=engine) as db:
+        rows = db.load(silver_df)
+        loaded = db.query("SELECT * FROM silver.wells ORDER BY api10")
+        indexes = db.indexes()
+
+    assert rows == 7
+    assert loaded.columns.tolist() == silver_df.columns.tolist()[:-1]
+    assert loaded["basin"].tolist()[:3] == ["PERMIAN", "PERMIAN", None]
+    assert str(loaded["spuddate"].iloc[0]).startswith("2020-01-31")
+    assert indexes == ["wells_api10", "wells_basin"]
+
+
+def test_run_part_2_queries(
+    tmp_path: Path, silver_df: pd.DataFrame, engine: str
+) -> None:
+    """Test the Part 2 queries agree with pandas."""
+    with Warehouse(str(tmp_path / "silver.db"), engine=engine) as db:
+        db.load(silver_df)
+        top_wells = db.run_query("top-5-oil-wells")
+        by_basin = db.run_query("sum-prod-by-basin").sort_values(
+            "basin", na_position="first", ignore_index=True
+        )
+
+    oil = silver_df[silver_df["welltype"] == "OIL"].dropna(subset=["cum12moil"])
+    assert top_wells["api10"].tolist() == oil.nlargest(5, "cum12moil")["api10"].tolist()
+    assert by_basin["basin"].tolist() == [None, "BARNETT", "PERMIAN"]
+    assert by_basin["cum12moil"].iloc[[0, 2]].tolist() == [1700.0, 1000.0]
+    assert pd.isna(by_basin["cum12moil"].iloc[1])
+
+
+@pytest.mark.parametrize("suffix", ["parquet", "partitioned"])
+def test_run_query_variants(
+    tmp_path: Path, silver_df: pd.DataFrame, engine: str, suffix: str
+) -> None:
+    """Test the queries of the Parquet and partitioned tables run on views."""
+    with Warehouse(str(tmp_path / "silver.db"), engine=engine) as db:
+        db.load(silver_df)
+        expected, actual = [
+            db.run_query(name).sort_values("basin", ignore_index=True)
+            for name in ["sum-prod-by-basin", f"sum-prod-by-basin-{suffix}"]
+        ]
+        years = db.query("SELECT spud_year FROM silver.wells_partitioned")
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert sorted(years["spud_year"].dropna().tolist()) == [2019, 2020, 2021]
+
+
+def test_load_replaces(tmp_path: Path, silver_df: pd.DataFrame, engine: str) -> None:
+    """Test loading again replaces the table, and reopening finds the engine."""
+    path = str(tmp_path / "silver.db")
+    with Warehouse(path, engine=engine) as db:
+        db.load(silver_df)
+        db.load(silver_df.head(2))
+
+    with Warehouse(path) as db:
+        assert db.engine == engine
+        assert db.query("SELECT COUNT(*) AS n FROM silver.wells")["n"].tolist() == [2]
+
+
+def test_load_from_csv(tmp_path: Path, silver_df: pd.DataFrame) -> None:
+    """Test text columns read back from a CSV output are typed when loaded."""
+    text_df = silver_df.astype(str).replace({"<NA>": "", "nan": "", "NaT": ""})
+
+    with Warehouse(str(tmp_path / "silver.db"), engine="sqlite") as db:
+        db.load(text_df)
+        top_wells = db.run_query("top-5-oil-wells")
+
+    assert top_wells["cum12moil"].tolist() == [700.0, 500.0, 300.0, 200.0, 100.0]
+
+
+def test_load_without_silver_columns(tmp_path: Path) -> None:
+    """Test loading data without any silver column raises."""
+    with Warehouse(str(tmp_path / "silver.db"), engine="sqlite") as db:
+        with pytest.raises(ValueError):
+            db.load(pd.DataFrame({"comment": ["x"]}))
+
+
+def test_unknown_engine(tmp_path: Path) -> None:
+    """Test an unknown database engine raises."""
+    with pytest.raises(ValueError):
+        Warehouse(str(tmp_path / "silver.db"), engine="postgres")
+
+
+def test_without_duckdb(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the DuckDB engine requires `duckdb`, which `auto` falls back from."""
+    monkeypatch.setattr(warehouse, "duckdb", None)
+    path = str(tmp_path / "silver.db")
+
+    with pytest.raises(ImportError, match="duckdb"):
+        Warehouse(path, engine="duckdb")
+    with Warehouse(path) as db:
+        assert db.engine == "sqlite"
+
+
+def test_detect_duckdb_without_duckdb(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test `auto` raises on a DuckDB file when `duckdb` isn't installed."""
+    pytest.importorskip("duckdb")
+    path = str(tmp_path / "silver.duckdb")
+    with Warehouse(path, engine="duckdb") as db:
+        db.load(pd.DataFrame({"id": ["id0"]}))
+    monkeypatch.setattr(warehouse, "duckdb", None)
+
+    with pytest.raises(ImportError, match="duckdb"):
+        Warehouse(path)
@@ -0,0 +1,96 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from nlca_pipelines.validation import ValidationCache
+from nlca_pipelines.validation.values import (
+    Basin,
+    Cum12moil,
+    Spuddate,
+)
+
+
+@pytest.mark.parametrize(
+    "validator, raw",
+    [
+        pytest.param(Basin, ["Permian", "permian ", "invalid", "", "Permian"]),
+        pytest.param(Spuddate, ["2023-07-01", "2033-07-01", "", "2023-07-01"]),
+        pytest.param(Cum12moil, ["44697", "", "-1", "44697"]),
+        pytest.param(Basin, ["invalid"], id="single-invalid"),
+    ],
+)
+def test_validate_series_matches_scalar(validator, raw) -> None:
+    """Test the memoized path matches applying the validator per row."""
+    field: str = validator.__name__.lower()
+    s = pd.Series(raw, name=field)
+    expected = s.apply(lambda x: getattr(validator(**{field: x}), field))
+
+    actual = ValidationCache().validate_series(s, validator)
+
+    pd.testing.assert_series_equal(actual, expected)
+
+
+def test_validate_series_missing_values() -> None:
+    """Test missing values are returned as None without validation."""
+    cache = ValidationCache()
+    actual = cache.validate_series(pd.Series(["oil", None]), Basin)
+
+    assert actual.tolist() == [None, None]
+    assert cache.misses == 1
+
+
+def test_distinct_values_validated_once() -> None:
+    """Test each distinct value is validated once, then cached."""
+    cache = ValidationCache()
+    cache.validate_series(pd.Series(["Permian", "Barnett"] * 50), Basin)
+
+    assert cache.stats() == {"hits": 0, "misses": 2, "size": 2, "maxsize": 65_536}
+
+    # a second chunk reuses the cached results
+    actual = cache.validate_series(pd.Series(["Barnett", "Other"]), Basin)
+
+    assert actual.tolist() == ["BARNETT", "OTHER"]
+    assert cache.hits == 1
+    assert cache.misses == 3
+
+
+def test_cache_keyed_on_validator() -> None:
+    """Test the same raw value is cached per validator."""
+    cache = ValidationCache()
+    cache.validate("2023-07-01", Spuddate)
+    cache.validate("2023-07-01", Basin)
+
+    assert cache.misses == 2
+    assert cache.validate("2023-07-01", Spuddate) == datetime(2023, 7, 1)
+
+
+def test_lru_eviction() -> None:
+    """Test the least recently used entry is evicted when full."""
+    cache = ValidationCache(maxsize=2)
+    cache.validate("permian", Basin)
+    cache.validate("barnett", Basin)
+    cache.validate("permian", Basin)
+    cache.validate("other", Basin)
+
+    assert len(cache) == 2
+
+    # "barnett" was least recently used, so it must be validated again
+    cache.validate("barnett", Basin)
+    assert cache.misses == 4
+
+
+def test_clear() -> None:
+    """Test `clear` drops entries and resets the counters."""
+    cache = ValidationCache()
+    cache.validate("permian", Basin)
+    cache.clear()
+
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["misses"] == 0
+
+
+def test_invalid_maxsize() -> None:
+    """Test a cache must hold at least one entry."""
+    with pytest.raises(ValueError):
+        ValidationCache(maxsize=0)
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from nlca_pipelines.validation import SILVER_DTYPES
+from nlca_pipelines.validation.schema import (
+    apply_schema,
+    categorical_dtype,
+    to_silver_dtype,
+)
+
+
+def test_categorical_dtype() -> None:
+    """Test the categories are the sorted canonical values of the domain."""
+    dtype = categorical_dtype("welltype")
+
+    assert dtype.categories.tolist() == ["GAS", "OIL"]
+    assert not dtype.ordered
+
+
+def test_categorical_dtype_unknown() -> None:
+    """Test columns without a domain raise."""
+    with pytest.raises(ValueError):
+        categorical_dtype("api10")
+
+
+@pytest.mark.parametrize(
+    "col, value, expected",
+    [
+        pytest.param("basin", "PERMIAN", "PERMIAN"),
+        pytest.param("basin", "invalid", None),
+        pytest.param("cum12moil", 44697, 44697),
+        pytest.param("spuddate", datetime(2023, 7, 1), pd.Timestamp("2023-07-01")),
+        pytest.param("spuddate", None, None),
+    ],
+)
+def test_to_silver_dtype(col: str, value: object, expected: object) -> None:
+    """Test validated columns are converted to their target dtype."""
+    actual = to_silver_dtype(pd.Series([value, None], name=col, dtype=object))
+
+    assert actual.dtype == SILVER_DTYPES[col]
+    if expected is None:
+        assert pd.isna(actual[0])
+    else:
+        assert actual[0] == expected
+    assert pd.isna(actual[1])
+
+
+def test_apply_schema() -> None:
+    """Test only the columns with a target dtype are converted."""
+    df = pd.DataFrame({"api10": ["1"], "welltype": ["OIL"], "cum12mgas": [1]})
+
+    actual = apply_schema(df)
+
+    assert actual["api10"].dtype == object
+    assert actual["welltype"].dtype == SILVER_DTYPES["welltype"]
+    assert actual["cum12mgas"].dtype == "Float64"
+    assert df["welltype"].dtype == object
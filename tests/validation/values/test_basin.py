@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from nlca_pipelines.validation.values import Basin
@@ -17,3 +18,11 @@ from nlca_pipelines.validation.values import Basin
 def test_basin(basin: str, expected: str) -> None:
     """Test `Basin` validator object."""
     assert Basin(basin=basin).basin == expected
+
+
+def test_basin_series() -> None:
+    """Test `Basin.validate_series` matches the scalar validator."""
+    s = pd.Series(["anadarko", "barnett", "Eagle ford", "OTHER", "invalid", ""])
+    expected = s.apply(lambda x: Basin(basin=x).basin)
+
+    pd.testing.assert_series_equal(Basin.validate_series(s), expected)
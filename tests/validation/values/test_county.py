@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from nlca_pipelines.validation.values import County
@@ -16,3 +17,11 @@ from nlca_pipelines.validation.values import County
 def test_county(county: str, expected: str) -> None:
     """Test `County` validator object."""
     assert County(county=county).county == expected
+
+
+def test_county_series() -> None:
+    """Test `County.validate_series` matches the scalar validator."""
+    s = pd.Series(["pecos ", "Anderson ", "  COOKE ", "invalid", ""])
+    expected = s.apply(lambda x: County(county=x).county)
+
+    pd.testing.assert_series_equal(County.validate_series(s), expected)
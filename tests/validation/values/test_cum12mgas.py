@@ -1,5 +1,6 @@
 from typing import Optional
 
+import pandas as pd
 import pytest
 
 from nlca_pipelines.validation.values import Cum12mgas
@@ -18,3 +19,11 @@ from nlca_pipelines.validation.values import Cum12mgas
 def test_cum12mgas(cum12mgas: str, expected: Optional[int]) -> None:
     """Test `Cum12mgas` validator object."""
     assert Cum12mgas(cum12mgas=cum12mgas).cum12mgas == expected
+
+
+def test_cum12mgas_series() -> None:
+    """Test `Cum12mgas.validate_series` matches the scalar validator."""
+    s = pd.Series(["44697", "-44697", "seventeen", "invalid", ""])
+    expected = s.apply(lambda x: Cum12mgas(cum12mgas=x).cum12mgas)
+
+    pd.testing.assert_series_equal(Cum12mgas.validate_series(s), expected)
@@ -1,5 +1,6 @@
 from typing import Optional
 
+import pandas as pd
 import pytest
 
 from nlca_pipelines.validation.values import Cum12moil
@@ -18,3 +19,11 @@ from nlca_pipelines.validation.values import Cum12moil
 def test_cum12moil(cum12moil: str, expected: Optional[int]) -> None:
     """Test `Cum12moil` validator object."""
     assert Cum12moil(cum12moil=cum12moil).cum12moil == expected
+
+
+def test_cum12moil_series() -> None:
+    """Test `Cum12moil.validate_series` matches the scalar validator."""
+    s = pd.Series(["44697", "-44697", "seventeen", "invalid", ""])
+    expected = s.apply(lambda x: Cum12moil(cum12moil=x).cum12moil)
+
+    pd.testing.assert_series_equal(Cum12moil.validate_series(s), expected)
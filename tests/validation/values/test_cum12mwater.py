@@ -1,5 +1,6 @@
 from typing import Optional
 
+import pandas as pd
 import pytest
 
 from nlca_pipelines.validation.values import Cum12mwater
@@ -18,3 +19,11 @@ from nlca_pipelines.validation.values import Cum12mwater
 def test_cum12mwater(cum12mwater: str, expected: Optional[int]) -> None:
     """Test `Cum12mwater` validator object."""
     assert Cum12mwater(cum12mwater=cum12mwater).cum12mwater == expected
+
+
+def test_cum12mwater_series() -> None:
+    """Test `Cum12mwater.validate_series` matches the scalar validator."""
+    s = pd.Series(["44697", "-44697", "seventeen", "invalid", ""])
+    expected = s.apply(lambda x: Cum12mwater(cum12mwater=x).cum12mwater)
+
+    pd.testing.assert_series_equal(Cum12mwater.validate_series(s), expected)
@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from nlca_pipelines.validation.values import Direction
@@ -17,3 +18,11 @@ from nlca_pipelines.validation.values import Direction
 def test_direction(direction: str, expected: str) -> None:
     """Test `Direction` validator object."""
     assert Direction(direction=direction).direction == expected
+
+
+def test_direction_series() -> None:
+    """Test `Direction.validate_series` matches the scalar validator."""
+    s = pd.Series(["horizontal", "vertical", "Horizontal", "HORIZONTAL", "invalid", ""])
+    expected = s.apply(lambda x: Direction(direction=x).direction)
+
+    pd.testing.assert_series_equal(Direction.validate_series(s), expected)
@@ -0,0 +1,64 @@
+from enum import Enum
+
+import pytest
+
+from nlca_pipelines.validation.values import CATEGORICAL_DOMAINS
+from nlca_pipelines.validation.values._domains import (
+    _REGISTRY,
+    lookup,
+    register_domain,
+)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["basin", "county", "direction", "state", "subbasin", "welltype"],
+)
+def test_categorical_domains_registered(name: str) -> None:
+    """Test every categorical validator registers its domain."""
+    assert name in CATEGORICAL_DOMAINS
+    for raw, canonical in CATEGORICAL_DOMAINS[name].items():
+        assert raw == raw.lower().strip()
+        assert canonical == raw.upper()
+
+
+def test_categorical_domains_read_only() -> None:
+    """Test the registry and its domains cannot be mutated."""
+    with pytest.raises(TypeError):
+        CATEGORICAL_DOMAINS["basin"]["new"] = "NEW"  # type: ignore
+
+    with pytest.raises(TypeError):
+        CATEGORICAL_DOMAINS["new"] = {}  # type: ignore
+
+
+def test_register_domain() -> None:
+    """Test `register_domain` maps lower-case values to upper-case."""
+
+    # pylint: disable=missing-class-docstring
+    class ColorEnum(Enum):
+        DARK_RED = "dark red"
+
+    # pylint: enable=missing-class-docstring
+
+    try:
+        domain = register_domain("color", ColorEnum)
+
+        assert dict(domain) == {"dark red": "DARK RED"}
+        assert CATEGORICAL_DOMAINS["color"] is domain
+    finally:
+        _REGISTRY.pop("color", None)
+
+
+@pytest.mark.parametrize(
+    "v, expected",
+    [
+        pytest.param(" Permian ", "PERMIAN", id="valid"),
+        pytest.param("EAGLE FORD", "EAGLE FORD", id="upper-case-valid"),
+        pytest.param("invalid", None, id="invalid-str"),
+        pytest.param(None, None, id="missing"),
+        pytest.param(7, None, id="non-str"),
+    ],
+)
+def test_lookup(v: object, expected: str) -> None:
+    """Test `lookup` sanitizes a single value."""
+    assert lookup(CATEGORICAL_DOMAINS["basin"], v) == expected
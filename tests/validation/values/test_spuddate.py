@@ -1,5 +1,6 @@
 from datetime import datetime
 
+import pandas as pd
 import pytest
 
 from nlca_pipelines.validation.values import Spuddate
@@ -16,3 +17,11 @@ from nlca_pipelines.validation.values import Spuddate
 def test_spuddate(spuddate: str, expected: str) -> None:
     """Test `Spuddate` validator object."""
     assert Spuddate(spuddate=spuddate).spuddate == expected
+
+
+def test_spuddate_series() -> None:
+    """Test `Spuddate.validate_series` matches the scalar validator."""
+    s = pd.Series(["2023-07-01", "", "2033-01-01", "invalid", "2023-7-1"])
+    expected = s.apply(lambda x: Spuddate(spuddate=x).spuddate)
+
+    pd.testing.assert_series_equal(Spuddate.validate_series(s), expected)
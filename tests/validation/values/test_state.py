@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from nlca_pipelines.validation.values import State
@@ -16,3 +17,11 @@ from nlca_pipelines.validation.values import State
 def test_state(state: str, expected: str) -> None:
     """Test `Subbasin` validator object."""
     assert State(state=state).state == expected
+
+
+def test_state_series() -> None:
+    """Test `State.validate_series` matches the scalar validator."""
+    s = pd.Series(["texas ", "Texas ", "  TEXAS ", "invalid", ""])
+    expected = s.apply(lambda x: State(state=x).state)
+
+    pd.testing.assert_series_equal(State.validate_series(s), expected)
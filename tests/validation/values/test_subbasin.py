@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from nlca_pipelines.validation.values import Subbasin
@@ -18,3 +19,11 @@ from nlca_pipelines.validation.values import Subbasin
 def test_subbasin(subbasin: str, expected: str) -> None:
     """Test `Subbasin` validator object."""
     assert Subbasin(subbasin=subbasin).subbasin == expected
+
+
+def test_subbasin_series() -> None:
+    """Test `Subbasin.validate_series` matches the scalar validator."""
+    s = pd.Series(["midland", " Central eagle ford", "MAVERICK basin ", "invalid", ""])
+    expected = s.apply(lambda x: Subbasin(subbasin=x).subbasin)
+
+    pd.testing.assert_series_equal(Subbasin.validate_series(s), expected)
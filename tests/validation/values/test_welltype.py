@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from nlca_pipelines.validation.values import Welltype
@@ -17,3 +18,11 @@ from nlca_pipelines.validation.values import Welltype
 def test_welltype(welltype: str, expected: str) -> None:
     """Test `Welltype` validator object."""
     assert Welltype(welltype=welltype).welltype == expected
+
+
+def test_welltype_series() -> None:
+    """Test `Welltype.validate_series` matches the scalar validator."""
+    s = pd.Series(["oil", "gas", "Oil ", "OIL", "invalid", ""])
+    expected = s.apply(lambda x: Welltype(welltype=x).welltype)
+
+    pd.testing.assert_series_equal(Welltype.validate_series(s), expected)